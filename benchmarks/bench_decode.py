@@ -0,0 +1,84 @@
+"""
+Compare decoding API responses with aiohttp's json() and the client's decoder.
+
+The legacy path decodes the body to str and parses every field with the
+stdlib; the client parses the bytes with orjson and keeps only the asset
+fields the integration reads. Run from the repository root:
+
+    python -m benchmarks.bench_decode
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from custom_components.axscend.api import _project, json_loads
+
+from .fake_api import make_asset
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _legacy_decode(raw: bytes) -> Any:
+    """Decode a body the way ClientResponse.json() does."""
+    return json.loads(raw.decode("utf-8"))
+
+
+def _decode(raw: bytes) -> Any:
+    """Decode a body the way the client does."""
+    return _project(json_loads(raw))
+
+
+def _payload(assets: int, extra_fields: int) -> bytes:
+    """Return a bulk response of `assets` assets with unused fields added."""
+    page = []
+    for index in range(assets):
+        asset = make_asset(str(index))["asset"]
+        # Fields the API sends that no entity reads
+        asset.update({f"extra_{field}": "x" * 24 for field in range(extra_fields)})
+        page.append(asset)
+    return json.dumps({"assets": page}).encode()
+
+
+def _measure(
+    decode: Callable[[bytes], Any], raw: bytes, number: int
+) -> tuple[float, int, int]:
+    """Return microseconds per decode, peak and retained bytes."""
+    seconds = timeit.timeit(lambda: decode(raw), number=number) / number
+    tracemalloc.start()
+    result = decode(raw)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds * 1e6, peak, retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--assets", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--extra-fields", type=int, default=40)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'assets':>7} {'bytes':>9} {'decoder':>8} {'us/decode':>10} "
+        f"{'peak KiB':>9} {'kept KiB':>9}"
+    )
+    for assets in args.assets:
+        raw = _payload(assets, args.extra_fields)
+        for label, decode in (("legacy", _legacy_decode), ("client", _decode)):
+            micros, peak, retained = _measure(decode, raw, args.number)
+            print(
+                f"{assets:>7} {len(raw):>9} {label:>8} {micros:>10.1f} "
+                f"{peak / 1024:>9.1f} {retained / 1024:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
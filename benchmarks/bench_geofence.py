@@ -0,0 +1,89 @@
+"""
+Measure zone evaluation with the grid index against checking every zone.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_geofence
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+from custom_components.axscend.geofence import Zone, ZoneIndex, haversine_distance
+
+
+def _random_zones(count: int) -> list[Zone]:
+    """Scatter zones of realistic sizes over Great Britain."""
+    return [
+        Zone.create(
+            f"zone.{index}",
+            str(index),
+            random.uniform(50.0, 58.0),
+            random.uniform(-6.0, 2.0),
+            random.uniform(50, 2000),
+        )
+        for index in range(count)
+    ]
+
+
+def _brute_force(zones: list[Zone], points: list[tuple[float, float]]) -> int:
+    """Count zone memberships checking every zone of every point."""
+    return sum(
+        haversine_distance(latitude, longitude, zone.latitude, zone.longitude)
+        <= zone.radius
+        for latitude, longitude in points
+        for zone in zones
+    )
+
+
+def _indexed(index: ZoneIndex, points: list[tuple[float, float]]) -> int:
+    """Count zone memberships checking only the candidates of the grid index."""
+    inside = 0
+    for latitude, longitude in points:
+        lat_rad = math.radians(latitude)
+        lon_rad = math.radians(longitude)
+        cos_lat = math.cos(lat_rad)
+        inside += sum(
+            zone.distance(lat_rad, lon_rad, cos_lat) <= zone.radius
+            for zone in index.candidates(latitude, longitude)
+        )
+    return inside
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, nargs="+", default=[10, 1000, 5000])
+    parser.add_argument("--assets", type=int, default=1000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    points = [
+        (random.uniform(50.0, 58.0), random.uniform(-6.0, 2.0))
+        for _ in range(args.assets)
+    ]
+    print(f"{'zones':>6} {'brute force':>12} {'indexed':>10} {'build':>10}")
+    for count in args.zones:
+        zones = _random_zones(count)
+        start = time.perf_counter()
+        expected = _brute_force(zones, points)
+        brute = time.perf_counter() - start
+        start = time.perf_counter()
+        index = ZoneIndex(zones)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        found = _indexed(index, points)
+        indexed = time.perf_counter() - start
+        assert found == expected  # noqa: S101
+        print(
+            f"{count:>6} {brute * 1e3:>10.1f}ms {indexed * 1e3:>8.1f}ms"
+            f" {build * 1e3:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
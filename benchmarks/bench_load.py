@@ -0,0 +1,254 @@
+"""
+Load test the integration at 1, 100 and 1000 assets against the fake API.
+
+Every asset is added through the config flow of a minimal Home Assistant, so
+the API client, the coordinators and the sensor, binary sensor and device
+tracker platforms all run as they would in production. Each cycle moves every
+asset (or, with --idle, leaves them unchanged) and refreshes every coordinator
+at once.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_load
+    python -m benchmarks.bench_load --assets 100 --latency 0.2 --error-rate 0.05
+
+CPU time includes the fake API, which runs in the same process, so compare
+runs with the same options rather than reading the figures as absolutes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import shutil
+import socket
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant import auth, loader
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.const import CONF_API_TOKEN, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry,
+    category_registry,
+    device_registry,
+    entity_registry,
+    floor_registry,
+    frame,
+    label_registry,
+    translation,
+)
+from homeassistant.setup import async_setup_component
+
+from custom_components.axscend import api
+from custom_components.axscend.const import CONF_ASSET_ID, DOMAIN
+from custom_components.axscend.session import async_get_session_pool
+
+from .fake_api import FakeAxscendApi
+
+if TYPE_CHECKING:
+    from custom_components.axscend.coordinator import AxscendDataUpdateCoordinator
+
+API_TOKEN = "bench"  # noqa: S105
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile of samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _rss() -> int:
+    """Return the resident set size of this process in bytes."""
+    with Path("/proc/self/statm").open() as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _free_port() -> int:
+    """Return a free localhost port for the HTTP server."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_config_dir() -> str:
+    """Return a temporary configuration directory with the integration."""
+    config_dir = tempfile.mkdtemp(prefix="axscend-bench-")
+    Path(config_dir, "custom_components").symlink_to(REPOSITORY / "custom_components")
+    return config_dir
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a Home Assistant with only what the integration needs."""
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    hass.config.latitude = 51.5007
+    hass.config.longitude = -0.1246
+    await hass.config.async_set_time_zone("UTC")
+    frame.async_setup(hass)
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        category_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+        floor_registry.async_load(hass),
+        label_registry.async_load(hass),
+    )
+    hass.auth = await auth.auth_manager_from_config(hass, [], [])
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await async_setup_component(hass, "homeassistant", {})
+    # The push webhook depends on the HTTP server
+    await async_setup_component(
+        hass,
+        "http",
+        {"http": {"server_host": "127.0.0.1", "server_port": _free_port()}},
+    )
+    await hass.async_start()
+    return hass
+
+
+async def _async_run(
+    fake: FakeAxscendApi, assets: int, cycles: int, *, idle: bool
+) -> dict[str, float]:
+    """Add `assets` entries, refresh them `cycles` times and return the figures."""
+    config_dir = make_config_dir()
+    hass = await async_start_hass(config_dir)
+    # Lift the per-token rate limit; the fake API has no quota to protect
+    limiter = async_get_session_pool(hass).async_get_rate_limiter(API_TOKEN)
+    limiter.rate = limiter.burst = 1_000_000
+
+    state_writes = 0
+
+    @callback
+    def _async_count_write(_event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_write)
+
+    try:
+        gc.collect()
+        rss_before = _rss()
+        start = time.perf_counter()
+        for asset_id in range(assets):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "user"},
+                data={CONF_API_TOKEN: API_TOKEN, CONF_ASSET_ID: str(asset_id)},
+            )
+            if result["type"] != "create_entry":
+                msg = f"Adding asset {asset_id} failed: {result}"
+                raise RuntimeError(msg)
+        await hass.async_block_till_done()
+        setup_time = time.perf_counter() - start
+        gc.collect()
+        rss_per_asset = (_rss() - rss_before) / assets
+
+        coordinators = [
+            entry.runtime_data.coordinator
+            for entry in hass.config_entries.async_entries(DOMAIN)
+        ]
+        latencies: list[float] = []
+
+        async def refresh(coordinator: AxscendDataUpdateCoordinator) -> None:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        fake.reset()
+        state_writes = 0
+        cpu_start = time.process_time()
+        for _ in range(cycles):
+            if not idle:
+                fake.revision += 1
+                fake.moves += 1
+            # Polls are an update interval apart, longer than the cache TTL
+            for coordinator in coordinators:
+                coordinator.config_entry.runtime_data.client.single_flight.clear()
+            await asyncio.gather(*(refresh(c) for c in coordinators))
+            await hass.async_block_till_done()
+        cpu = time.process_time() - cpu_start
+        refreshes = assets * cycles
+        return {
+            "setup": setup_time,
+            "rss": rss_per_asset,
+            "p50": statistics.median(latencies),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "writes": state_writes / cycles,
+            "cpu": cpu / refreshes * 1000,
+            "requests": fake.requests / refreshes,
+        }
+    finally:
+        await hass.async_stop()
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--assets", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every request"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="share of requests that fail with a 500",
+    )
+    parser.add_argument(
+        "--payload-size",
+        type=int,
+        default=0,
+        help="bytes of unused fields added to every asset",
+    )
+    parser.add_argument(
+        "--idle",
+        action="store_true",
+        help="leave the assets unchanged, so every poll is a 304",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    fake = FakeAxscendApi(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+    )
+    await fake.start()
+    api.API_BASE_URL = fake.base_url
+    try:
+        print(
+            f"{'assets':>7} {'setup s':>8} {'KiB/asset':>10} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'p99 ms':>8} {'writes/cycle':>13} "
+            f"{'CPU ms/refresh':>15} {'req/refresh':>12}"
+        )
+        for assets in args.assets:
+            fake.revision = fake.moves = 0
+            result = await _async_run(fake, assets, args.cycles, idle=args.idle)
+            print(
+                f"{assets:>7} {result['setup']:>8.2f} {result['rss'] / 1024:>10.1f} "
+                f"{result['p50']:>8.2f} {result['p95']:>8.2f} {result['p99']:>8.2f} "
+                f"{result['writes']:>13.1f} {result['cpu']:>15.3f} "
+                f"{result['requests']:>12.2f}"
+            )
+    finally:
+        await fake.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
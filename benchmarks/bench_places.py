@@ -0,0 +1,77 @@
+"""
+Measure nearest place lookups against a memory-mapped index.
+
+Random places are indexed into a temporary file, which is then mapped and
+searched from random positions, first uncached and then again for the most
+recent positions, which the cache of rounded positions answers. Heap growth
+while mapping shows the places are not copied. Run from the repository root:
+
+    python -m benchmarks.bench_places
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from custom_components.axscend.const import PLACES_CACHE_SIZE
+from custom_components.axscend.places import PlaceIndex, build_index
+
+
+def _places(count: int, rng: random.Random) -> list[tuple[str, float, float]]:
+    """Return places spread over land-like latitudes."""
+    return [
+        (f"Place {index}", rng.uniform(-60, 70), rng.uniform(-180, 180))
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--places", type=int, nargs="+", default=[10000, 1000000])
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'places':>8} {'index MiB':>10} {'map KiB':>8} "
+        f"{'us/lookup':>10} {'us/cached':>10} {'found':>6}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.places:
+            path = Path(directory) / f"places-{count}.idx"
+            path.write_bytes(build_index(_places(count, rng)))
+
+            tracemalloc.start()
+            index = PlaceIndex(path)
+            mapped, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            positions = [
+                (rng.uniform(-60, 70), rng.uniform(-180, 180))
+                for _ in range(args.lookups)
+            ]
+            start = time.perf_counter()
+            found = sum(index.nearest(*position) is not None for position in positions)
+            uncached = (time.perf_counter() - start) / args.lookups
+            # Positions seen last, as many as the cache holds, are answered again
+            recent = positions[-PLACES_CACHE_SIZE:]
+            start = time.perf_counter()
+            for position in recent:
+                index.nearest(*position)
+            cached = (time.perf_counter() - start) / len(recent)
+
+            print(
+                f"{count:>8} {path.stat().st_size / 2**20:>10.1f} "
+                f"{mapped / 1024:>8.1f} {uncached * 1e6:>10.1f} "
+                f"{cached * 1e6:>10.2f} {found / args.lookups:>6.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare per-entry client sessions with the shared session pool.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_session_pool
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import aiohttp
+
+from custom_components.axscend import api
+from custom_components.axscend.api import AxscendApiClient
+from custom_components.axscend.session import create_client_session
+
+from .fake_api import FakeAxscendApi
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile of samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _legacy_session() -> aiohttp.ClientSession:
+    """Build a session the way every entry used to."""
+    connector = aiohttp.TCPConnector(resolver=aiohttp.resolver.ThreadedResolver())
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def _run(
+    fake: FakeAxscendApi, entries: int, cycles: int, *, shared: bool
+) -> tuple[int, list[float]]:
+    """Poll `entries` assets for `cycles` cycles and return handshakes and latencies."""
+    fake.reset()
+    if shared:
+        session = create_client_session()
+        sessions = [session] * entries
+    else:
+        sessions = [_legacy_session() for _ in range(entries)]
+    clients = [
+        AxscendApiClient(api_token="bench", session=session)  # noqa: S106
+        for session in sessions
+    ]
+    latencies: list[float] = []
+
+    async def poll(client: AxscendApiClient, asset_id: str) -> None:
+        # Entries are not perfectly aligned in practice
+        await asyncio.sleep(random.uniform(0, 0.05))
+        start = time.perf_counter()
+        await client.async_get_asset(asset_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    try:
+        for _ in range(cycles):
+            await asyncio.gather(
+                *(poll(client, str(i)) for i, client in enumerate(clients))
+            )
+    finally:
+        for session in set(sessions):
+            await session.close()
+    return fake.connections, latencies
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument(
+        "--connect-cost",
+        type=float,
+        default=0.03,
+        help="seconds added to each new connection to emulate TCP+TLS setup",
+    )
+    args = parser.parse_args()
+
+    fake = FakeAxscendApi(connect_cost=args.connect_cost)
+    await fake.start()
+    api.API_BASE_URL = fake.base_url
+    try:
+        print(
+            f"{'entries':>8} {'mode':>8} {'handshakes':>11} {'p50 ms':>8} {'p99 ms':>8}"
+        )
+        for entries in args.entries:
+            for shared in (False, True):
+                handshakes, latencies = await _run(
+                    fake, entries, args.cycles, shared=shared
+                )
+                print(
+                    f"{entries:>8} {'shared' if shared else 'legacy':>8} "
+                    f"{handshakes:>11} {statistics.median(latencies):>8.2f} "
+                    f"{_percentile(latencies, 99):>8.2f}"
+                )
+    finally:
+        await fake.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
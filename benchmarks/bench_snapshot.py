@@ -0,0 +1,118 @@
+"""
+Measure the cost of reading sensor values before and after AssetSnapshot.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_snapshot
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.axscend.data import AssetSnapshot
+from custom_components.axscend.sensor import ENTITY_DESCRIPTIONS, AxscendAssetSensor
+
+from .fake_api import make_asset
+
+
+def _legacy_timestamp(timestamp_str: str | None) -> datetime | None:
+    """Parse a timestamp the way the sensor used to on every read."""
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.strptime(str(timestamp_str), "%Y-%m-%d %H:%M:%S").replace(
+            tzinfo=UTC
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+def _legacy_battery(batt: str | None) -> int | float | None:
+    """Parse the battery the way the sensor used to on every read."""
+    if batt is None:
+        return None
+    try:
+        return int(batt)
+    except (TypeError, ValueError):
+        try:
+            return float(batt)
+        except (TypeError, ValueError):
+            return None
+
+
+def _legacy_native_value(data: dict[str, Any], key: str) -> Any:
+    """Reproduce the former AxscendAssetSensor.native_value."""
+    asset_data = data.get("asset", {})
+    extractors = {
+        "asset_name": lambda: asset_data.get("name") or None,
+        "latitude": lambda: (
+            str(asset_data.get("gps_latitude"))
+            if asset_data.get("gps_latitude") is not None
+            else None
+        ),
+        "longitude": lambda: (
+            str(asset_data.get("gps_longitude"))
+            if asset_data.get("gps_longitude") is not None
+            else None
+        ),
+        "last_movement": lambda: _legacy_timestamp(
+            asset_data.get("last_movement_timestamp")
+        ),
+        "last_position": lambda: _legacy_timestamp(
+            asset_data.get("last_position_timestamp")
+        ),
+        "battery": lambda: _legacy_battery(asset_data.get("batt_percent")),
+    }
+    return extractors.get(key, lambda: None)()
+
+
+def _make_sensors(snapshot: AssetSnapshot) -> list[AxscendAssetSensor]:
+    """Build the sensors of one asset around a stub coordinator."""
+    coordinator = SimpleNamespace(
+        data=snapshot,
+        config_entry=SimpleNamespace(
+            entry_id="bench",
+            domain="axscend",
+            runtime_data=SimpleNamespace(asset_id=snapshot.asset_id),
+        ),
+    )
+    return [
+        AxscendAssetSensor(coordinator=coordinator, entity_description=description)
+        for description in ENTITY_DESCRIPTIONS
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    payload = make_asset("1")
+    snapshot = AssetSnapshot.from_api("1", payload)
+    sensors = _make_sensors(snapshot)
+    keys = [description.key for description in ENTITY_DESCRIPTIONS]
+
+    legacy = timeit.timeit(
+        lambda: [_legacy_native_value(payload, key) for key in keys],
+        number=args.number,
+    )
+    current = timeit.timeit(
+        lambda: [sensor.native_value for sensor in sensors], number=args.number
+    )
+    parse = timeit.timeit(
+        lambda: AssetSnapshot.from_api("1", payload), number=args.number
+    )
+    reads = args.number * len(keys)
+    print(f"legacy property read:   {legacy / reads * 1e9:8.0f} ns")
+    print(f"snapshot property read: {current / reads * 1e9:8.0f} ns")
+    print(f"snapshot parse (once per poll): {parse / args.number * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Measure how long the integration takes to import and to set up, with a budget.
+
+Imports are timed in fresh interpreters that have already imported what Home
+Assistant loads before any integration, so only the integration's own modules
+and their extra dependencies count. Setup is timed in a minimal Home Assistant
+against the fake API, for the first entry (which loads the platforms) and for
+the entries after it.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup
+
+The command exits with status 1 when a median exceeds its budget, so it can
+guard releases against load time creeping up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import compileall
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from homeassistant.const import CONF_API_TOKEN
+
+from custom_components.axscend import api
+from custom_components.axscend.const import CONF_ASSET_ID, DOMAIN
+
+from .bench_load import API_TOKEN, REPOSITORY, async_start_hass, make_config_dir
+from .fake_api import FakeAxscendApi
+
+# Loaded by Home Assistant before it imports the integration and its platforms
+PRELOADED = (
+    "aiohttp",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.device_tracker",
+    "homeassistant.components.sensor",
+    "homeassistant.components.webhook",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+MODULES = (
+    "custom_components.axscend",
+    "custom_components.axscend.config_flow",
+    "custom_components.axscend.sensor",
+    "custom_components.axscend.binary_sensor",
+    "custom_components.axscend.device_tracker",
+)
+
+_IMPORT_SCRIPT = """
+import importlib, json, sys, time
+for name in sys.argv[1].split(","):
+    importlib.import_module(name)
+timings = {}
+for name in sys.argv[2].split(","):
+    start = time.perf_counter()
+    importlib.import_module(name)
+    timings[name] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+def _time_imports(runs: int) -> dict[str, float]:
+    """Return the median import time of every module in milliseconds."""
+    # Home Assistant imports from bytecode after the first start; time that
+    compileall.compile_dir(REPOSITORY / "custom_components", quiet=1)
+    samples: dict[str, list[float]] = {name: [] for name in MODULES}
+    for _ in range(runs):
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                _IMPORT_SCRIPT,
+                ",".join(PRELOADED),
+                ",".join(MODULES),
+            ],
+            capture_output=True,
+            check=True,
+            cwd=REPOSITORY,
+            text=True,
+        ).stdout
+        for name, elapsed in json.loads(output).items():
+            samples[name].append(elapsed)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+async def _async_time_setup(entries: int) -> tuple[float, float | None]:
+    """Return the setup time of the first entry and the median of the others."""
+    fake = FakeAxscendApi()
+    await fake.start()
+    api.API_BASE_URL = fake.base_url
+    config_dir = make_config_dir()
+    hass = await async_start_hass(config_dir)
+    timings: list[float] = []
+    try:
+        for asset_id in range(entries):
+            start = time.perf_counter()
+            await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "user"},
+                data={CONF_API_TOKEN: API_TOKEN, CONF_ASSET_ID: str(asset_id)},
+            )
+            await hass.async_block_till_done()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await hass.async_stop()
+        await fake.stop()
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return timings[0], statistics.median(timings[1:]) if entries > 1 else None
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters")
+    parser.add_argument("--entries", type=int, default=10)
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=40,
+        help="milliseconds the integration and its platforms may take to import",
+    )
+    parser.add_argument(
+        "--setup-budget",
+        type=float,
+        default=80,
+        help="milliseconds the first entry may take to set up",
+    )
+    args = parser.parse_args()
+
+    imports = _time_imports(args.runs)
+    for name, elapsed in imports.items():
+        print(f"import {name:<45} {elapsed:>8.2f} ms")
+    import_total = sum(imports.values())
+    print(f"import {'total':<45} {import_total:>8.2f} ms")
+
+    first, others = asyncio.run(_async_time_setup(args.entries))
+    print(f"setup  {'first entry':<45} {first:>8.2f} ms")
+    if others is not None:
+        print(f"setup  {'each further entry (median)':<45} {others:>8.2f} ms")
+
+    over = []
+    if import_total > args.import_budget:
+        over.append(f"import {import_total:.0f} ms > {args.import_budget:.0f} ms")
+    if first > args.setup_budget:
+        over.append(f"setup {first:.0f} ms > {args.setup_budget:.0f} ms")
+    if over:
+        print("Over budget: " + ", ".join(over))
+        sys.exit(1)
+    print("Within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Local stand-in for the Axscend API used by the benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from asyncio import Transport
+
+
+def make_asset(asset_id: str) -> dict[str, Any]:
+    """Return a realistic asset payload."""
+    return {
+        "asset": {
+            "id": asset_id,
+            "name": f"Tracker {asset_id}",
+            "gps_latitude": 51.5007,
+            "gps_longitude": -0.1246,
+            "last_movement_timestamp": "2026-01-29 21:23:24",
+            "last_position_timestamp": "2026-01-29 21:25:02",
+            "batt_percent": "87",
+        }
+    }
+
+
+_EPOCH = datetime(2026, 1, 29, 21, 25, 2, tzinfo=UTC)
+
+
+class FakeAxscendApi:
+    """Minimal fake of api.axscend.com that counts connections and requests."""
+
+    def __init__(
+        self,
+        *,
+        connect_cost: float = 0.0,
+        bulk: bool = True,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        payload_size: int = 0,
+    ) -> None:
+        """
+        Initialize the fake.
+
+        `connect_cost` is slept on the first request of every new connection to
+        emulate the round trips of a TCP and TLS handshake to a remote host.
+        With `bulk` disabled the listing endpoint answers 404, like an API
+        without bulk support. `latency` is slept on every request, a share of
+        `error_rate` requests fail with a 500, and `payload_size` pads every
+        asset with that many bytes of fields the integration does not read.
+        """
+        self.connect_cost = connect_cost
+        self.bulk = bulk
+        self.latency = latency
+        self.error_rate = error_rate
+        self.payload_size = payload_size
+        # Assets "0" to "assets - 1" are listed for the token
+        self.assets = 3
+        # Seconds between the readings the history endpoint reports
+        self.history_interval = 60
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+        # Bump to change every asset's ETag
+        self.revision = 0
+        # Bump, together with the revision, to move every asset
+        self.moves = 0
+        # Set to answer every request with an error, like an outage
+        self.error_status: int | None = None
+        self.retry_after: str | None = None
+        self._seen: set[Transport] = set()
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _count(self, request: web.Request) -> web.Response | None:
+        """Count the request and its connection; return an outage response."""
+        self.requests += 1
+        if (transport := request.transport) is not None and transport not in self._seen:
+            self._seen.add(transport)
+            self.connections += 1
+            if self.connect_cost:
+                await asyncio.sleep(self.connect_cost)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_status is not None:
+            headers = {"Retry-After": self.retry_after} if self.retry_after else None
+            return web.Response(status=self.error_status, headers=headers)
+        if self.error_rate and random.random() < self.error_rate:
+            self.errors += 1
+            return web.Response(status=500)
+        return None
+
+    def _asset(self, asset_id: str) -> dict[str, Any]:
+        """Return the asset after its moves."""
+        asset = make_asset(asset_id)["asset"]
+        if self.moves:
+            # Walk north-east by about 10 m and report a newer fix per move
+            asset["gps_latitude"] += self.moves * 1e-4
+            asset["gps_longitude"] += self.moves * 1e-4
+            asset["last_position_timestamp"] = (
+                _EPOCH + timedelta(minutes=self.moves)
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            asset["last_movement_timestamp"] = asset["last_position_timestamp"]
+        if self.payload_size:
+            asset["notes"] = "x" * self.payload_size
+        return asset
+
+    async def _handle_asset(self, request: web.Request) -> web.Response:
+        """Serve a single asset, honouring If-None-Match."""
+        if (error := await self._count(request)) is not None:
+            return error
+        asset_id = request.match_info["asset_id"]
+        etag = f'"{asset_id}-{self.revision}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            {"asset": self._asset(asset_id)}, headers={"ETag": etag}
+        )
+
+    async def _handle_assets(self, request: web.Request) -> web.Response:
+        """Serve a page of assets from the bulk endpoint."""
+        if (error := await self._count(request)) is not None:
+            return error
+        if not self.bulk:
+            raise web.HTTPNotFound
+        if "ids" not in request.query:
+            # Listing every asset of the token, one page at a time
+            page = int(request.query.get("page", 1))
+            per_page = int(request.query.get("per_page", 100))
+            start = (page - 1) * per_page
+            ids = [str(i) for i in range(start, min(start + per_page, self.assets))]
+            return web.json_response(
+                {
+                    "assets": [self._asset(asset_id) for asset_id in ids],
+                    "total": self.assets,
+                }
+            )
+        ids = [i for i in request.query.get("ids", "").split(",") if i]
+        return web.json_response(
+            {"assets": [self._asset(asset_id) for asset_id in ids]}
+        )
+
+    async def _handle_history(self, request: web.Request) -> web.Response:
+        """Serve a page of an asset's readings, one every history interval."""
+        if (error := await self._count(request)) is not None:
+            return error
+        start = datetime.fromisoformat(request.query["from"]).replace(tzinfo=UTC)
+        end = datetime.fromisoformat(request.query["to"]).replace(tzinfo=UTC)
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query.get("per_page", 1000))
+        first = (page - 1) * per_page
+        count = int((end - start).total_seconds() // self.history_interval) + 1
+        readings = []
+        for index in range(first, min(first + per_page, count)):
+            timestamp = (
+                start + timedelta(seconds=index * self.history_interval)
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            readings.append(
+                {
+                    # Walk north by about 1 m a reading while the battery drains
+                    "gps_latitude": 51.5007 + index * 1e-5,
+                    "gps_longitude": -0.1246,
+                    "last_position_timestamp": timestamp,
+                    "batt_percent": str(max(100 - index // 100, 0)),
+                }
+            )
+        # Pages carry validators like every other response of the API
+        return web.json_response(
+            {"history": readings},
+            headers={"ETag": f'"history-{page}-{self.revision}"'},
+        )
+
+    async def start(self) -> None:
+        """Start listening on an ephemeral localhost port."""
+        app = web.Application()
+        app.router.add_get("/v3/assets", self._handle_assets)
+        app.router.add_get("/v3/assets/{asset_id}", self._handle_asset)
+        app.router.add_get("/v3/assets/{asset_id}/history", self._handle_history)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}/v3"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+        self._seen.clear()
@@ -10,25 +10,57 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-import aiohttp
-from homeassistant.const import CONF_API_TOKEN, Platform
+from homeassistant.const import CONF_API_TOKEN, CONF_WEBHOOK_ID, Platform
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import AxscendApiClient
-from .const import CONF_ASSET_ID, DOMAIN, LOGGER
+from .const import (
+    CONF_ASSET_ID,
+    CONF_FLEET_MODE,
+    CONF_HISTORY_DAYS,
+    CONF_PUSH,
+    CONF_WEBHOOK_SECRET,
+    CONF_ZONES,
+    DEFAULT_HISTORY_DAYS,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
 from .coordinator import AxscendDataUpdateCoordinator
 from .data import AxscendData
+from .export import AxscendTrackView
+from .fleet import async_join_fleet, async_leave_fleet
+from .geofence import async_get_geofence, parse_custom_zones
+from .history import TrackHistory
+from .polling import PollingOptions
+from .push import async_register_push
+from .services import async_setup_services
+from .session import async_get_session_pool
+from .store import async_get_snapshot_store
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import AxscendConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
+    Platform.DEVICE_TRACKER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the services and track export, which outlive any one entry."""
+    async_setup_services(hass)
+    hass.http.register_view(AxscendTrackView())
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -36,39 +68,110 @@ async def async_setup_entry(
     entry: AxscendConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    fleet_mode = entry.options.get(CONF_FLEET_MODE, False)
     coordinator = AxscendDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
+        config_entry=entry,
         name=DOMAIN,
-        update_interval=timedelta(minutes=5),
+        # In fleet mode the fleet coordinator polls on behalf of every entry
+        update_interval=None if fleet_mode else DEFAULT_UPDATE_INTERVAL,
+        # Unchanged (for example 304 Not Modified) responses do not wake entities
+        always_update=False,
+    )
+    history = TrackHistory(
+        hass,
+        entry.entry_id,
+        timedelta(days=entry.options.get(CONF_HISTORY_DAYS, DEFAULT_HISTORY_DAYS)),
     )
-    # Create a dedicated session using ThreadedResolver to avoid aiodns issues
-    connector = aiohttp.TCPConnector(resolver=aiohttp.resolver.ThreadedResolver())
-    # Create a dedicated ClientSession instead of using Home Assistant helper
-    # to avoid passing connector twice into aiohttp.ClientSession
-    session = aiohttp.ClientSession(connector=connector)
+    await history.async_load()
+
+    # Share one keep-alive session across all entries instead of using the
+    # Home Assistant helper, which would pass the connector twice
+    pool = async_get_session_pool(hass)
+    session = pool.async_acquire()
+    asset_id = entry.data[CONF_ASSET_ID]
+    polling = PollingOptions.from_options(entry.options)
+    integration = async_get_loaded_integration(hass, entry.domain)
+    client = AxscendApiClient(
+        api_token=entry.data[CONF_API_TOKEN],
+        session=session,
+        breakers=pool.breakers,
+        rate_limiter=pool.async_get_rate_limiter(entry.data[CONF_API_TOKEN]),
+        version=str(integration.version),
+        single_flight=pool.async_get_single_flight(entry.data[CONF_API_TOKEN]),
+    )
+    fleet = None
+    if fleet_mode:
+        fleet = async_join_fleet(hass, client, asset_id, polling)
 
     entry.runtime_data = AxscendData(
-        client=AxscendApiClient(
-            api_token=entry.data[CONF_API_TOKEN],
-            session=session,
-        ),
-        asset_id=entry.data[CONF_ASSET_ID],
-        integration=async_get_loaded_integration(hass, entry.domain),
+        client=client,
+        asset_id=asset_id,
+        polling=polling,
+        history=history,
+        integration=integration,
         coordinator=coordinator,
-        session=session,
+        fleet=fleet,
+    )
+
+    # Registered before the first refresh so its geofence pass covers the asset
+    unregister_geofence = async_get_geofence(hass).async_register(
+        asset_id,
+        parse_custom_zones(entry.options.get(CONF_ZONES, "")),
+        coordinator.async_handle_presence,
     )
 
+    snapshot_store = await async_get_snapshot_store(hass)
+    # Start from the last known snapshot and refresh in the background, so
+    # startup does not wait for the API
+    stored = snapshot_store.async_get(entry.entry_id)
+    coordinator.motion = snapshot_store.async_get_motion(entry.entry_id)
+
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     try:
-        await coordinator.async_config_entry_first_refresh()
+        if stored is None:
+            await coordinator.async_config_entry_first_refresh()
+        else:
+            coordinator.async_seed(*stored)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception:
-        await session.close()
+        unregister_geofence()
+        if fleet is not None:
+            await async_leave_fleet(hass, fleet, asset_id)
+        pool.async_release()
         raise
 
+    @callback
+    def _async_record_snapshot() -> None:
+        history.async_add_snapshot(coordinator.data)
+        snapshot_store.async_set(entry.entry_id, coordinator.data, coordinator.motion)
+
+    entry.async_on_unload(unregister_geofence)
+    entry.async_on_unload(coordinator.async_add_listener(_async_record_snapshot))
+    _async_record_snapshot()
+    if fleet is not None:
+        entry.async_on_unload(
+            fleet.async_add_listener(coordinator.async_handle_fleet_update)
+        )
+
+    if entry.options.get(CONF_PUSH, False):
+        entry.async_on_unload(
+            async_register_push(
+                hass,
+                entry,
+                entry.options[CONF_WEBHOOK_ID],
+                entry.options[CONF_WEBHOOK_SECRET],
+            )
+        )
+
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    if stored is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {asset_id}"
+        )
+
     return True
 
 
@@ -79,14 +182,22 @@ async def async_unload_entry(
     """Handle removal of an entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        # Close our dedicated aiohttp session
-        try:
-            await entry.runtime_data.session.close()
-        except aiohttp.ClientError:
-            LOGGER.exception("Error closing client session for %s", entry.entry_id)
+        if (fleet := entry.runtime_data.fleet) is not None:
+            await async_leave_fleet(hass, fleet, entry.runtime_data.asset_id)
+        async_get_session_pool(hass).async_release()
+        await entry.runtime_data.history.async_save()
     return unloaded
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: AxscendConfigEntry,
+) -> None:
+    """Delete the stored track history and snapshot of a removed entry."""
+    await TrackHistory(hass, entry.entry_id, timedelta(0)).async_remove()
+    (await async_get_snapshot_store(hass)).async_remove(entry.entry_id)
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: AxscendConfigEntry,
@@ -3,12 +3,63 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import random
 import socket
-from typing import Any
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
 
 import aiohttp
+from aiohttp import hdrs
+from yarl import URL
 
-from .const import API_BASE_URL, API_TIMEOUT, API_USER_AGENT
+from .const import (
+    API_ASSET_FIELDS,
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_BASE_URL,
+    API_CONNECT_TIMEOUT,
+    API_MAX_ATTEMPTS,
+    API_MAX_RESPONSE_SIZE,
+    API_MAX_RETRY_AFTER,
+    API_READ_CHUNK_SIZE,
+    API_READ_TIMEOUT,
+    API_TIMEOUT,
+    API_USER_AGENT,
+    BACKFILL_MAX_PAGES,
+    BACKFILL_PAGE_SIZE,
+    FLEET_MAX_CONCURRENCY,
+    FLEET_MAX_LIST_PAGES,
+    FLEET_PAGE_SIZE,
+    LOGGER,
+)
+from .metrics import ApiMetrics
+from .profiler import profile_stage
+from .singleflight import SingleFlight
+
+try:
+    # Several times faster than json and parses bytes without decoding to str;
+    # installed with Home Assistant
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from .breaker import CircuitBreaker, CircuitBreakers
+    from .ratelimit import TokenBucket
+
+# Separate budgets for connecting and for each read, within a total per attempt
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=API_TIMEOUT, sock_connect=API_CONNECT_TIMEOUT, sock_read=API_READ_TIMEOUT
+)
 
 
 class AxscendApiClientError(Exception):
@@ -20,6 +71,23 @@ class AxscendApiClientCommunicationError(
 ):
     """Exception to indicate a communication error."""
 
+    def __init__(self, *args: object, retry_after: float | None = None) -> None:
+        """Initialize with the seconds the server asked to wait, if any."""
+        super().__init__(*args)
+        self.retry_after = retry_after
+
+
+class AxscendApiClientRateLimitError(
+    AxscendApiClientCommunicationError,
+):
+    """Exception to indicate that the API token sent too many requests."""
+
+
+class AxscendApiClientCircuitOpenError(
+    AxscendApiClientCommunicationError,
+):
+    """Exception to indicate that requests are held back while the API is down."""
+
 
 class AxscendApiClientAuthenticationError(
     AxscendApiClientError,
@@ -27,27 +95,187 @@ class AxscendApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class AxscendApiClientNotFoundError(
+    AxscendApiClientError,
+):
+    """Exception to indicate that the requested resource does not exist."""
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    """Decoded body of a GET response with its cache validators."""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for this response."""
+        headers = {}
+        if self.etag:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+        if self.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+        return headers
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
+    if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+        msg = f"Rate limited - {response.url}"
+        raise AxscendApiClientRateLimitError(
+            msg,
+            retry_after=_parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
+        )
+    if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        msg = f"Server error {response.status} - {response.url}"
+        raise AxscendApiClientCommunicationError(
+            msg,
+            retry_after=_parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
+        )
     if response.status in (401, 403):
         msg = "Invalid credentials"
         raise AxscendApiClientAuthenticationError(
             msg,
         )
-    response.raise_for_status()
+    if response.status == 404:  # noqa: PLR2004
+        msg = f"Not found - {response.url}"
+        raise AxscendApiClientNotFoundError(
+            msg,
+        )
+    if response.status >= HTTPStatus.BAD_REQUEST:
+        msg = f"Request refused with {response.status} - {response.url}"
+        raise AxscendApiClientError(msg)
+    if response.status == HTTPStatus.NOT_MODIFIED:
+        # Answers to the validators of a cached response never get here
+        msg = f"Not modified, but no response is cached - {response.url}"
+        raise AxscendApiClientError(msg)
+
+
+async def _read_body(response: aiohttp.ClientResponse) -> bytearray:
+    """Read a response body, refusing bodies over the maximum size."""
+    if (response.content_length or 0) > API_MAX_RESPONSE_SIZE:
+        response.close()
+        msg = f"Response of {response.content_length} bytes too large - {response.url}"
+        raise AxscendApiClientError(msg)
+    # Counted while reading, compressed or chunked bodies have no usable length
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(API_READ_CHUNK_SIZE):
+        body += chunk
+        if len(body) > API_MAX_RESPONSE_SIZE:
+            response.close()
+            msg = f"Response over {API_MAX_RESPONSE_SIZE} bytes - {response.url}"
+            raise AxscendApiClientError(msg)
+    return body
+
+
+def _project_asset(asset: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of an asset the integration reads."""
+    return {key: value for key, value in asset.items() if key in API_ASSET_FIELDS}
+
+
+def _project(body: Any) -> Any:
+    """
+    Drop the asset fields the integration does not read.
+
+    Responses are kept for revalidation, so this bounds the memory each asset
+    holds to the handful of fields the entities show.
+    """
+    if not isinstance(body, dict):
+        return body
+    if isinstance(asset := body.get("asset"), dict):
+        return {**body, "asset": _project_asset(asset)}
+    for key in ("assets", "history"):
+        if isinstance(assets := body.get(key), list):
+            return {
+                **body,
+                key: [
+                    _project_asset(asset) for asset in assets if isinstance(asset, dict)
+                ],
+            }
+    return body
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a moment the way the API does, "2026-01-29 21:23:24" in UTC."""
+    return value.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _cache_key(url: str, params: dict | None) -> str:
+    """Return the URL a request is cached and coalesced under."""
+    return url if not params else f"{url}?{urlencode(params)}"
+
+
+def _assets_by_id(responses: Iterable[Any]) -> dict[str, Any]:
+    """Key the assets of listing responses by id, shaped like single responses."""
+    return {
+        str(asset["id"]): {"asset": asset}
+        for response in responses
+        for asset in response.get("assets", [])
+        if asset.get("id") is not None
+    }
+
+
+def _error_kind(exception: AxscendApiClientError) -> str:
+    """Return the metrics label of an error."""
+    if isinstance(exception, AxscendApiClientRateLimitError):
+        return "rate_limited"
+    if isinstance(exception, AxscendApiClientCommunicationError):
+        return "communication"
+    if isinstance(exception, AxscendApiClientAuthenticationError):
+        return "authentication"
+    if isinstance(exception, AxscendApiClientNotFoundError):
+        return "not_found"
+    return "unexpected"
 
 
 class AxscendApiClient:
     """Axscend API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         api_token: str,
         session: aiohttp.ClientSession,
+        breakers: CircuitBreakers | None = None,
+        rate_limiter: TokenBucket | None = None,
+        version: str | None = None,
+        single_flight: SingleFlight | None = None,
     ) -> None:
-        """Axscend API Client."""
+        """
+        Axscend API Client.
+
+        `version` is the integration version sent in the User-Agent header.
+        Clients sharing a `single_flight` group share identical requests.
+        """
         self._api_token = api_token
+        self._user_agent = f"{API_USER_AGENT}/{version}" if version else API_USER_AGENT
         self._session = session
+        self._breakers = breakers
+        self.rate_limiter = rate_limiter
+        self.metrics = ApiMetrics()
+        self.single_flight = single_flight or SingleFlight()
+        self._bulk_supported = True
+        self._response_cache: dict[str, _CachedResponse] = {}
+
+    @property
+    def api_token(self) -> str:
+        """Return the API token of the client."""
+        return self._api_token
 
     async def async_get_asset(self, asset_id: str) -> Any:
         """Get asset data with location from the API."""
@@ -56,31 +284,331 @@ class AxscendApiClient:
             url=f"{API_BASE_URL}/assets/{asset_id}",
         )
 
-    async def _api_wrapper(
+    async def async_get_assets(self, asset_ids: Iterable[str]) -> dict[str, Any]:
+        """
+        Get many assets, keyed by asset id, in as few requests as possible.
+
+        Uses the paged bulk endpoint when the API offers it and falls back to
+        bounded-concurrency fan-out of single asset requests otherwise. Each
+        value has the same shape as an `async_get_asset` response.
+        """
+        ids = sorted(set(asset_ids))
+        if not ids:
+            return {}
+        if self._bulk_supported:
+            try:
+                return await self._async_get_assets_bulk(ids)
+            except AxscendApiClientNotFoundError:
+                LOGGER.debug("Bulk asset endpoint unavailable, fanning out requests")
+                self._bulk_supported = False
+        return await self._async_get_assets_fan_out(ids)
+
+    async def _async_get_assets_bulk(self, asset_ids: list[str]) -> dict[str, Any]:
+        """Get assets through the bulk endpoint, one page per request."""
+        semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENCY)
+
+        async def _get_page(page: list[str]) -> Any:
+            async with semaphore:
+                return await self._api_wrapper(
+                    method="get",
+                    url=f"{API_BASE_URL}/assets",
+                    params={"ids": ",".join(page), "per_page": len(page)},
+                )
+
+        responses = await asyncio.gather(
+            *(
+                _get_page(asset_ids[start : start + FLEET_PAGE_SIZE])
+                for start in range(0, len(asset_ids), FLEET_PAGE_SIZE)
+            )
+        )
+        return _assets_by_id(responses)
+
+    async def async_list_assets(self) -> dict[str, Any]:
+        """
+        Get every asset visible to the API token, keyed by asset id.
+
+        The first page tells how many assets there are, so the remaining pages
+        are fetched concurrently. Without a total, pages are fetched in turn
+        until a short one, up to a limit.
+        """
+        url = f"{API_BASE_URL}/assets"
+        semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENCY)
+
+        async def _get_page(page: int) -> Any:
+            async with semaphore:
+                return await self._api_wrapper(
+                    method="get",
+                    url=url,
+                    params={"page": page, "per_page": FLEET_PAGE_SIZE},
+                )
+
+        responses = [await _get_page(1)]
+        total = responses[0].get("total")
+        if isinstance(total, int):
+            responses += await asyncio.gather(
+                *(
+                    _get_page(page)
+                    for page in range(2, math.ceil(total / FLEET_PAGE_SIZE) + 1)
+                )
+            )
+        else:
+            while (
+                len(responses[-1].get("assets", [])) >= FLEET_PAGE_SIZE
+                and len(responses) < FLEET_MAX_LIST_PAGES
+            ):
+                responses.append(await _get_page(len(responses) + 1))
+        return _assets_by_id(responses)
+
+    async def async_iter_history(
+        self, asset_id: str, start: datetime, end: datetime
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield the readings an asset reported between two moments, page by page.
+
+        Readings have the fields of an asset and come oldest first. The next
+        page is only requested once the caller is done with the previous one,
+        so a long period is never held in memory at once.
+        """
+        url = f"{API_BASE_URL}/assets/{asset_id}/history"
+        for page in range(1, BACKFILL_MAX_PAGES + 1):
+            # Pages are read once, so they are not kept for revalidation
+            response = await self._api_wrapper(
+                method="get",
+                url=url,
+                params={
+                    "from": _format_timestamp(start),
+                    "to": _format_timestamp(end),
+                    "page": page,
+                    "per_page": BACKFILL_PAGE_SIZE,
+                },
+                cache=False,
+            )
+            readings = response.get("history", []) if isinstance(response, dict) else []
+            if readings:
+                yield readings
+            if len(readings) < BACKFILL_PAGE_SIZE:
+                return
+        LOGGER.warning("Stopped the history of asset %s after %s pages", asset_id, page)
+
+    async def _async_get_assets_fan_out(self, asset_ids: list[str]) -> dict[str, Any]:
+        """Get assets one request each, with bounded concurrency."""
+        semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENCY)
+
+        async def _get_asset(asset_id: str) -> Any:
+            async with semaphore:
+                return await self.async_get_asset(asset_id)
+
+        responses = await asyncio.gather(
+            *(_get_asset(asset_id) for asset_id in asset_ids),
+            return_exceptions=True,
+        )
+        assets: dict[str, Any] = {}
+        errors: list[BaseException] = []
+        for asset_id, response in zip(asset_ids, responses, strict=True):
+            if isinstance(response, AxscendApiClientAuthenticationError):
+                raise response
+            if isinstance(response, BaseException):
+                LOGGER.debug("Error fetching asset %s: %s", asset_id, response)
+                errors.append(response)
+                continue
+            assets[asset_id] = response
+        if not assets and errors:
+            raise errors[0]
+        return assets
+
+    def _remember_response(
+        self, cache_key: str, response: aiohttp.ClientResponse, body: Any
+    ) -> None:
+        """Keep a decoded GET body for revalidation if it has validators."""
+        etag = response.headers.get(hdrs.ETAG)
+        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        if etag or last_modified:
+            self._response_cache[cache_key] = _CachedResponse(
+                etag=etag, last_modified=last_modified, body=body
+            )
+        else:
+            self._response_cache.pop(cache_key, None)
+
+    async def _api_wrapper(  # noqa: PLR0913
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        params: dict | None = None,
+        *,
+        cache: bool = True,
     ) -> Any:
-        """Get information from the API."""
+        """
+        Get information from the API.
+
+        Identical GET requests made at the same time, or within the short TTL
+        of the single-flight group, share one upstream request. Without
+        `cache`, such as for history pages read once, the request is neither
+        shared nor remembered for revalidation.
+        """
+        if method.lower() != "get" or not cache:
+            return await self._async_request_with_retries(
+                method, url, data, headers, params, cache=cache
+            )
+        return await self.single_flight.run(
+            _cache_key(url, params),
+            partial(
+                self._async_request_with_retries, method, url, data, headers, params
+            ),
+        )
+
+    async def _async_request_with_retries(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+        params: dict | None = None,
+        *,
+        cache: bool = True,
+    ) -> Any:
+        """
+        Make a request to the API, retrying communication errors.
+
+        Attempts are spaced by exponential backoff with full jitter, or by the
+        Retry-After the server sent. Requests to a host whose circuit breaker
+        is open fail at once instead of adding to the outage. Every attempt
+        waits for a token of the rate limiter shared by the API token.
+        """
+        breaker = self._breakers.get(URL(url).host or "") if self._breakers else None
+        attempt = 0
+        while True:
+            probe: CircuitBreaker | None = None
+            if breaker is not None:
+                if (wait := breaker.before_request()) is not None:
+                    self.metrics.circuit_open += 1
+                    msg = f"Axscend API unavailable, retrying in {wait:.0f}s"
+                    raise AxscendApiClientCircuitOpenError(msg, retry_after=wait)
+                # A request let through an open breaker is its probe
+                probe = breaker if breaker.is_open else None
+            try:
+                body = await self._async_attempt(
+                    breaker, method, url, data, headers, params, cache=cache
+                )
+            except AxscendApiClientCommunicationError as exception:
+                if (delay := _retry_delay(attempt, exception)) is None:
+                    raise
+                LOGGER.debug("Retrying %s in %.1fs: %s", url, delay, exception)
+            else:
+                return body
+            finally:
+                # Cancelled, the probe has no outcome; another request may probe
+                if probe is not None:
+                    probe.end_probe()
+            self.metrics.retries += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _async_attempt(  # noqa: PLR0913
+        self,
+        breaker: CircuitBreaker | None,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        params: dict | None,
+        *,
+        cache: bool,
+    ) -> Any:
+        """Make one attempt of a request, reporting its outcome to the breaker."""
+        if self.rate_limiter is not None:
+            with profile_stage("rate_limit"):
+                await self.rate_limiter.acquire()
+        # Timed after the rate limiter, so waiting for a token is not latency
+        start = time.monotonic()
         try:
-            if headers is None:
-                headers = {}
+            body = await self._async_request(
+                method, url, data, headers, params, cache=cache
+            )
+        except AxscendApiClientError as exception:
+            self.metrics.record_request(
+                time.monotonic() - start, _error_kind(exception)
+            )
+            # Rate limits apply to the token, not to the health of the host
+            if (
+                isinstance(exception, AxscendApiClientRateLimitError)
+                and self.rate_limiter is not None
+                and exception.retry_after
+            ):
+                self.rate_limiter.defer(exception.retry_after)
+            if breaker is None:
+                raise
+            # Any answer of the host, even a refusal, proves it is up
+            if isinstance(
+                exception, AxscendApiClientCommunicationError
+            ) and not isinstance(exception, AxscendApiClientRateLimitError):
+                breaker.record_failure(exception.retry_after)
+            else:
+                breaker.record_success()
+            raise
+        self.metrics.record_request(time.monotonic() - start)
+        if breaker is not None:
+            breaker.record_success()
+        return body
+
+    async def _async_request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+        params: dict | None = None,
+        *,
+        cache: bool = True,
+    ) -> Any:
+        """
+        Make a single request to the API.
+
+        Unless `cache` is off, GET responses carrying an ETag or Last-Modified
+        header are remembered per URL and revalidated on the next call. A 304
+        Not Modified answer returns the previously decoded body, the very same
+        object, so callers can detect that nothing changed with an identity
+        check. Bodies are size-limited, decoded with orjson when available and
+        projected down to the asset fields the integration reads.
+        """
+        try:
+            headers = dict(headers or {})
             headers["Authorization"] = f"Bearer {self._api_token}"
-            headers["User-Agent"] = f"{API_USER_AGENT}"
+            headers[hdrs.USER_AGENT] = self._user_agent
+
+            cache_key = _cache_key(url, params)
+            is_get = cache and method.lower() == "get"
+            cached = self._response_cache.get(cache_key) if is_get else None
+            if cached is not None:
+                headers.update(cached.validators())
 
-            async with asyncio.timeout(API_TIMEOUT):
+            with profile_stage("api"):
                 response = await self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
+                    params=params,
                     json=data,
+                    timeout=_REQUEST_TIMEOUT,
                 )
-                _verify_response_or_raise(response)
-                return await response.json()
+            if response.status == HTTPStatus.NOT_MODIFIED and cached is not None:
+                response.release()
+                self.metrics.not_modified += 1
+                return cached.body
+            _verify_response_or_raise(response)
+            with profile_stage("read"):
+                raw = await _read_body(response)
+            self.metrics.record_response_size(len(raw))
+            with profile_stage("decode"):
+                body = _project(json_loads(raw))
 
+            if is_get:
+                self._remember_response(cache_key, response, body)
+        except AxscendApiClientError:
+            raise
         except TimeoutError as exception:
+            self.metrics.timeouts += 1
             msg = f"Timeout error fetching information - {exception}"
             raise AxscendApiClientCommunicationError(
                 msg,
@@ -95,3 +623,20 @@ class AxscendApiClient:
             raise AxscendApiClientError(
                 msg,
             ) from exception
+        else:
+            return body
+
+
+def _retry_delay(
+    attempt: int, exception: AxscendApiClientCommunicationError
+) -> float | None:
+    """Return the seconds to wait before retrying, or None to give up."""
+    if attempt + 1 >= API_MAX_ATTEMPTS or isinstance(
+        exception, AxscendApiClientCircuitOpenError
+    ):
+        return None
+    if exception.retry_after is not None:
+        if exception.retry_after > API_MAX_RETRY_AFTER:
+            return None
+        return exception.retry_after + random.uniform(0, API_BACKOFF_BASE)  # noqa: S311
+    return random.uniform(0, min(API_BACKOFF_MAX, API_BACKOFF_BASE * 2**attempt))  # noqa: S311
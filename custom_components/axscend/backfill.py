@@ -0,0 +1,161 @@
+"""History backfill for axscend."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_import_statistics
+from homeassistant.const import PERCENTAGE, Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import BACKFILL_BATCH_SIZE, DOMAIN, LOGGER
+from .history import TrackPoint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import AxscendConfigEntry
+
+_HOUR = timedelta(hours=1)
+
+
+@dataclass(slots=True)
+class _Hour:
+    """Battery readings of one hour, reduced to what a statistic keeps."""
+
+    minimum: float
+    maximum: float
+    total: float
+    count: int = 1
+
+    def add(self, value: float) -> None:
+        """Add a reading."""
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.total += value
+        self.count += 1
+
+
+class _BatteryStatistics:
+    """Hourly battery statistics of an entity, imported as hours complete."""
+
+    def __init__(self, hass: HomeAssistant, statistic_id: str) -> None:
+        """Initialize with no readings."""
+        self._hass = hass
+        self._metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=None,
+            source="recorder",
+            statistic_id=statistic_id,
+            unit_of_measurement=PERCENTAGE,
+        )
+        self._hours: dict[datetime, _Hour] = {}
+        self.imported = 0
+
+    def add(self, points: Iterable[TrackPoint]) -> None:
+        """Add the battery readings of points to their hours."""
+        for point in points:
+            if point.battery is None:
+                continue
+            start = point.timestamp.replace(minute=0, second=0, microsecond=0)
+            if (hour := self._hours.get(start)) is None:
+                self._hours[start] = _Hour(point.battery, point.battery, point.battery)
+            else:
+                hour.add(point.battery)
+
+    def async_import(self, before: datetime) -> None:
+        """Import the hours that end by a moment, in one recorder job."""
+        starts = sorted(start for start in self._hours if start + _HOUR <= before)
+        if not starts:
+            return
+        statistics = []
+        for start in starts:
+            hour = self._hours.pop(start)
+            statistics.append(
+                StatisticData(
+                    start=start,
+                    mean=hour.total / hour.count,
+                    min=hour.minimum,
+                    max=hour.maximum,
+                )
+            )
+        async_import_statistics(self._hass, self._metadata, statistics)
+        self.imported += len(statistics)
+
+
+def _battery_statistics(
+    hass: HomeAssistant, entry: AxscendConfigEntry
+) -> _BatteryStatistics | None:
+    """Return the statistics of the battery sensor, if the recorder keeps them."""
+    if "recorder" not in hass.config.components:
+        return None
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR,
+        DOMAIN,
+        f"{entry.entry_id}_{entry.runtime_data.asset_id}_battery",
+    )
+    return None if entity_id is None else _BatteryStatistics(hass, entity_id)
+
+
+async def async_backfill_history(
+    hass: HomeAssistant,
+    entry: AxscendConfigEntry,
+    start: datetime,
+    end: datetime,
+) -> dict[str, int]:
+    """
+    Fill the track and battery statistics of an asset from the API's history.
+
+    Readings are streamed page by page and added in batches, so at most a
+    page and a batch are held at once. Battery readings become hourly mean,
+    min and max statistics of the battery sensor; the hour still in progress
+    is left to the recorder.
+    """
+    runtime_data = entry.runtime_data
+    asset_id = runtime_data.asset_id
+    statistics = _battery_statistics(hass, entry)
+    readings = added = 0
+    batch: list[TrackPoint] = []
+
+    async def _async_flush(before: datetime) -> None:
+        nonlocal added
+        added += await runtime_data.history.async_add_points(batch)
+        if statistics is not None:
+            statistics.add(batch)
+            statistics.async_import(before)
+        batch.clear()
+
+    async for page in runtime_data.client.async_iter_history(asset_id, start, end):
+        readings += len(page)
+        batch.extend(
+            point
+            for reading in page
+            if (point := TrackPoint.from_reading(asset_id, reading)) is not None
+        )
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            # Later pages may still add to the hour of the latest reading
+            await _async_flush(
+                batch[-1].timestamp.replace(minute=0, second=0, microsecond=0)
+            )
+    await _async_flush(min(end, dt_util.utcnow()))
+
+    LOGGER.debug(
+        "Backfilled asset %s with %s of %s readings", asset_id, added, readings
+    )
+    return {
+        "readings": readings,
+        "points": added,
+        "statistics": statistics.imported if statistics is not None else 0,
+    }
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -10,10 +9,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.util import dt as dt_util
 
 from .entity import AxscendEntity
+from .geofence import HOME_ZONE
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -28,27 +31,11 @@ ENTITY_DESCRIPTIONS = (
     ),
 )
 
-
-def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    Calculate distance between two GPS coordinates in meters.
-
-    Uses Haversine formula.
-    """
-    r = 6371000  # Earth's radius in meters
-
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
-
-    a = (
-        math.sin(delta_lat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return r * c
+MOVING_ENTITY_DESCRIPTION = BinarySensorEntityDescription(
+    key="moving",
+    name="Moving",
+    device_class=BinarySensorDeviceClass.MOVING,
+)
 
 
 async def async_setup_entry(
@@ -58,11 +45,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary_sensor platform."""
     async_add_entities(
-        AxscendAtHomeBinarySensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
+        [
+            *(
+                AxscendAtHomeBinarySensor(
+                    coordinator=entry.runtime_data.coordinator,
+                    entity_description=entity_description,
+                )
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            AxscendMovingBinarySensor(
+                coordinator=entry.runtime_data.coordinator,
+                entity_description=MOVING_ENTITY_DESCRIPTION,
+            ),
+        ]
     )
 
 
@@ -75,7 +70,7 @@ class AxscendAtHomeBinarySensor(AxscendEntity, BinarySensorEntity):
         entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({"presence"}))
         self.entity_description = entity_description
         asset_id = coordinator.config_entry.runtime_data.asset_id
         # Ensure unique ID per entity
@@ -85,36 +80,37 @@ class AxscendAtHomeBinarySensor(AxscendEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        """Return true if the asset is within the home location radius."""
-        if not self.coordinator.data:
-            return False
+        """Return true if the asset is within the home zone."""
+        return HOME_ZONE in self.coordinator.presence.zones
 
-        # Get Home Assistant home location
-        home_latitude = self.hass.config.latitude
-        home_longitude = self.hass.config.longitude
 
-        if home_latitude is None or home_longitude is None:
-            return False
+class AxscendMovingBinarySensor(AxscendEntity, BinarySensorEntity):
+    """Axscend binary_sensor class for the trip state of the asset."""
 
-        # Get home location radius from Home Assistant configuration
-        # Default to 100m if not configured
-        home_radius = (
-            self.hass.config.radius if self.hass.config.radius is not None else 100
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: BinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary_sensor class."""
+        super().__init__(coordinator, frozenset({"motion"}))
+        self.entity_description = entity_description
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
         )
 
-        # Get asset GPS coordinates
-        asset_data = self.coordinator.data.get("asset", {})
-
-        asset_latitude = asset_data.get("gps_latitude")
-        asset_longitude = asset_data.get("gps_longitude")
-
-        if asset_latitude is None or asset_longitude is None:
-            return False
-
-        # Calculate distance
-        distance = _haversine_distance(
-            home_latitude, home_longitude, asset_latitude, asset_longitude
-        )
+    @property
+    def is_on(self) -> bool:
+        """Return true while the asset is on a trip."""
+        return self.coordinator.motion.is_moving(dt_util.utcnow())
 
-        # Return true if within home location radius
-        return distance <= home_radius
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the current trip started and the last trip distance."""
+        motion = self.coordinator.motion
+        return {
+            "trip_started": motion.trip_started,
+            "trip_distance": round(motion.trip_distance),
+        }
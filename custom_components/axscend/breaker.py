@@ -0,0 +1,114 @@
+"""Per-host circuit breaker for the axscend API client."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_RESET_TIMEOUT,
+    CIRCUIT_RESET_TIMEOUT,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests to a host that keeps failing.
+
+    After a number of consecutive failures the breaker opens and rejects
+    requests until its reset timeout passes. Then a single probe request is let
+    through: any answer from the host, even a refusal, closes the breaker,
+    failure opens it again for twice as long. The timeout is jittered so
+    clients sharing an outage do not all probe at the same moment.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.host = host
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._open_for = 0.0
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return true while requests are rejected."""
+        return self._opened_at is not None
+
+    def before_request(self) -> float | None:
+        """
+        Return None if a request may be sent, else the seconds to wait.
+
+        The first request after the reset timeout becomes the probe.
+        """
+        if self._opened_at is None:
+            return None
+        remaining = self._opened_at + self._open_for - time.monotonic()
+        if remaining > 0:
+            return remaining
+        if self._probing:
+            return self.reset_timeout
+        self._probing = True
+        return None
+
+    def end_probe(self) -> None:
+        """Let another request probe if the probe ended without an outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        if self._opened_at is not None:
+            LOGGER.info("Axscend API at %s recovered, closing circuit", self.host)
+        self.failures = 0
+        self._opened_at = None
+        self._open_for = 0.0
+        self._probing = False
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        self.failures += 1
+        if self._opened_at is None and self.failures < self.threshold:
+            return
+        open_for = min(
+            max(self._open_for * 2, self.reset_timeout), CIRCUIT_MAX_RESET_TIMEOUT
+        )
+        if self._opened_at is None:
+            LOGGER.warning(
+                "Axscend API at %s failed %s times, opening circuit",
+                self.host,
+                self.failures,
+            )
+        self._open_for = max(open_for * random.uniform(1, 1.5), retry_after or 0)  # noqa: S311
+        self._opened_at = time.monotonic()
+        self._probing = False
+
+
+class CircuitBreakers:
+    """Circuit breakers keyed by host, shared by every client of a session."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Return the breaker of a host."""
+        if (breaker := self._breakers.get(host)) is None:
+            breaker = self._breakers[host] = CircuitBreaker(host)
+        return breaker
+
+    def __iter__(self) -> Iterator[CircuitBreaker]:
+        """Iterate over the breakers of every host contacted so far."""
+        return iter(self._breakers.values())
@@ -2,19 +2,58 @@
 
 from __future__ import annotations
 
-import aiohttp
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_API_TOKEN
+from homeassistant.components import webhook
+from homeassistant.const import (
+    CONF_API_TOKEN,
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+    CONF_WEBHOOK_ID,
+    UnitOfTime,
+)
+from homeassistant.core import callback
 from homeassistant.helpers import selector
+from homeassistant.helpers.network import NoURLAvailableError
+from homeassistant.loader import async_get_loaded_integration
 
 from .api import (
     AxscendApiClient,
     AxscendApiClientAuthenticationError,
     AxscendApiClientCommunicationError,
     AxscendApiClientError,
+    AxscendApiClientNotFoundError,
+)
+from .const import (
+    CONF_ASSET_ID,
+    CONF_ASSETS,
+    CONF_FLEET_MODE,
+    CONF_HISTORY_DAYS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PLACES_FILE,
+    CONF_PUSH,
+    CONF_WEBHOOK_SECRET,
+    CONF_ZONES,
+    DEFAULT_HISTORY_DAYS,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    LOGGER,
 )
-from .const import CONF_ASSET_ID, DOMAIN, LOGGER
+from .geofence import parse_custom_zones
+from .session import async_get_session_pool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Flows the select step starts for every further asset picked
+SOURCE_DISCOVERED_ASSET = "discovered_asset"
+CONF_OPTIONS = "options"
 
 
 class AxscendFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -25,36 +64,53 @@ class AxscendFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the flow handler."""
         self._asset_name: str | None = None
+        self._api_token: str | None = None
+        # Names of the assets the token can see, keyed by asset id
+        self._assets: dict[str, str] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> AxscendOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return AxscendOptionsFlowHandler()
 
     async def async_step_user(
         self,
         user_input: dict | None = None,
     ) -> config_entries.ConfigFlowResult:
-        """Handle a flow initialized by the user."""
+        """
+        Handle a flow initialized by the user.
+
+        With an asset id that asset is added; without one, every asset the
+        token can see is listed to pick from.
+        """
         _errors = {}
         if user_input is not None:
+            api_token = user_input[CONF_API_TOKEN]
+            asset_id = user_input.get(CONF_ASSET_ID)
             try:
-                await self._test_credentials(
-                    api_token=user_input[CONF_API_TOKEN],
-                    asset_id=user_input[CONF_ASSET_ID],
-                )
-            except AxscendApiClientAuthenticationError as exception:
-                LOGGER.warning(exception)
-                _errors["base"] = "auth"
-            except AxscendApiClientCommunicationError as exception:
-                LOGGER.error(exception)
-                _errors["base"] = "connection"
+                if asset_id:
+                    await self._test_credentials(api_token=api_token, asset_id=asset_id)
+                else:
+                    self._assets = await self._discover_assets(api_token=api_token)
+            except AxscendApiClientNotFoundError as exception:
+                if asset_id:
+                    _errors["base"] = _error_key(exception)
+                else:
+                    LOGGER.warning(exception)
+                    _errors["base"] = "discovery_unsupported"
             except AxscendApiClientError as exception:
-                LOGGER.exception(exception)
-                _errors["base"] = "unknown"
+                _errors["base"] = _error_key(exception)
             else:
-                await self.async_set_unique_id(unique_id=user_input[CONF_ASSET_ID])
+                if not asset_id:
+                    self._api_token = api_token
+                    return await self.async_step_select()
+                await self.async_set_unique_id(unique_id=asset_id)
                 self._abort_if_unique_id_configured()
-                title = (
-                    f"Axscend Asset '{self._asset_name}' ({user_input[CONF_ASSET_ID]})"
-                )
                 return self.async_create_entry(
-                    title=title,
+                    title=_entry_title(self._asset_name, asset_id),
                     data=user_input,
                 )
 
@@ -70,7 +126,7 @@ class AxscendFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                             type=selector.TextSelectorType.PASSWORD,
                         ),
                     ),
-                    vol.Required(
+                    vol.Optional(
                         CONF_ASSET_ID,
                         default=(user_input or {}).get(CONF_ASSET_ID, vol.UNDEFINED),
                     ): selector.TextSelector(
@@ -83,18 +139,270 @@ class AxscendFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors,
         )
 
+    async def async_step_select(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """
+        Pick the assets to add from those the token can see.
+
+        This flow creates the entry of the first asset and starts one flow per
+        further asset, each named from the listing without another request.
+        Assets added together are polled in fleet mode.
+        """
+        configured = self._async_current_ids()
+        available = {
+            asset_id: name
+            for asset_id, name in self._assets.items()
+            if asset_id not in configured
+        }
+        if not available:
+            return self.async_abort(reason="no_new_assets")
+
+        _errors = {}
+        if user_input is not None:
+            selected = [
+                asset_id
+                for asset_id in user_input[CONF_ASSETS]
+                if asset_id in available
+            ]
+            if selected:
+                options = {CONF_FLEET_MODE: True} if len(selected) > 1 else {}
+                for asset_id in selected[1:]:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": SOURCE_DISCOVERED_ASSET},
+                            data=self._asset_data(asset_id, available, options),
+                        ),
+                        f"{DOMAIN} add asset {asset_id}",
+                    )
+                return await self.async_step_discovered_asset(
+                    self._asset_data(selected[0], available, options)
+                )
+            _errors[CONF_ASSETS] = "no_assets_selected"
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_ASSETS): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=asset_id,
+                                    label=f"{name} ({asset_id})",
+                                )
+                                for asset_id, name in sorted(
+                                    available.items(), key=lambda item: item[1]
+                                )
+                            ],
+                            multiple=True,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors,
+            description_placeholders={"count": str(len(available))},
+        )
+
+    async def async_step_discovered_asset(
+        self,
+        discovery_info: dict,
+    ) -> config_entries.ConfigFlowResult:
+        """Add an asset picked from the listing, already validated by it."""
+        await self.async_set_unique_id(unique_id=discovery_info[CONF_ASSET_ID])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=_entry_title(
+                discovery_info[CONF_NAME], discovery_info[CONF_ASSET_ID]
+            ),
+            data={
+                CONF_API_TOKEN: discovery_info[CONF_API_TOKEN],
+                CONF_ASSET_ID: discovery_info[CONF_ASSET_ID],
+            },
+            options=discovery_info[CONF_OPTIONS],
+        )
+
+    def _asset_data(self, asset_id: str, names: dict[str, str], options: dict) -> dict:
+        """Return what the flow of a picked asset needs to create its entry."""
+        return {
+            CONF_API_TOKEN: self._api_token,
+            CONF_ASSET_ID: asset_id,
+            CONF_NAME: names[asset_id],
+            CONF_OPTIONS: options,
+        }
+
     async def _test_credentials(self, api_token: str, asset_id: str) -> None:
         """Validate credentials and fetch asset details."""
-        # Use ThreadedResolver to avoid aiodns compatibility issues with Python 3.13
-        connector = aiohttp.TCPConnector(resolver=aiohttp.resolver.ThreadedResolver())
-        session = aiohttp.ClientSession(connector=connector)
+        async with self._client(api_token) as client:
+            response = await client.async_get_asset(asset_id=asset_id)
+        # Extract asset name from response
+        self._asset_name = response.get("asset", {}).get("name", asset_id)
+
+    async def _discover_assets(self, api_token: str) -> dict[str, str]:
+        """Return the names of every asset the token can see, keyed by id."""
+        async with self._client(api_token) as client:
+            assets = await client.async_list_assets()
+        return {
+            asset_id: response["asset"].get("name") or asset_id
+            for asset_id, response in assets.items()
+        }
+
+    @asynccontextmanager
+    async def _client(self, api_token: str) -> AsyncIterator[AxscendApiClient]:
+        """Yield a client on the shared session pool."""
+        pool = async_get_session_pool(self.hass)
+        session = pool.async_acquire()
         try:
-            client = AxscendApiClient(
+            yield AxscendApiClient(
                 api_token=api_token,
                 session=session,
+                rate_limiter=pool.async_get_rate_limiter(api_token),
+                version=str(async_get_loaded_integration(self.hass, DOMAIN).version),
+                single_flight=pool.async_get_single_flight(api_token),
             )
-            response = await client.async_get_asset(asset_id=asset_id)
-            # Extract asset name from response
-            self._asset_name = response.get("asset", {}).get("name", asset_id)
         finally:
-            await session.close()
+            pool.async_release()
+
+
+class AxscendOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Axscend."""
+
+    _webhook_id: str | None = None
+
+    @property
+    def webhook_id(self) -> str:
+        """Return the webhook id of the entry, generating one on first use."""
+        if self._webhook_id is None:
+            self._webhook_id = (
+                self.config_entry.options.get(CONF_WEBHOOK_ID)
+                or webhook.async_generate_id()
+            )
+        return self._webhook_id
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_MAX_INTERVAL] < user_input[CONF_MIN_INTERVAL]:
+                _errors[CONF_MAX_INTERVAL] = "max_below_min"
+            try:
+                parse_custom_zones(user_input.get(CONF_ZONES, ""))
+            except ValueError:
+                _errors[CONF_ZONES] = "invalid_zones"
+            if user_input[CONF_PUSH] and not user_input.get(CONF_WEBHOOK_SECRET):
+                _errors[CONF_WEBHOOK_SECRET] = "secret_required"
+            if (places_file := user_input.get(CONF_PLACES_FILE)) and not (
+                await self.hass.async_add_executor_job(
+                    Path(self.hass.config.path(places_file)).is_file
+                )
+            ):
+                _errors[CONF_PLACES_FILE] = "places_not_found"
+            if not _errors:
+                return self.async_create_entry(
+                    data={**user_input, CONF_WEBHOOK_ID: self.webhook_id}
+                )
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FLEET_MODE,
+                        default=options.get(CONF_FLEET_MODE, False),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): _seconds_selector(minimum=30),
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): _seconds_selector(minimum=30),
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=options.get(CONF_SCAN_INTERVAL, 0),
+                    ): _seconds_selector(minimum=0),
+                    vol.Optional(
+                        CONF_ZONES,
+                        default=options.get(CONF_ZONES, ""),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True),
+                    ),
+                    vol.Required(
+                        CONF_HISTORY_DAYS,
+                        default=options.get(CONF_HISTORY_DAYS, DEFAULT_HISTORY_DAYS),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=90,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement=UnitOfTime.DAYS,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_PLACES_FILE,
+                        description={"suggested_value": options.get(CONF_PLACES_FILE)},
+                    ): selector.TextSelector(),
+                    vol.Required(
+                        CONF_PUSH,
+                        default=options.get(CONF_PUSH, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_WEBHOOK_SECRET,
+                        description={
+                            "suggested_value": options.get(CONF_WEBHOOK_SECRET)
+                        },
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.PASSWORD,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors,
+            description_placeholders={"webhook_url": self._webhook_url()},
+        )
+
+    def _webhook_url(self) -> str:
+        """Return the URL Axscend should post events to."""
+        try:
+            return webhook.async_generate_url(self.hass, self.webhook_id)
+        except NoURLAvailableError:
+            return webhook.async_generate_path(self.webhook_id)
+
+
+def _entry_title(name: str | None, asset_id: str) -> str:
+    """Return the title of the entry of an asset."""
+    return f"Axscend Asset '{name}' ({asset_id})"
+
+
+def _error_key(exception: AxscendApiClientError) -> str:
+    """Log an API error and return the form error it maps to."""
+    if isinstance(exception, AxscendApiClientAuthenticationError):
+        LOGGER.warning(exception)
+        return "auth"
+    if isinstance(exception, AxscendApiClientCommunicationError):
+        LOGGER.error(exception)
+        return "connection"
+    LOGGER.exception(exception)
+    return "unknown"
+
+
+def _seconds_selector(minimum: int) -> selector.NumberSelector:
+    """Return a selector for an interval in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=86400,
+            step=1,
+            mode=selector.NumberSelectorMode.BOX,
+            unit_of_measurement=UnitOfTime.SECONDS,
+        ),
+    )
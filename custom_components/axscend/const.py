@@ -1,8 +1,7 @@
 """Constants for axscend."""
 
-import json
+from datetime import timedelta
 from logging import Logger, getLogger
-from pathlib import Path
 
 LOGGER: Logger = getLogger(__package__)
 
@@ -11,9 +10,136 @@ ATTRIBUTION = "Data provided by Axscend"
 
 # Config flow constants
 CONF_ASSET_ID = "asset_id"
+CONF_ASSETS = "assets"
+
+# Options flow constants
+CONF_FLEET_MODE = "fleet_mode"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_ZONES = "zones"
+CONF_HISTORY_DAYS = "history_days"
+CONF_PUSH = "push"
+CONF_WEBHOOK_SECRET = "webhook_secret"  # noqa: S105
+CONF_PLACES_FILE = "places_file"
 
 API_BASE_URL = "https://api.axscend.com/v3"
-API_TIMEOUT = 10  # seconds
+API_TIMEOUT = 20  # seconds per attempt
+API_CONNECT_TIMEOUT = 5  # seconds
+API_READ_TIMEOUT = 10  # seconds between reads of a response
+API_MAX_ATTEMPTS = 3
+API_BACKOFF_BASE = 1  # seconds, doubled on every retry
+API_BACKOFF_MAX = 30  # seconds
+API_MAX_RETRY_AFTER = 60  # longer Retry-After waits end the attempt
+API_CACHE_TTL = 2  # seconds a response is shared with later identical requests
+API_MAX_RESPONSE_SIZE = 4 * 1024 * 1024  # bytes, a full bulk page is ~50 kB
+API_READ_CHUNK_SIZE = 64 * 1024  # bytes
+# Asset keys kept from API responses, the rest is dropped after decoding
+API_ASSET_FIELDS = frozenset(
+    {
+        "id",
+        "name",
+        "gps_latitude",
+        "gps_longitude",
+        "last_movement_timestamp",
+        "last_position_timestamp",
+        "batt_percent",
+    }
+)
+
+# Rate limit per API token, shared by every entry and the config flow
+RATE_LIMIT_PER_SECOND = 2  # sustained requests
+RATE_LIMIT_BURST = 20  # requests allowed back to back
+
+# Circuit breaker per API host
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed requests
+CIRCUIT_RESET_TIMEOUT = 30  # seconds before the first probe request
+CIRCUIT_MAX_RESET_TIMEOUT = 600  # seconds
+STALE_SNAPSHOT_MAX_AGE = timedelta(minutes=30)  # last good data served while down
+
+DEFAULT_UPDATE_INTERVAL = timedelta(minutes=5)
+
+# Adaptive polling
+DEFAULT_MIN_INTERVAL = 60  # seconds, used while the asset is moving
+DEFAULT_MAX_INTERVAL = 3600  # seconds, ceiling for stationary back-off
+MOVEMENT_RECENT_WINDOW = timedelta(minutes=15)
+LOW_BATTERY_THRESHOLD = 20  # percent
+
+# Fleet mode batching
+FLEET_PAGE_SIZE = 100  # assets per bulk request
+FLEET_MAX_CONCURRENCY = 8  # concurrent requests per fleet refresh
+FLEET_MAX_LIST_PAGES = 100  # pages listed when the API gives no total
+
+# Poll scheduling
+SCHEDULER_MAX_CONCURRENT = 4  # refreshes fetching at once across the integration
+
+# Geofencing
+EVENT_ZONE_ENTER = f"{DOMAIN}_zone_enter"
+EVENT_ZONE_EXIT = f"{DOMAIN}_zone_exit"
+GEOFENCE_GRID_DEGREES = 0.1  # size of a zone index cell
+GEOFENCE_MAX_CELLS = 400  # larger zones are checked against every asset
+GEOFENCE_HYSTERESIS_MIN = 20  # meters beyond the radius before an asset exits
+GEOFENCE_HYSTERESIS_RATIO = 0.1  # of the radius, when larger than the minimum
+
+# Track history
+DEFAULT_HISTORY_DAYS = 7
+HISTORY_MAX_POINTS = 10000  # per asset, about 280 kB
+HISTORY_SIMPLIFY_TOLERANCE = 10  # meters a point may be off a straight track
+HISTORY_SAVE_DELAY = 60  # seconds new points are batched before writing
+
+# Motion sensors
+MOTION_MIN_DISTANCE = 25  # meters a fix must move to count, filtering GPS jitter
+MOTION_MAX_SPEED = 300  # km/h, faster jumps between fixes are GPS glitches
+MOTION_PARKED_AFTER = timedelta(minutes=15)  # without a move before a trip ends
+
+# Nearest place lookup
+PLACES_GRID_DEGREES = 0.1  # size of a places index cell
+PLACES_MAX_DISTANCE = 50000  # meters, farther places are not reported
+PLACES_CACHE_SIZE = 1024  # rounded positions remembered per places file
+PLACES_CACHE_PRECISION = 4  # decimals positions are rounded to, about 10 m
+
+# History backfill service
+SERVICE_BACKFILL_HISTORY = "backfill_history"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+BACKFILL_PAGE_SIZE = 1000  # readings per history request
+BACKFILL_MAX_PAGES = 1000  # pages one backfill fetches at most
+BACKFILL_BATCH_SIZE = 5000  # readings added to the track and statistics at once
+BACKFILL_MAX_RANGE = timedelta(days=31)
+
+# Refresh profiling service
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+ATTR_DURATION = "duration"
+ATTR_SAMPLE = "sample"
+PROFILE_DEFAULT_DURATION = timedelta(minutes=10)
+PROFILE_MAX_DURATION = timedelta(hours=1)
+PROFILE_MAX_CYCLES = 1000
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+
+# Track export
+EXPORT_URL = f"/api/{DOMAIN}/{{asset_id}}/track"
+EXPORT_DEFAULT_RANGE = timedelta(days=1)
+EXPORT_MAX_RANGE = timedelta(days=366)
+EXPORT_CHUNK_POINTS = 500  # points written and simplified at once
+
+# Last known snapshots for instant startup
+SNAPSHOT_SAVE_DELAY = 30  # seconds changes are batched before writing
+
+# Push ingestion
+WEBHOOK_SIGNATURE_HEADER = "X-Axscend-Signature"
+WEBHOOK_MAX_BODY = 65536  # bytes
+WEBHOOK_SEEN_EVENTS = 256  # event ids remembered to drop redelivered events
+
+# Runtime metrics
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20)  # seconds
+METRICS_WINDOW = 100  # most recent outcomes the success rate is computed over
+
+# Shared HTTP client pool
+SESSION_DNS_CACHE_TTL = 300  # seconds
+SESSION_KEEPALIVE_TIMEOUT = 75  # seconds
+SESSION_LIMIT_PER_HOST = 8
+SESSION_CLOSE_DELAY = 60  # seconds an idle pool is kept open across reloads
 
-_manifest = json.loads((Path(__file__).parent / "manifest.json").read_text())
-API_USER_AGENT = f"HomeAssistantAxscendIntegration/{_manifest['version']}"
+# The version is appended from the loaded integration, see AxscendApiClient
+API_USER_AGENT = "HomeAssistantAxscendIntegration"
@@ -2,39 +2,308 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     AxscendApiClientAuthenticationError,
+    AxscendApiClientCommunicationError,
     AxscendApiClientError,
 )
-from .const import LOGGER
+from .const import CONF_ASSET_ID, LOGGER, STALE_SNAPSHOT_MAX_AGE
+from .data import AssetSnapshot
+from .geofence import Presence, async_get_geofence
+from .metrics import PollMetrics
+from .motion import MotionState
+from .polling import next_update_interval, retry_interval
+from .profiler import async_get_active_profiler, profile_stage
+from .scheduler import (
+    PhasedDataUpdateCoordinator,
+    async_get_poll_scheduler,
+    poll_phase,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+    from datetime import datetime
+    from typing import Any
+
+    from homeassistant.core import CALLBACK_TYPE
+
     from .data import AxscendConfigEntry
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class AxscendDataUpdateCoordinator(DataUpdateCoordinator):
+class AxscendDataUpdateCoordinator(PhasedDataUpdateCoordinator[AssetSnapshot]):
     """Class to manage fetching data from the API."""
 
     config_entry: AxscendConfigEntry
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+    # Snapshot and availability the listeners were last notified about
+    _dispatched_snapshot: AssetSnapshot | None = None
+    _dispatched_success: bool | None = None
+    # Zones the asset is in, kept up to date by the geofence engine
+    presence: Presence = Presence()
+    # Set while the geofence runs within a dispatch, which covers presence too
+    _evaluating_presence: bool = False
+    # When the API last answered, bounding how long stale data is served
+    _fresh_at: datetime | None = None
+    # Ends the current trip when no fix moves the asset in time
+    _unsub_parked: CALLBACK_TYPE | None = None
+    # Set by a manual refresh so its fetch skips ahead of scheduled ones
+    _priority_refresh: bool = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self.metrics = PollMetrics()
+        self.motion = MotionState()
+        self._phase = poll_phase(self.config_entry.data[CONF_ASSET_ID])
+
+    @property
+    def fresh_at(self) -> datetime | None:
+        """Return when the API last answered for this asset."""
+        return self._fresh_at
+
+    @fresh_at.setter
+    def fresh_at(self, value: datetime) -> None:
+        """Set when current data of this asset was last received, also pushed."""
+        self._fresh_at = value
+
+    @property
+    def poll_metrics(self) -> PollMetrics:
+        """Return the metrics of the coordinator that polls this asset."""
+        if (fleet := self.config_entry.runtime_data.fleet) is not None:
+            return fleet.metrics
+        return self.metrics
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh, tracing every stage while the pipeline is being profiled."""
+        if (profiler := async_get_active_profiler(self.hass)) is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+        with profiler.trace(f"asset {self.config_entry.data[CONF_ASSET_ID]}") as trace:
+            await super()._async_refresh(*args, **kwargs)
+            trace.success = self.last_update_success
+
+    async def _async_update_data(self) -> AssetSnapshot:
+        """Update data via library, measuring every refresh."""
+        start = time.monotonic()
+        success = False
         try:
-            response = await self.config_entry.runtime_data.client.async_get_asset(
-                asset_id=self.config_entry.runtime_data.asset_id
-            )
+            snapshot = await self._async_fetch_snapshot()
+            success = not snapshot.stale
+            return snapshot
+        finally:
+            self.metrics.record_poll(time.monotonic() - start, success=success)
+            self._async_update_metrics_listeners()
+
+    async def _async_fetch_snapshot(self) -> AssetSnapshot:
+        """Fetch the asset, falling back to the last snapshot while it is fresh."""
+        if (fleet := self.config_entry.runtime_data.fleet) is not None:
+            try:
+                snapshot = await fleet.async_fetch_asset(
+                    self.config_entry.runtime_data.asset_id
+                )
+            except UpdateFailed:
+                if (stale := self._stale_snapshot()) is None:
+                    raise
+                return stale
+            self._fresh_at = dt_util.utcnow()
+            return snapshot
+        priority, self._priority_refresh = self._priority_refresh, False
+        try:
+            async with async_get_poll_scheduler(self.hass).slot(priority=priority):
+                response = await self.config_entry.runtime_data.client.async_get_asset(
+                    asset_id=self.config_entry.runtime_data.asset_id
+                )
             LOGGER.debug("Coordinator fetched data: %s", response)
         except AxscendApiClientAuthenticationError as exception:
             LOGGER.warning("Authentication failed during update: %s", exception)
             raise ConfigEntryAuthFailed(exception) from exception
+        except AxscendApiClientCommunicationError as exception:
+            self.update_interval = retry_interval(
+                self.update_interval, exception.retry_after
+            )
+            if (snapshot := self._stale_snapshot()) is None:
+                LOGGER.error("API error during update: %s", exception)
+                raise UpdateFailed(exception) from exception
+            LOGGER.warning(
+                "Serving the last asset data, API unreachable: %s", exception
+            )
+            return snapshot
         except AxscendApiClientError as exception:
             LOGGER.error("API error during update: %s", exception)
             raise UpdateFailed(exception) from exception
         else:
-            return response
+            self._fresh_at = dt_util.utcnow()
+            snapshot = AssetSnapshot.from_api(
+                self.config_entry.runtime_data.asset_id, response
+            )
+            # Set before the base class schedules the next refresh
+            self.update_interval = next_update_interval(
+                self.config_entry.runtime_data.polling,
+                self.update_interval,
+                snapshot,
+                self.data,
+            )
+            return snapshot
+
+    @callback
+    def async_seed(self, snapshot: AssetSnapshot, fetched_at: datetime) -> None:
+        """Start from a stored snapshot until the first refresh completes."""
+        self.data = snapshot.as_stale()
+        self._fresh_at = fetched_at
+        async_get_geofence(self.hass).async_update((self.data,))
+
+    def _stale_snapshot(self) -> AssetSnapshot | None:
+        """Return the last good snapshot marked stale, unless it is too old."""
+        if (
+            self.data is None
+            or self._fresh_at is None
+            or dt_util.utcnow() - self._fresh_at > STALE_SNAPSHOT_MAX_AGE
+        ):
+            return None
+        return self.data.as_stale()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update only the listeners whose snapshot fields changed.
+
+        Listeners register the snapshot fields they read as their context. A
+        listener without a context, or any change in availability, is always
+        notified.
+        """
+        with profile_stage("dispatch"):
+            motion_changed = self._async_update_motion()
+            presence_changed = self._async_update_presence()
+            previous = self._dispatched_snapshot
+            availability_changed = self._dispatched_success != self.last_update_success
+            self._dispatched_snapshot = self.data
+            self._dispatched_success = self.last_update_success
+            if previous is None or self.data is None or availability_changed:
+                super().async_update_listeners()
+                return
+            changed = self.data.changed_fields(previous)
+            if motion_changed:
+                changed.add("motion")
+            if presence_changed:
+                changed.add("presence")
+            self._async_update_field_listeners(changed)
+
+    @callback
+    def _async_update_presence(self) -> bool:
+        """
+        Evaluate the stored snapshot against the zones; return true on a change.
+
+        Runs once the snapshot is stored, so listeners of the presence read
+        the position that put the asset in its zones, in the same dispatch.
+        """
+        if self.data is None:
+            return False
+        previous = self.presence
+        self._evaluating_presence = True
+        try:
+            async_get_geofence(self.hass).async_update((self.data,))
+        finally:
+            self._evaluating_presence = False
+        return self.presence != previous
+
+    @callback
+    def _async_update_motion(self) -> bool:
+        """Advance the motion state with a fresh fix; return true if it changed."""
+        if (
+            self.data is None
+            or self.data.stale
+            or not self.motion.update(self.data, dt_util.utcnow())
+        ):
+            return False
+        if self._unsub_parked is not None:
+            self._unsub_parked()
+            self._unsub_parked = None
+        if (parks_at := self.motion.parks_at) is not None:
+            self._unsub_parked = async_track_point_in_utc_time(
+                self.hass, self._async_handle_parked, parks_at
+            )
+        return True
+
+    @callback
+    def _async_handle_parked(self, _now: datetime) -> None:
+        """End the trip of an asset that stopped reporting moves."""
+        self._unsub_parked = None
+        self.motion.park()
+        self._async_update_field_listeners({"motion"})
+
+    async def async_shutdown(self) -> None:
+        """Cancel the trip timer as well."""
+        await super().async_shutdown()
+        if self._unsub_parked is not None:
+            self._unsub_parked()
+            self._unsub_parked = None
+
+    @callback
+    def _async_update_field_listeners(self, changed: AbstractSet[str]) -> None:
+        """Update the listeners that read one of the changed fields."""
+        if not changed:
+            return
+        for update_callback, fields in list(self._listeners.values()):
+            if fields is None or not changed.isdisjoint(fields):
+                update_callback()
+
+    @callback
+    def _async_update_metrics_listeners(self) -> None:
+        """Update only the listeners that show runtime metrics."""
+        for update_callback, fields in list(self._listeners.values()):
+            if fields is not None and "metrics" in fields:
+                update_callback()
+
+    @callback
+    def async_handle_presence(self, presence: Presence) -> None:
+        """Take over a presence change from the geofence engine."""
+        self.presence = presence
+        if not self._evaluating_presence:
+            self._async_update_field_listeners({"presence"})
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh, batched across the fleet in fleet mode."""
+        if (fleet := self.config_entry.runtime_data.fleet) is not None:
+            await fleet.async_request_refresh()
+            return
+        self._priority_refresh = True
+        await super().async_request_refresh()
+
+    @callback
+    def async_handle_fleet_update(self) -> None:
+        """Pick this asset out of a fleet refresh."""
+        fleet = self.config_entry.runtime_data.fleet
+        if fleet is None:
+            return
+        self._async_update_metrics_listeners()
+        if not fleet.last_update_success:
+            if isinstance(fleet.last_exception, ConfigEntryAuthFailed):
+                self.config_entry.async_start_reauth(self.hass)
+            elif (stale := self._stale_snapshot()) is not None:
+                self.async_set_updated_data(stale)
+                return
+            self.async_set_update_error(
+                fleet.last_exception or UpdateFailed("Fleet update failed")
+            )
+            return
+        asset_id = self.config_entry.runtime_data.asset_id
+        if (snapshot := fleet.data.get(asset_id)) is None:
+            self.async_set_update_error(
+                UpdateFailed(f"Asset {asset_id} missing from fleet response")
+            )
+            return
+        if not snapshot.stale:
+            self._fresh_at = dt_util.utcnow()
+        if self.last_update_success and snapshot == self.data:
+            return
+        self.async_set_updated_data(snapshot)
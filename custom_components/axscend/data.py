@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, fields, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
     from .api import AxscendApiClient
     from .coordinator import AxscendDataUpdateCoordinator
+    from .fleet import AxscendFleetCoordinator
+    from .history import TrackHistory
+    from .polling import PollingOptions
 
 
 type AxscendConfigEntry = ConfigEntry[AxscendData]
@@ -25,4 +30,140 @@ class AxscendData:
     coordinator: AxscendDataUpdateCoordinator
     integration: Integration
     asset_id: str
-    session: ClientSession
+    polling: PollingOptions
+    history: TrackHistory
+    fleet: AxscendFleetCoordinator | None = None
+
+
+def _parse_float(value: Any) -> float | None:
+    """Parse a coordinate."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_battery(value: Any) -> int | float | None:
+    """Parse a battery percentage, keeping whole numbers as int."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return _parse_float(value)
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse a timestamp in the format "2026-01-29 21:23:24" (UTC)."""
+    if not value:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp
+
+
+@dataclass(frozen=True, slots=True)
+class AssetSnapshot:
+    """
+    Parsed, immutable view of one asset.
+
+    Built once per API response so entities only read typed attributes.
+    """
+
+    asset_id: str
+    name: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    last_movement: datetime | None = None
+    last_position: datetime | None = None
+    battery: int | float | None = None
+    # Served again while the API is unreachable
+    stale: bool = False
+
+    @classmethod
+    def from_api(cls, asset_id: str, response: Mapping[str, Any]) -> AssetSnapshot:
+        """Build a snapshot from an asset response of the API."""
+        asset = response.get("asset") or {}
+        return cls(
+            asset_id=asset_id,
+            name=asset.get("name") or None,
+            latitude=_parse_float(asset.get("gps_latitude")),
+            longitude=_parse_float(asset.get("gps_longitude")),
+            last_movement=_parse_timestamp(asset.get("last_movement_timestamp")),
+            last_position=_parse_timestamp(asset.get("last_position_timestamp")),
+            battery=_parse_battery(asset.get("batt_percent")),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AssetSnapshot:
+        """Build a snapshot from the output of `as_dict`."""
+        return cls(
+            asset_id=data["asset_id"],
+            name=data.get("name"),
+            latitude=data.get("latitude"),
+            longitude=data.get("longitude"),
+            last_movement=_parse_timestamp(data.get("last_movement")),
+            last_position=_parse_timestamp(data.get("last_position")),
+            battery=data.get("battery"),
+            stale=data.get("stale", False),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as JSON serializable data."""
+        return {
+            name: value.isoformat() if isinstance(value, datetime) else value
+            for name in SNAPSHOT_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+    def merge_api(self, response: Mapping[str, Any]) -> AssetSnapshot:
+        """Return a fresh copy updated with the fields a partial response has."""
+        asset = response.get("asset") or {}
+        update = AssetSnapshot.from_api(self.asset_id, response)
+        return replace(
+            self,
+            stale=False,
+            **{
+                name: getattr(update, name)
+                for key, name in _API_FIELDS.items()
+                if key in asset
+            },
+        )
+
+    def as_stale(self) -> AssetSnapshot:
+        """Return a copy marked as served from the last good response."""
+        return self if self.stale else replace(self, stale=True)
+
+    @property
+    def has_position(self) -> bool:
+        """Return true if the snapshot carries a GPS fix."""
+        return self.latitude is not None and self.longitude is not None
+
+    def changed_fields(self, previous: AssetSnapshot | None) -> set[str]:
+        """Return the names of the fields that differ from a previous snapshot."""
+        if previous is None:
+            return set(SNAPSHOT_FIELDS)
+        return {
+            name
+            for name in SNAPSHOT_FIELDS
+            if getattr(self, name) != getattr(previous, name)
+        }
+
+
+SNAPSHOT_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(AssetSnapshot))
+
+# Snapshot field parsed from each key of an API asset
+_API_FIELDS = {
+    "name": "name",
+    "gps_latitude": "latitude",
+    "gps_longitude": "longitude",
+    "last_movement_timestamp": "last_movement",
+    "last_position_timestamp": "last_position",
+    "batt_percent": "battery",
+}
@@ -0,0 +1,116 @@
+"""Device tracker platform for axscend."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.device_tracker import TrackerEntity
+from homeassistant.const import STATE_HOME, STATE_NOT_HOME
+from homeassistant.helpers.entity import EntityDescription
+
+from .entity import AxscendEntity
+from .geofence import HOME_ZONE
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import AxscendDataUpdateCoordinator
+    from .data import AxscendConfigEntry
+
+ATTR_ASSET_NAME = "asset_name"
+ATTR_STALE = "stale"
+
+ENTITY_DESCRIPTION = EntityDescription(
+    key="location",
+    name="Location",
+    icon="mdi:map-marker",
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: AxscendConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the device_tracker platform."""
+    async_add_entities(
+        [
+            AxscendDeviceTracker(
+                coordinator=entry.runtime_data.coordinator,
+                entity_description=ENTITY_DESCRIPTION,
+            )
+        ]
+    )
+
+
+class AxscendDeviceTracker(AxscendEntity, TrackerEntity):
+    """
+    Axscend device tracker carrying the position of the asset.
+
+    One state row holds both coordinates and the battery level, where separate
+    sensors would write a row each.
+    """
+
+    # The asset name rarely changes; keep it out of every recorded state
+    _unrecorded_attributes = frozenset({ATTR_ASSET_NAME})
+
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: EntityDescription,
+    ) -> None:
+        """Initialize the device tracker class."""
+        super().__init__(
+            coordinator,
+            frozenset(
+                {"name", "latitude", "longitude", "battery", "stale", "presence"}
+            ),
+        )
+        self.entity_description = entity_description
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
+        )
+
+    @property
+    def force_update(self) -> bool:
+        """Write the state only when it changed."""
+        return False
+
+    @property
+    def latitude(self) -> float | None:
+        """Return the latitude of the asset."""
+        return self.coordinator.data.latitude if self.coordinator.data else None
+
+    @property
+    def longitude(self) -> float | None:
+        """Return the longitude of the asset."""
+        return self.coordinator.data.longitude if self.coordinator.data else None
+
+    @property
+    def battery_level(self) -> int | None:
+        """Return the battery level of the tracker."""
+        if not self.coordinator.data or self.coordinator.data.battery is None:
+            return None
+        return round(self.coordinator.data.battery)
+
+    @property
+    def location_name(self) -> str | None:
+        """Return the zone from the geofence engine, which knows custom zones."""
+        if not self.coordinator.data or not self.coordinator.data.has_position:
+            return None
+        presence = self.coordinator.presence
+        if presence.active_zone == HOME_ZONE:
+            return STATE_HOME
+        return presence.active_zone_name or STATE_NOT_HOME
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str | bool | None]:
+        """Return the asset name and whether the API could not be reached."""
+        snapshot = self.coordinator.data
+        return {
+            ATTR_ASSET_NAME: snapshot.name if snapshot else None,
+            ATTR_STALE: snapshot.stale if snapshot else False,
+        }
@@ -0,0 +1,100 @@
+"""Diagnostics support for axscend."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import (
+    CONF_API_TOKEN,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_WEBHOOK_ID,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_WEBHOOK_SECRET, CONF_ZONES
+from .scheduler import async_get_poll_scheduler
+from .session import async_get_session_pool
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import AxscendConfigEntry
+
+TO_REDACT = {
+    CONF_API_TOKEN,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    CONF_ZONES,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: AxscendConfigEntry,
+) -> dict[str, Any]:
+    """
+    Return diagnostics for a config entry.
+
+    Request and poll metrics show whether slowness comes from the Axscend API,
+    the network or Home Assistant. The token, webhook and positions are
+    redacted.
+    """
+    runtime_data = entry.runtime_data
+    coordinator = runtime_data.coordinator
+    fleet = runtime_data.fleet
+    client = fleet.client if fleet is not None else runtime_data.client
+    fresh_at = coordinator.fresh_at
+    rate_limiter = client.rate_limiter
+    breakers = async_get_session_pool(hass).breakers
+    scheduler = async_get_poll_scheduler(hass)
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "fleet_mode": fleet is not None,
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception),
+            "update_interval": str(coordinator.update_interval),
+            "fresh_at": fresh_at.isoformat() if fresh_at else None,
+            "data_age": (
+                (dt_util.utcnow() - fresh_at).total_seconds() if fresh_at else None
+            ),
+            "snapshot": (
+                async_redact_data(coordinator.data.as_dict(), TO_REDACT)
+                if coordinator.data is not None
+                else None
+            ),
+        },
+        "poll": coordinator.poll_metrics.as_dict(),
+        "api": client.metrics.as_dict(),
+        "single_flight": {
+            "coalesced": client.single_flight.coalesced,
+            "cache_hits": client.single_flight.cache_hits,
+        },
+        "rate_limiter": (
+            {
+                "tokens": rate_limiter.tokens,
+                "queue_depth": rate_limiter.queue_depth,
+                "acquired": rate_limiter.acquired,
+                "last_wait": rate_limiter.last_wait,
+                "total_wait": rate_limiter.total_wait,
+            }
+            if rate_limiter is not None
+            else None
+        ),
+        "scheduler": {
+            "limit": scheduler.limit,
+            "active": scheduler.active,
+            "waiting": scheduler.waiting,
+        },
+        "circuit_breakers": {
+            breaker.host: {"open": breaker.is_open, "failures": breaker.failures}
+            for breaker in breakers
+        },
+    }
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
 from .coordinator import AxscendDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
 
 class AxscendEntity(CoordinatorEntity[AxscendDataUpdateCoordinator]):
     """Axscend base entity class."""
 
     _attr_attribution = ATTRIBUTION
 
-    def __init__(self, coordinator: AxscendDataUpdateCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        fields: AbstractSet[str] | None = None,
+    ) -> None:
+        """
+        Initialize.
+
+        `fields` are the asset fields the entity reads; the coordinator only
+        wakes the entity when one of them changes.
+        """
+        super().__init__(coordinator, fields)
         asset_id = coordinator.config_entry.runtime_data.asset_id
         self._attr_device_info = DeviceInfo(
             identifiers={
@@ -0,0 +1,289 @@
+"""Track export for axscend."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from http import HTTPStatus
+from itertools import batched
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape, quoteattr
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
+
+from .api import AxscendApiClientError
+from .const import (
+    DOMAIN,
+    EXPORT_CHUNK_POINTS,
+    EXPORT_DEFAULT_RANGE,
+    EXPORT_MAX_RANGE,
+    EXPORT_URL,
+    LOGGER,
+)
+from .history import TrackPoint, douglas_peucker
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import AxscendConfigEntry
+
+FORMAT_GEOJSON = "geojson"
+FORMAT_GPX = "gpx"
+
+
+@dataclass(frozen=True, slots=True)
+class ExportQuery:
+    """What part of a track to export, and how."""
+
+    start: datetime
+    end: datetime
+    format: str = FORMAT_GEOJSON
+    # Meters a point may be off the simplified track, none to keep every point
+    simplify: float | None = None
+    # Min longitude, min latitude, max longitude and max latitude
+    bbox: tuple[float, float, float, float] | None = None
+
+    @classmethod
+    def from_query(cls, query: Mapping[str, str]) -> ExportQuery:
+        """Parse the query string of a request, raising ValueError if invalid."""
+        end = _parse_datetime(query, "end") or dt_util.utcnow()
+        start = _parse_datetime(query, "start") or end - EXPORT_DEFAULT_RANGE
+        if start >= end:
+            msg = "start must be before end"
+            raise ValueError(msg)
+        if end - start > EXPORT_MAX_RANGE:
+            msg = f"The range must be at most {EXPORT_MAX_RANGE.days} days"
+            raise ValueError(msg)
+        if (file_format := query.get("format", FORMAT_GEOJSON)) not in (
+            FORMAT_GEOJSON,
+            FORMAT_GPX,
+        ):
+            msg = f"format must be {FORMAT_GEOJSON} or {FORMAT_GPX}"
+            raise ValueError(msg)
+        simplify = float(query["simplify"]) if "simplify" in query else None
+        if simplify is not None and not simplify > 0:
+            msg = "simplify must be a positive number of meters"
+            raise ValueError(msg)
+        bbox = None
+        if "bbox" in query:
+            min_lon, min_lat, max_lon, max_lat = map(float, query["bbox"].split(","))
+            if min_lon > max_lon or min_lat > max_lat:
+                msg = "bbox must be min_lon,min_lat,max_lon,max_lat"
+                raise ValueError(msg)
+            bbox = (min_lon, min_lat, max_lon, max_lat)
+        return cls(start, end, file_format, simplify, bbox)
+
+    def apply(self, points: list[TrackPoint]) -> list[TrackPoint]:
+        """Return the points of a chunk inside the box, simplified if asked."""
+        if self.bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = self.bbox
+            points = [
+                point
+                for point in points
+                if min_lat <= point.latitude <= max_lat
+                and min_lon <= point.longitude <= max_lon
+            ]
+        if self.simplify is not None:
+            keep = douglas_peucker(
+                array("d", (point.latitude for point in points)),
+                array("d", (point.longitude for point in points)),
+                self.simplify,
+            )
+            points = [points[index] for index in keep]
+        return points
+
+
+def _parse_datetime(query: Mapping[str, str], key: str) -> datetime | None:
+    """Return a moment of the query string in UTC, if given."""
+    if (value := query.get(key)) is None:
+        return None
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        msg = f"{key} must be an ISO 8601 date and time"
+        raise ValueError(msg)
+    return dt_util.as_utc(parsed)
+
+
+class _GeoJsonWriter:
+    """Write a track as a GeoJSON feature collection of timed points."""
+
+    content_type = "application/geo+json"
+    extension = "geojson"
+
+    def __init__(self, name: str) -> None:
+        """Initialize before the first point."""
+        self._name = name
+        self._separator = ""
+
+    def header(self) -> str:
+        """Return the text before the points."""
+        return (
+            '{"type":"FeatureCollection",'
+            f'"properties":{{"name":{json_dumps(self._name)}}},"features":['
+        )
+
+    def points(self, points: list[TrackPoint]) -> str:
+        """Return the text of a chunk of points."""
+        parts = []
+        for point in points:
+            feature = {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [point.longitude, point.latitude],
+                },
+                "properties": {
+                    "time": point.timestamp.isoformat(),
+                    "battery": point.battery,
+                },
+            }
+            parts.append(f"{self._separator}{json_dumps(feature)}")
+            self._separator = ","
+        return "".join(parts)
+
+    def footer(self) -> str:
+        """Return the text after the points."""
+        return "]}\n"
+
+
+class _GpxWriter:
+    """Write a track as a GPX 1.1 track of one segment."""
+
+    content_type = "application/gpx+xml"
+    extension = "gpx"
+
+    def __init__(self, name: str) -> None:
+        """Initialize before the first point."""
+        self._name = name
+
+    def header(self) -> str:
+        """Return the text before the points."""
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<gpx version="1.1" creator="Axscend Integration" '
+            'xmlns="http://www.topografix.com/GPX/1/1">\n'
+            f"<trk><name>{escape(self._name)}</name><trkseg>\n"
+        )
+
+    def points(self, points: list[TrackPoint]) -> str:
+        """Return the text of a chunk of points."""
+        return "".join(
+            f"<trkpt lat={quoteattr(str(point.latitude))} "
+            f"lon={quoteattr(str(point.longitude))}>"
+            f"<time>{point.timestamp.isoformat()}</time></trkpt>\n"
+            for point in points
+        )
+
+    def footer(self) -> str:
+        """Return the text after the points."""
+        return "</trkseg></trk></gpx>\n"
+
+
+async def async_iter_track(
+    entry: AxscendConfigEntry, start: datetime, end: datetime
+) -> AsyncIterator[list[TrackPoint]]:
+    """
+    Yield the track of an asset between two moments in chunks, oldest first.
+
+    The part older than the local track history is streamed from the API's
+    history page by page, the rest is read from the local track. At most a
+    page of readings is held at once.
+    """
+    runtime_data = entry.runtime_data
+    asset_id = runtime_data.asset_id
+    local_start = runtime_data.history.buffer.first_timestamp
+    if local_start is None or start.timestamp() < local_start:
+        api_end = end
+        if local_start is not None:
+            api_end = min(end, dt_util.utc_from_timestamp(local_start))
+        async for page in runtime_data.client.async_iter_history(
+            asset_id, start, api_end
+        ):
+            points = [
+                point
+                for reading in page
+                if (point := TrackPoint.from_reading(asset_id, reading)) is not None
+                and start <= point.timestamp <= api_end
+                and (local_start is None or point.timestamp.timestamp() < local_start)
+            ]
+            for chunk in batched(points, EXPORT_CHUNK_POINTS, strict=False):
+                yield list(chunk)
+    for chunk in batched(
+        runtime_data.history.buffer.iter_points(start, end),
+        EXPORT_CHUNK_POINTS,
+        strict=False,
+    ):
+        yield list(chunk)
+
+
+def _loaded_entry(hass: HomeAssistant, asset_id: str) -> AxscendConfigEntry | None:
+    """Return the loaded entry of an asset."""
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        if entry.runtime_data.asset_id == asset_id:
+            return entry
+    return None
+
+
+class AxscendTrackView(HomeAssistantView):
+    """
+    Stream the track of an asset as GeoJSON or GPX.
+
+    The document is written chunk by chunk with chunked transfer encoding,
+    so long periods are never built in memory, and each chunk awaits the
+    client before the next is read.
+    """
+
+    url = EXPORT_URL
+    name = f"api:{DOMAIN}:track"
+
+    async def get(self, request: web.Request, asset_id: str) -> web.StreamResponse:
+        """Export the track of an asset."""
+        hass = request.app[KEY_HASS]
+        if (entry := _loaded_entry(hass, asset_id)) is None:
+            return self.json_message(
+                f"Asset {asset_id} is not set up", HTTPStatus.NOT_FOUND
+            )
+        try:
+            query = ExportQuery.from_query(request.query)
+        except ValueError as exception:
+            return self.json_message(str(exception), HTTPStatus.BAD_REQUEST)
+        writer = (_GpxWriter if query.format == FORMAT_GPX else _GeoJsonWriter)(
+            entry.title
+        )
+        chunks = async_iter_track(entry, query.start, query.end)
+        # Read ahead so an unreachable API is still reported with a status
+        try:
+            first = await anext(chunks, [])
+        except AxscendApiClientError as exception:
+            return self.json_message(str(exception), HTTPStatus.BAD_GATEWAY)
+
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: writer.content_type,
+                hdrs.CONTENT_DISPOSITION: (
+                    f'attachment; filename="{DOMAIN}-{asset_id}.{writer.extension}"'
+                ),
+            }
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(writer.header().encode())
+        await response.write(writer.points(query.apply(first)).encode())
+        try:
+            async for chunk in chunks:
+                await response.write(writer.points(query.apply(chunk)).encode())
+        except AxscendApiClientError as exception:
+            # Too late for an error status; leave the document unterminated
+            LOGGER.warning("Track export of asset %s failed: %s", asset_id, exception)
+            response.force_close()
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write(writer.footer().encode())
+        await response.write_eof()
+        return response
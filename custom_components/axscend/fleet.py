@@ -0,0 +1,206 @@
+"""Fleet mode: one coordinator polls every asset that shares an API token."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .api import (
+    AxscendApiClient,
+    AxscendApiClientAuthenticationError,
+    AxscendApiClientCommunicationError,
+    AxscendApiClientError,
+)
+from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN, LOGGER, STALE_SNAPSHOT_MAX_AGE
+from .data import AssetSnapshot
+from .metrics import PollMetrics
+from .polling import next_update_interval, retry_interval
+from .profiler import async_get_active_profiler
+from .scheduler import (
+    PhasedDataUpdateCoordinator,
+    async_get_poll_scheduler,
+    poll_phase,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+    from typing import Any
+
+    from homeassistant.core import HomeAssistant
+
+    from .polling import PollingOptions
+
+DATA_FLEETS: HassKey[dict[str, AxscendFleetCoordinator]] = HassKey(f"{DOMAIN}_fleets")
+
+
+class AxscendFleetCoordinator(PhasedDataUpdateCoordinator[dict[str, AssetSnapshot]]):
+    """Poll every asset of an API token in batched requests."""
+
+    def __init__(self, hass: HomeAssistant, client: AxscendApiClient) -> None:
+        """Initialize the fleet coordinator."""
+        super().__init__(
+            hass=hass,
+            logger=LOGGER,
+            config_entry=None,
+            name=f"{DOMAIN}_fleet",
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            always_update=False,
+        )
+        self.client = client
+        self.assets: dict[str, PollingOptions] = {}
+        self._intervals: dict[str, timedelta] = {}
+        self._fetch_lock = asyncio.Lock()
+        self._fresh_at: datetime | None = None
+        self.metrics = PollMetrics()
+        self._phase = poll_phase(client.api_token)
+        # Set by a manual refresh so its fetch skips ahead of scheduled ones
+        self._priority_refresh = False
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh, tracing every stage while the pipeline is being profiled."""
+        if (profiler := async_get_active_profiler(self.hass)) is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+        with profiler.trace(f"fleet of {len(self.assets)} assets") as trace:
+            await super()._async_refresh(*args, **kwargs)
+            trace.success = self.last_update_success
+
+    async def _async_update_data(self) -> dict[str, AssetSnapshot]:
+        """Fetch every asset of the fleet, measuring every refresh."""
+        start = time.monotonic()
+        success = False
+        try:
+            snapshots = await self._async_fetch_snapshots()
+            success = not any(snapshot.stale for snapshot in snapshots.values())
+            return snapshots
+        finally:
+            self.metrics.record_poll(time.monotonic() - start, success=success)
+
+    async def _async_fetch_snapshots(self) -> dict[str, AssetSnapshot]:
+        """Fetch every asset of the fleet, serving stale data while it is fresh."""
+        priority, self._priority_refresh = self._priority_refresh, False
+        try:
+            async with async_get_poll_scheduler(self.hass).slot(priority=priority):
+                response = await self.client.async_get_assets(self.assets)
+            LOGGER.debug(
+                "Fleet fetched %s of %s assets", len(response), len(self.assets)
+            )
+        except AxscendApiClientAuthenticationError as exception:
+            LOGGER.warning("Authentication failed during fleet update: %s", exception)
+            raise ConfigEntryAuthFailed(exception) from exception
+        except AxscendApiClientCommunicationError as exception:
+            self.update_interval = retry_interval(
+                self.update_interval, exception.retry_after
+            )
+            if (
+                not self.data
+                or self._fresh_at is None
+                or dt_util.utcnow() - self._fresh_at > STALE_SNAPSHOT_MAX_AGE
+            ):
+                LOGGER.error("API error during fleet update: %s", exception)
+                raise UpdateFailed(exception) from exception
+            LOGGER.warning(
+                "Serving the last fleet data, API unreachable: %s", exception
+            )
+            return {
+                asset_id: snapshot.as_stale()
+                for asset_id, snapshot in self.data.items()
+            }
+        except AxscendApiClientError as exception:
+            LOGGER.error("API error during fleet update: %s", exception)
+            raise UpdateFailed(exception) from exception
+        else:
+            self._fresh_at = dt_util.utcnow()
+            snapshots = {
+                asset_id: AssetSnapshot.from_api(asset_id, payload)
+                for asset_id, payload in response.items()
+            }
+            self._update_intervals(snapshots)
+            return snapshots
+
+    def _update_intervals(self, snapshots: dict[str, AssetSnapshot]) -> None:
+        """Poll the fleet as often as its most active asset needs."""
+        previous = self.data or {}
+        for asset_id, snapshot in snapshots.items():
+            if (polling := self.assets.get(asset_id)) is None:
+                continue
+            self._intervals[asset_id] = next_update_interval(
+                polling,
+                self._intervals.get(asset_id, DEFAULT_UPDATE_INTERVAL),
+                snapshot,
+                previous.get(asset_id),
+            )
+        self.update_interval = min(
+            self._intervals.values(), default=DEFAULT_UPDATE_INTERVAL
+        )
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh, fetched ahead of scheduled ones."""
+        self._priority_refresh = True
+        await super().async_request_refresh()
+
+    def forget_asset(self, asset_id: str) -> None:
+        """Drop the cached state of an asset that left the fleet."""
+        self._intervals.pop(asset_id, None)
+        if self.data:
+            self.data.pop(asset_id, None)
+
+    async def async_fetch_asset(self, asset_id: str) -> AssetSnapshot:
+        """
+        Return the latest snapshot of an asset.
+
+        The fleet is only refreshed when the asset has not been fetched yet, so
+        entries that are set up together share one batched request.
+        """
+        async with self._fetch_lock:
+            if not self.data or asset_id not in self.data:
+                await self._async_refresh(log_failures=False)
+        if not self.last_update_success and self.last_exception is not None:
+            raise self.last_exception
+        if asset_id not in self.data:
+            msg = f"Asset {asset_id} missing from fleet response"
+            raise UpdateFailed(msg)
+        return self.data[asset_id]
+
+
+@callback
+def async_join_fleet(
+    hass: HomeAssistant,
+    client: AxscendApiClient,
+    asset_id: str,
+    polling: PollingOptions,
+) -> AxscendFleetCoordinator:
+    """
+    Add an asset to the fleet of its API token, creating the fleet if needed.
+
+    `client` becomes the client of a new fleet; an existing fleet keeps its own.
+    """
+    fleets = hass.data.setdefault(DATA_FLEETS, {})
+    if (fleet := fleets.get(client.api_token)) is None:
+        fleet = fleets[client.api_token] = AxscendFleetCoordinator(hass, client)
+    fleet.assets[asset_id] = polling
+    return fleet
+
+
+async def async_leave_fleet(
+    hass: HomeAssistant,
+    fleet: AxscendFleetCoordinator,
+    asset_id: str,
+) -> None:
+    """Remove an asset from its fleet, shutting the fleet down once empty."""
+    fleet.assets.pop(asset_id, None)
+    fleet.forget_asset(asset_id)
+    if fleet.assets:
+        return
+    fleets = hass.data.get(DATA_FLEETS, {})
+    for api_token, candidate in list(fleets.items()):
+        if candidate is fleet:
+            del fleets[api_token]
+    await fleet.async_shutdown()
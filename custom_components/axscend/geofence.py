@@ -0,0 +1,426 @@
+"""Geofence engine for axscend."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import (
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    EVENT_CORE_CONFIG_UPDATE,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.util import slugify
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    EVENT_ZONE_ENTER,
+    EVENT_ZONE_EXIT,
+    GEOFENCE_GRID_DEGREES,
+    GEOFENCE_HYSTERESIS_MIN,
+    GEOFENCE_HYSTERESIS_RATIO,
+    GEOFENCE_MAX_CELLS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        EventStateChangedData,
+        HomeAssistant,
+    )
+
+    from .data import AssetSnapshot
+
+DATA_GEOFENCE: HassKey[GeofenceManager] = HassKey(f"{DOMAIN}_geofence")
+
+EARTH_RADIUS = 6371000  # meters
+HOME_ZONE = "zone.home"
+_ATTR_RADIUS = "radius"
+_ATTR_PASSIVE = "passive"
+_ZONE_ATTRIBUTES = (ATTR_LATITUDE, ATTR_LONGITUDE, _ATTR_RADIUS, _ATTR_PASSIVE)
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculate distance between two GPS coordinates in meters.
+
+    Uses Haversine formula.
+    """
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = (
+        math.sin(delta_lat / 2) ** 2
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+    )
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS * c
+
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """A circular zone with its trigonometry precomputed."""
+
+    zone_id: str
+    name: str
+    latitude: float
+    longitude: float
+    radius: float
+    passive: bool
+    lat_rad: float
+    lon_rad: float
+    cos_lat: float
+
+    @classmethod
+    def create(  # noqa: PLR0913
+        cls,
+        zone_id: str,
+        name: str,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        *,
+        passive: bool = False,
+    ) -> Zone:
+        """Create a zone."""
+        lat_rad = math.radians(latitude)
+        return cls(
+            zone_id=zone_id,
+            name=name,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            passive=passive,
+            lat_rad=lat_rad,
+            lon_rad=math.radians(longitude),
+            cos_lat=math.cos(lat_rad),
+        )
+
+    @property
+    def margin(self) -> float:
+        """Return the hysteresis margin an asset must leave by before exiting."""
+        return max(GEOFENCE_HYSTERESIS_MIN, self.radius * GEOFENCE_HYSTERESIS_RATIO)
+
+    def distance(self, lat_rad: float, lon_rad: float, cos_lat: float) -> float:
+        """Return the distance in meters to a point given in radians."""
+        sin_dlat = math.sin((self.lat_rad - lat_rad) / 2)
+        sin_dlon = math.sin((self.lon_rad - lon_rad) / 2)
+        a = sin_dlat * sin_dlat + cos_lat * self.cos_lat * sin_dlon * sin_dlon
+        return 2 * EARTH_RADIUS * math.asin(math.sqrt(min(1.0, a)))
+
+
+def parse_custom_zones(text: str) -> tuple[Zone, ...]:
+    """
+    Parse custom zones, one "name, latitude, longitude, radius" per line.
+
+    Raises ValueError on malformed lines.
+    """
+    zones = []
+    for raw_line in text.splitlines():
+        if not (line := raw_line.strip()):
+            continue
+        name, latitude, longitude, radius = (part.strip() for part in line.split(","))
+        lat, lon, rad = float(latitude), float(longitude), float(radius)
+        if not name or not -90 <= lat <= 90 or not -180 <= lon <= 180 or rad <= 0:  # noqa: PLR2004
+            msg = f"Invalid zone: {line}"
+            raise ValueError(msg)
+        zones.append(Zone.create(f"{DOMAIN}.{slugify(name)}", name, lat, lon, rad))
+    return tuple(zones)
+
+
+class ZoneIndex:
+    """Grid index returning the zones that may contain a point."""
+
+    def __init__(self, zones: Iterable[Zone]) -> None:
+        """Index zones into grid cells by their bounding box."""
+        self.zones: dict[str, Zone] = {}
+        self._cells: defaultdict[tuple[int, int], list[Zone]] = defaultdict(list)
+        # Zones too large to index are checked for every point
+        self._wide: list[Zone] = []
+        for zone in zones:
+            self.zones[zone.zone_id] = zone
+            reach = math.degrees((zone.radius + zone.margin) / EARTH_RADIUS)
+            lat_reach = reach
+            lon_reach = reach / max(zone.cos_lat, 0.01)
+            if (
+                zone.longitude - lon_reach < -180  # noqa: PLR2004
+                or zone.longitude + lon_reach > 180  # noqa: PLR2004
+            ):
+                self._wide.append(zone)
+                continue
+            rows = range(
+                _cell(zone.latitude - lat_reach), _cell(zone.latitude + lat_reach) + 1
+            )
+            cols = range(
+                _cell(zone.longitude - lon_reach), _cell(zone.longitude + lon_reach) + 1
+            )
+            if len(rows) * len(cols) > GEOFENCE_MAX_CELLS:
+                self._wide.append(zone)
+                continue
+            for row in rows:
+                for col in cols:
+                    self._cells[(row, col)].append(zone)
+
+    def candidates(self, latitude: float, longitude: float) -> list[Zone]:
+        """Return the zones whose bounding box covers a point."""
+        cell = self._cells.get((_cell(latitude), _cell(longitude)))
+        if cell is None:
+            return self._wide
+        return [*cell, *self._wide] if self._wide else cell
+
+
+def _cell(degrees: float) -> int:
+    """Return the grid row or column of a coordinate."""
+    return math.floor(degrees / GEOFENCE_GRID_DEGREES)
+
+
+@dataclass(frozen=True, slots=True)
+class Presence:
+    """Zones an asset is in."""
+
+    zones: frozenset[str] = frozenset()
+    # Closest non-passive zone, like the zone of a device tracker
+    active_zone: str | None = None
+    active_zone_name: str | None = None
+
+
+@dataclass(slots=True)
+class _TrackedAsset:
+    """Geofence state of one asset."""
+
+    custom_zones: tuple[Zone, ...]
+    update_callback: Callable[[Presence], None]
+    position: tuple[float, float] | None = None
+    presence: Presence = field(default_factory=Presence)
+    # The first evaluation sets the presence without announcing it
+    evaluated: bool = False
+
+
+class GeofenceManager:
+    """
+    Evaluate asset positions against every zone.
+
+    Zones are the Home Assistant zone entities plus optional per-asset custom
+    zones. Evaluation runs when coordinators hand over new snapshots, not on
+    state reads, and again whenever the zones themselves change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self._hass = hass
+        self._index: ZoneIndex | None = None
+        self._assets: dict[str, _TrackedAsset] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_register(
+        self,
+        asset_id: str,
+        custom_zones: tuple[Zone, ...],
+        update_callback: Callable[[Presence], None],
+    ) -> CALLBACK_TYPE:
+        """Track an asset; `update_callback` is called when its presence changes."""
+        if not self._assets:
+            self._async_start()
+        self._assets[asset_id] = _TrackedAsset(custom_zones, update_callback)
+
+        @callback
+        def _async_unregister() -> None:
+            self._assets.pop(asset_id, None)
+            if not self._assets:
+                self._async_stop()
+
+        return _async_unregister
+
+    @callback
+    def async_presence(self, asset_id: str) -> Presence:
+        """Return the current presence of an asset."""
+        if (tracked := self._assets.get(asset_id)) is None:
+            return Presence()
+        return tracked.presence
+
+    @callback
+    def async_update(self, snapshots: Iterable[AssetSnapshot]) -> None:
+        """Evaluate new snapshots against every zone in one pass."""
+        index = self._async_get_index()
+        for snapshot in snapshots:
+            if (tracked := self._assets.get(snapshot.asset_id)) is None:
+                continue
+            if not snapshot.has_position:
+                continue
+            position = (snapshot.latitude, snapshot.longitude)
+            # Zone changes re-evaluate on their own, so a parked asset is skipped
+            if position == tracked.position:
+                continue
+            tracked.position = position
+            self._async_evaluate(index, snapshot.asset_id, tracked)
+
+    @callback
+    def _async_start(self) -> None:
+        """Start following zone changes."""
+        tracker = async_track_state_change_filtered(
+            self._hass,
+            TrackStates(all_states=False, entities=set(), domains={"zone"}),
+            self._async_zone_changed,
+        )
+        self._unsubs = [
+            tracker.async_remove,
+            self._hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_zones_changed
+            ),
+        ]
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop following zone changes."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self._index = None
+
+    @callback
+    def _async_zone_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle a zone state change, ignoring changes of its person count."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.name == new_state.name
+            and all(
+                old_state.attributes.get(attribute)
+                == new_state.attributes.get(attribute)
+                for attribute in _ZONE_ATTRIBUTES
+            )
+        ):
+            return
+        self._async_zones_changed(event)
+
+    @callback
+    def _async_zones_changed(self, _event: Event[Any]) -> None:
+        """Rebuild the index and re-evaluate every asset."""
+        self._index = None
+        index = self._async_get_index()
+        for asset_id, tracked in list(self._assets.items()):
+            self._async_evaluate(index, asset_id, tracked)
+
+    @callback
+    def _async_get_index(self) -> ZoneIndex:
+        """Return the zone index, building it if needed."""
+        if self._index is None:
+            self._index = ZoneIndex(self._async_load_zones())
+        return self._index
+
+    @callback
+    def _async_load_zones(self) -> list[Zone]:
+        """Read the zone entities, falling back to the core home location."""
+        zones = []
+        for state in self._hass.states.async_all("zone"):
+            try:
+                zones.append(
+                    Zone.create(
+                        state.entity_id,
+                        state.name,
+                        float(state.attributes[ATTR_LATITUDE]),
+                        float(state.attributes[ATTR_LONGITUDE]),
+                        float(state.attributes.get(_ATTR_RADIUS, 0)),
+                        passive=bool(state.attributes.get(_ATTR_PASSIVE, False)),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        config = self._hass.config
+        if (
+            HOME_ZONE not in {zone.zone_id for zone in zones}
+            and config.latitude is not None
+            and config.longitude is not None
+        ):
+            zones.append(
+                Zone.create(
+                    HOME_ZONE,
+                    config.location_name,
+                    config.latitude,
+                    config.longitude,
+                    config.radius if config.radius is not None else 100,
+                )
+            )
+        return zones
+
+    @callback
+    def _async_evaluate(
+        self, index: ZoneIndex, asset_id: str, tracked: _TrackedAsset
+    ) -> None:
+        """
+        Evaluate one asset and announce zone changes.
+
+        The first evaluation after registering only sets the presence, so a
+        restart or reload does not announce entering the zones the asset is
+        already in.
+        """
+        previous = tracked.presence
+        if tracked.position is None:
+            return
+        announce, tracked.evaluated = tracked.evaluated, True
+        latitude, longitude = tracked.position
+        lat_rad = math.radians(latitude)
+        lon_rad = math.radians(longitude)
+        cos_lat = math.cos(lat_rad)
+        inside: set[str] = set()
+        active: Zone | None = None
+        active_key = (math.inf, math.inf)
+        for zone in chain(index.candidates(latitude, longitude), tracked.custom_zones):
+            distance = zone.distance(lat_rad, lon_rad, cos_lat)
+            # An asset already inside only exits beyond the hysteresis margin
+            limit = zone.radius + (zone.margin if zone.zone_id in previous.zones else 0)
+            if distance > limit:
+                continue
+            inside.add(zone.zone_id)
+            if not zone.passive and (distance, zone.radius) < active_key:
+                active, active_key = zone, (distance, zone.radius)
+
+        presence = Presence(
+            zones=frozenset(inside),
+            active_zone=active.zone_id if active else None,
+            active_zone_name=active.name if active else None,
+        )
+        if presence == previous:
+            return
+        tracked.presence = presence
+        if not announce:
+            tracked.update_callback(presence)
+            return
+        zones = index.zones | {zone.zone_id: zone for zone in tracked.custom_zones}
+        for event_type, changed in (
+            (EVENT_ZONE_EXIT, previous.zones - presence.zones),
+            (EVENT_ZONE_ENTER, presence.zones - previous.zones),
+        ):
+            for zone_id in changed:
+                zone = zones.get(zone_id)
+                self._hass.bus.async_fire(
+                    event_type,
+                    {
+                        "asset_id": asset_id,
+                        "zone": zone_id,
+                        "zone_name": zone.name if zone else zone_id,
+                    },
+                )
+        tracked.update_callback(presence)
+
+
+@callback
+def async_get_geofence(hass: HomeAssistant) -> GeofenceManager:
+    """Return the geofence manager for this Home Assistant instance."""
+    if (manager := hass.data.get(DATA_GEOFENCE)) is None:
+        manager = hass.data[DATA_GEOFENCE] = GeofenceManager(hass)
+    return manager
@@ -0,0 +1,421 @@
+"""Compact track history for axscend."""
+
+from __future__ import annotations
+
+import base64
+import math
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HISTORY_MAX_POINTS,
+    HISTORY_SAVE_DELAY,
+    HISTORY_SIMPLIFY_TOLERANCE,
+)
+from .data import AssetSnapshot
+from .geofence import EARTH_RADIUS
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Iterable, Iterator, Mapping
+    from datetime import datetime, timedelta
+
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+
+# Array typecodes of the stored columns
+_COLUMNS = {"timestamps": "d", "latitudes": "d", "longitudes": "d", "batteries": "f"}
+
+
+@dataclass(frozen=True, slots=True)
+class TrackPoint:
+    """A position of an asset."""
+
+    timestamp: datetime
+    latitude: float
+    longitude: float
+    battery: float | None
+
+    @classmethod
+    def from_reading(
+        cls, asset_id: str, reading: Mapping[str, Any]
+    ) -> TrackPoint | None:
+        """Return the position of an API history reading, if it has one."""
+        snapshot = AssetSnapshot.from_api(asset_id, {"asset": reading})
+        if not snapshot.has_position or snapshot.last_position is None:
+            return None
+        return cls(
+            timestamp=snapshot.last_position,
+            latitude=snapshot.latitude,
+            longitude=snapshot.longitude,
+            battery=snapshot.battery,
+        )
+
+
+def _offset_from_segment(
+    point: tuple[float, float],
+    start: tuple[float, float],
+    end: tuple[float, float],
+) -> float:
+    """
+    Return the distance in meters from a point to a segment.
+
+    Uses an equirectangular projection, which is accurate at the scale of
+    consecutive GPS fixes.
+    """
+    scale = math.cos(math.radians(start[0]))
+    px = (point[1] - start[1]) * scale
+    py = point[0] - start[0]
+    ex = (end[1] - start[1]) * scale
+    ey = end[0] - start[0]
+    length = ex * ex + ey * ey
+    t = 0.0 if length == 0 else max(0.0, min(1.0, (px * ex + py * ey) / length))
+    return math.radians(math.hypot(px - t * ex, py - t * ey)) * EARTH_RADIUS
+
+
+def douglas_peucker(
+    latitudes: array[float], longitudes: array[float], tolerance: float
+) -> list[int]:
+    """Return the indexes of the points a simplified track keeps, in order."""
+    count = len(latitudes)
+    if count < 3:  # noqa: PLR2004
+        return list(range(count))
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        start = (latitudes[first], longitudes[first])
+        end = (latitudes[last], longitudes[last])
+        farthest, offset = 0, tolerance
+        for index in range(first + 1, last):
+            distance = _offset_from_segment(
+                (latitudes[index], longitudes[index]), start, end
+            )
+            if distance > offset:
+                farthest, offset = index, distance
+        if farthest:
+            keep[farthest] = True
+            stack.extend(((first, farthest), (farthest, last)))
+    return [index for index, kept in enumerate(keep) if kept]
+
+
+class TrackBuffer:
+    """
+    Track of one asset in typed arrays of bounded size.
+
+    Points are kept in time order in one array per column, about 28 bytes a
+    point. A point that lies on the line between its neighbours is replaced
+    by the next one as it arrives, so a parked asset keeps only its arrival
+    and latest fix. Once full, the whole track is simplified and the oldest
+    points are dropped if that is not enough; the owner does this with
+    `compact`, simplifying off the event loop.
+    """
+
+    def __init__(
+        self, retention: timedelta, capacity: int = HISTORY_MAX_POINTS
+    ) -> None:
+        """Initialize an empty track."""
+        self.retention = retention
+        self.capacity = capacity
+        self.timestamps = array("d")
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        # NaN marks an unknown battery level
+        self.batteries = array("f")
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.timestamps)
+
+    @property
+    def first_timestamp(self) -> float | None:
+        """Return the POSIX timestamp of the oldest point."""
+        return self.timestamps[0] if self.timestamps else None
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the POSIX timestamp of the latest point."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def append(
+        self,
+        timestamp: float,
+        latitude: float,
+        longitude: float,
+        battery: float | None,
+    ) -> bool:
+        """Add a point newer than the latest one; return true if it was added."""
+        if self.timestamps and timestamp <= self.timestamps[-1]:
+            return False
+        if len(self) >= 2 and (  # noqa: PLR2004
+            _offset_from_segment(
+                (self.latitudes[-1], self.longitudes[-1]),
+                (self.latitudes[-2], self.longitudes[-2]),
+                (latitude, longitude),
+            )
+            <= HISTORY_SIMPLIFY_TOLERANCE
+        ):
+            self._pop()
+        elif len(self) >= self.capacity + self.capacity // 10:
+            # Compaction is left to the executor; until it runs, stay bounded
+            self._drop_oldest(1)
+        self.timestamps.append(timestamp)
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+        self.batteries.append(math.nan if battery is None else battery)
+        self.prune(timestamp)
+        return True
+
+    def merge(self, points: Iterable[TrackPoint]) -> int:
+        """
+        Add points from any period, such as a filled gap; return how many.
+
+        Points at the moment of an existing one are skipped. New points are
+        spliced in between slices of the columns, so the track is copied once
+        rather than rebuilt point by point. The track may be left over
+        capacity; `compact` makes room again.
+        """
+        rows = sorted(
+            {
+                point.timestamp.timestamp(): (
+                    point.latitude,
+                    point.longitude,
+                    math.nan if point.battery is None else point.battery,
+                )
+                for point in points
+            }.items()
+        )
+        inserts = []
+        for timestamp, row in rows:
+            index = bisect_left(self.timestamps, timestamp)
+            if index < len(self) and self.timestamps[index] == timestamp:
+                continue
+            inserts.append((index, timestamp, row))
+        if not inserts:
+            return 0
+        if inserts[0][0] == len(self):
+            # Points newer than the whole track extend it in place
+            for _, timestamp, row in inserts:
+                for name, value in zip(_COLUMNS, (timestamp, *row), strict=True):
+                    getattr(self, name).append(value)
+        else:
+            columns = {name: array(typecode) for name, typecode in _COLUMNS.items()}
+            copied = 0
+            for index, timestamp, row in inserts:
+                for name, value in zip(_COLUMNS, (timestamp, *row), strict=True):
+                    columns[name].extend(getattr(self, name)[copied:index])
+                    columns[name].append(value)
+                copied = index
+            for name, column in columns.items():
+                column.extend(getattr(self, name)[copied:])
+                setattr(self, name, column)
+        return len(inserts)
+
+    def prune(self, now: float) -> None:
+        """Drop the points that fell out of the retention window."""
+        if count := bisect_left(self.timestamps, now - self.retention.total_seconds()):
+            self._drop_oldest(count)
+
+    def points(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[TrackPoint]:
+        """Return the points between two moments, oldest first."""
+        return list(self.iter_points(start, end))
+
+    def iter_points(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[TrackPoint]:
+        """
+        Iterate over the points between two moments, oldest first.
+
+        The columns of the range are copied up front, so points added or
+        pruned while iterating do not shift it.
+        """
+        first = 0 if start is None else bisect_left(self.timestamps, start.timestamp())
+        last = (
+            len(self) if end is None else bisect_right(self.timestamps, end.timestamp())
+        )
+        columns = (
+            self.timestamps[first:last],
+            self.latitudes[first:last],
+            self.longitudes[first:last],
+            self.batteries[first:last],
+        )
+        return (
+            TrackPoint(
+                timestamp=dt_util.utc_from_timestamp(timestamp),
+                latitude=latitude,
+                longitude=longitude,
+                battery=None if math.isnan(battery) else battery,
+            )
+            for timestamp, latitude, longitude, battery in zip(*columns, strict=True)
+        )
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the columns as little-endian, base64 encoded bytes."""
+        data = {}
+        for name in _COLUMNS:
+            column = array(getattr(self, name).typecode, getattr(self, name))
+            if sys.byteorder == "big":
+                column.byteswap()
+            data[name] = base64.b64encode(column.tobytes()).decode()
+        return data
+
+    def load_dict(self, data: dict[str, str]) -> None:
+        """Replace the points with columns returned by `as_dict`."""
+        columns = {}
+        for name, typecode in _COLUMNS.items():
+            column = array(typecode)
+            column.frombytes(base64.b64decode(data.get(name, "")))
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns[name] = column
+        if len({len(column) for column in columns.values()}) != 1:
+            return
+        for name, column in columns.items():
+            setattr(self, name, column)
+        if len(self) > self.capacity:
+            self._drop_oldest(len(self) - self.capacity)
+
+    def _pop(self) -> None:
+        """Remove the latest point."""
+        for name in _COLUMNS:
+            getattr(self, name).pop()
+
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the oldest points."""
+        for name in _COLUMNS:
+            del getattr(self, name)[:count]
+
+    @property
+    def is_full(self) -> bool:
+        """Return true once the track is over capacity and should be compacted."""
+        return len(self) > self.capacity
+
+    def compact(self, keep: list[int]) -> None:
+        """
+        Make room in a full track, simplifying it before dropping points.
+
+        `keep` are the indexes of the points the simplified track keeps, as
+        returned by `douglas_peucker`; points past them are kept too.
+        """
+        if keep:
+            keep = [*keep, *range(keep[-1] + 1, len(self))]
+        if len(keep) < len(self):
+            for name in _COLUMNS:
+                column = getattr(self, name)
+                setattr(self, name, array(column.typecode, (column[i] for i in keep)))
+        # Free a tenth at once so a dense track is not compacted on every point
+        if len(self) > self.capacity * 0.9:
+            self._drop_oldest(len(self) - int(self.capacity * 0.9))
+
+
+class TrackHistory:
+    """Track history of one asset, persisted with a Home Assistant store."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, retention: timedelta
+    ) -> None:
+        """Initialize the history."""
+        self._hass = hass
+        self.buffer = TrackBuffer(retention)
+        # Compaction running in the executor after a fix filled the track
+        self._compacting: asyncio.Task[None] | None = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.history.{entry_id}"
+        )
+
+    async def async_load(self) -> None:
+        """Load the stored track."""
+        if (data := await self._store.async_load()) is not None:
+            self.buffer.load_dict(data)
+            self.buffer.prune(dt_util.utcnow().timestamp())
+
+    @callback
+    def async_add_snapshot(self, snapshot: AssetSnapshot | None) -> None:
+        """Record the position of a snapshot if it is a new fix."""
+        if snapshot is None or not snapshot.has_position:
+            return
+        timestamp = snapshot.last_position or dt_util.utcnow()
+        if self.buffer.append(
+            timestamp.timestamp(),
+            snapshot.latitude,
+            snapshot.longitude,
+            snapshot.battery,
+        ):
+            if self.buffer.is_full and self._compacting is None:
+                self._compacting = self._hass.async_create_background_task(
+                    self._async_compact(), f"{DOMAIN} compact track"
+                )
+            self._store.async_delay_save(self.buffer.as_dict, HISTORY_SAVE_DELAY)
+
+    async def async_add_points(self, points: Iterable[TrackPoint]) -> int:
+        """
+        Merge points from any period into the track; return how many.
+
+        Points older than the retention window are left out rather than
+        merged and pruned again. A track taken over capacity is simplified
+        in the executor.
+        """
+        now = dt_util.utcnow()
+        cutoff = now - self.buffer.retention
+        if not (
+            added := self.buffer.merge(
+                point for point in points if point.timestamp >= cutoff
+            )
+        ):
+            return 0
+        self.buffer.prune(now.timestamp())
+        if self.buffer.is_full:
+            await self._async_compact()
+        self._store.async_delay_save(self.buffer.as_dict, HISTORY_SAVE_DELAY)
+        return added
+
+    async def _async_compact(self) -> None:
+        """Simplify a copy of the track off the event loop, then compact it."""
+        buffer = self.buffer
+        timestamps = buffer.timestamps
+        count = len(buffer)
+        first, second_last = timestamps[0], timestamps[count - 2]
+        try:
+            keep = await self._hass.async_add_executor_job(
+                douglas_peucker,
+                buffer.latitudes[:],
+                buffer.longitudes[:],
+                HISTORY_SIMPLIFY_TOLERANCE,
+            )
+        finally:
+            self._compacting = None
+        # Fixes may have been added meanwhile, replacing at most the latest
+        # point; anything else moved the points and a later pass compacts
+        if (
+            buffer.timestamps is timestamps
+            and len(buffer) >= count
+            and timestamps[0] == first
+            and timestamps[count - 2] == second_last
+        ):
+            buffer.compact(keep)
+
+    def points(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[TrackPoint]:
+        """Return the track between two moments, oldest first."""
+        return self.buffer.points(start, end)
+
+    async def async_save(self) -> None:
+        """Write the track now instead of after the save delay."""
+        await self._store.async_save(self.buffer.as_dict())
+
+    async def async_remove(self) -> None:
+        """Delete the stored track."""
+        await self._store.async_remove()
@@ -0,0 +1,158 @@
+"""Runtime metrics of the axscend API client and coordinators."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import METRICS_LATENCY_BUCKETS, METRICS_WINDOW
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with fixed bucket bounds, in seconds.
+
+    Recording is constant time and memory, so every request can be measured.
+    Percentiles are the upper bound of the bucket they fall in.
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = METRICS_LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self._bounds = bounds
+        # One more bucket for everything above the last bound
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one measurement."""
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the bucket bound below which pct percent of measurements fall."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"le_{bound:g}" for bound in self._bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self._counts, strict=True)),
+        }
+
+
+class SuccessWindow:
+    """Outcomes of the most recent attempts."""
+
+    __slots__ = ("_outcomes",)
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Initialize an empty window."""
+        self._outcomes: deque[bool] = deque(maxlen=size)
+
+    def record(self, *, success: bool) -> None:
+        """Add one outcome, dropping the oldest from a full window."""
+        self._outcomes.append(success)
+
+    @property
+    def rate(self) -> float | None:
+        """Return the percentage of successful attempts in the window."""
+        if not self._outcomes:
+            return None
+        return 100 * sum(self._outcomes) / len(self._outcomes)
+
+
+@dataclass(slots=True)
+class ApiMetrics:
+    """Requests made by one API client, one entry per attempt."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    outcomes: SuccessWindow = field(default_factory=SuccessWindow)
+    requests: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    # Requests refused by an open circuit breaker, never sent
+    circuit_open: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    response_bytes: int = 0
+    last_response_bytes: int | None = None
+
+    def record_request(self, seconds: float, error: str | None = None) -> None:
+        """Record an attempt and the kind of error it failed with, if any."""
+        self.requests += 1
+        self.latency.record(seconds)
+        self.outcomes.record(success=error is None)
+        if error is not None:
+            self.errors[error] += 1
+
+    def record_response_size(self, size: int) -> None:
+        """Record the size of a response body in bytes."""
+        self.response_bytes += size
+        self.last_response_bytes = size
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "success_rate": self.outcomes.rate,
+            "latency": self.latency.as_dict(),
+            "not_modified": self.not_modified,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "circuit_open": self.circuit_open,
+            "errors": dict(self.errors),
+            "response_bytes": self.response_bytes,
+            "last_response_bytes": self.last_response_bytes,
+        }
+
+
+@dataclass(slots=True)
+class PollMetrics:
+    """Refreshes of one coordinator, including retries and fleet batching."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    outcomes: SuccessWindow = field(default_factory=SuccessWindow)
+    polls: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+
+    def record_poll(self, seconds: float, *, success: bool) -> None:
+        """Record a refresh; serving stale data counts as a failure."""
+        self.polls += 1
+        self.latency.record(seconds)
+        self.outcomes.record(success=success)
+        self.last_duration = seconds
+        if not success:
+            self.failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "polls": self.polls,
+            "failures": self.failures,
+            "success_rate": self.outcomes.rate,
+            "last_duration": self.last_duration,
+            "latency": self.latency.as_dict(),
+        }
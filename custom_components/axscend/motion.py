@@ -0,0 +1,154 @@
+"""Running motion state of an asset for axscend."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, fields
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER, MOTION_MAX_SPEED, MOTION_MIN_DISTANCE, MOTION_PARKED_AFTER
+from .geofence import haversine_distance
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .data import AssetSnapshot
+
+
+def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the compass bearing in degrees from one position to another."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lon = math.radians(lon2 - lon1)
+    x = math.sin(delta_lon) * math.cos(lat2_rad)
+    y = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(
+        lat2_rad
+    ) * math.cos(delta_lon)
+    return math.degrees(math.atan2(x, y)) % 360
+
+
+@dataclass(slots=True)
+class MotionState:
+    """
+    Running motion of one asset, updated in place on every new fix.
+
+    Only the last counted position and running totals are kept, so a fix
+    costs one distance and one bearing whatever the asset's history. Moves
+    shorter than the jitter distance leave the position in place, so GPS
+    noise around a parked asset adds neither distance nor trips. A trip
+    starts with the first move after being parked and ends once the asset
+    has not moved for a while.
+    """
+
+    # Last counted position, and the time of its fix
+    latitude: float | None = None
+    longitude: float | None = None
+    counted_at: datetime | None = None
+    # Time of the latest fix, counted or not
+    fixed_at: datetime | None = None
+    moved_at: datetime | None = None
+    speed: float = 0.0  # km/h
+    heading: float | None = None  # degrees
+    odometer: float = 0.0  # meters
+    # Local day the daily totals are for
+    day: date | None = None
+    day_distance: float = 0.0  # meters
+    day_trips: int = 0
+    trip_started: datetime | None = None
+    trip_distance: float = 0.0  # meters
+
+    @property
+    def parks_at(self) -> datetime | None:
+        """Return when the current trip ends without another move."""
+        if self.moved_at is None or self.trip_started is None:
+            return None
+        return self.moved_at + MOTION_PARKED_AFTER
+
+    def is_moving(self, now: datetime) -> bool:
+        """Return true while a trip is in progress."""
+        return (parks_at := self.parks_at) is not None and now < parks_at
+
+    def update(self, snapshot: AssetSnapshot, now: datetime) -> bool:
+        """Take a new fix into account; return true if the state changed."""
+        if not snapshot.has_position:
+            return False
+        fixed_at = snapshot.last_position or now
+        if self.fixed_at is not None and fixed_at <= self.fixed_at:
+            return False
+        previous_fix, self.fixed_at = self.fixed_at, fixed_at
+        changed = False
+        if (local_day := dt_util.as_local(fixed_at).date()) != self.day:
+            self.day = local_day
+            self.day_distance = 0.0
+            self.day_trips = 0
+            changed = True
+        if self.latitude is None or self.longitude is None or previous_fix is None:
+            self.latitude, self.longitude = snapshot.latitude, snapshot.longitude
+            self.counted_at = fixed_at
+            return True
+        distance = haversine_distance(
+            self.latitude, self.longitude, snapshot.latitude, snapshot.longitude
+        )
+        if distance < MOTION_MIN_DISTANCE:
+            changed = changed or self.speed != 0
+            self.speed = 0.0
+            if self.trip_started is not None and not self.is_moving(fixed_at):
+                self.park()
+                changed = True
+            return changed
+        # Over the time since the counted position, not since the latest fix,
+        # which may have been left out as jitter since
+        counted_at = self.counted_at or previous_fix
+        speed = distance / (fixed_at - counted_at).total_seconds() * 3.6
+        if speed > MOTION_MAX_SPEED:
+            LOGGER.debug(
+                "Ignoring a jump of %.0f m at %.0f km/h by asset %s",
+                distance,
+                speed,
+                snapshot.asset_id,
+            )
+            return changed
+        if not self.is_moving(fixed_at):
+            # Left from where the previous fix found it
+            self.trip_started = previous_fix
+            self.trip_distance = 0.0
+            self.day_trips += 1
+        self.heading = initial_bearing(
+            self.latitude, self.longitude, snapshot.latitude, snapshot.longitude
+        )
+        self.speed = speed
+        self.odometer += distance
+        self.day_distance += distance
+        self.trip_distance += distance
+        self.moved_at = fixed_at
+        self.latitude, self.longitude = snapshot.latitude, snapshot.longitude
+        self.counted_at = fixed_at
+        return True
+
+    def park(self) -> None:
+        """End the current trip."""
+        self.speed = 0.0
+        self.trip_started = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON serializable data."""
+        return {
+            name: value.isoformat() if isinstance(value, (date, datetime)) else value
+            for name, value in asdict(self).items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> MotionState:
+        """Build the state from the output of `as_dict`."""
+        values = {
+            field.name: data[field.name] for field in fields(cls) if field.name in data
+        }
+        for name in ("counted_at", "fixed_at", "moved_at", "trip_started"):
+            if values.get(name) is not None:
+                values[name] = dt_util.parse_datetime(values[name])
+        if values.get("day") is not None:
+            values["day"] = date.fromisoformat(values["day"])
+        return cls(**values)
@@ -0,0 +1,311 @@
+"""Offline nearest place lookup for axscend."""
+
+from __future__ import annotations
+
+import csv
+import math
+import mmap
+import struct
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    PLACES_CACHE_PRECISION,
+    PLACES_CACHE_SIZE,
+    PLACES_GRID_DEGREES,
+    PLACES_MAX_DISTANCE,
+)
+from .geofence import EARTH_RADIUS, haversine_distance
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+DATA_PLACES: HassKey[dict[Path, PlaceIndex]] = HassKey(f"{DOMAIN}_places")
+
+INDEX_SUFFIX = ".idx"
+_MAGIC = b"AXPL"
+_VERSION = 2
+# Magic, version, place count and grid cell size, padded to a multiple of 8
+# bytes so the columns after it are aligned
+_HEADER = struct.Struct("<4sIId4x")
+_METERS_PER_DEGREE = math.radians(1) * EARTH_RADIUS
+# Closer to the poles the search would span too many cells; it is approximate
+_MIN_COS_LATITUDE = math.cos(math.radians(85))
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    """The place nearest to a position."""
+
+    name: str
+    latitude: float
+    longitude: float
+    distance: float
+
+
+class _Grid:
+    """Numbering of the cells of a latitude and longitude grid."""
+
+    def __init__(self, degrees: float) -> None:
+        """Initialize a grid of cells `degrees` wide."""
+        self.degrees = degrees
+        self.row_offset = math.ceil(90 / degrees)
+        self.col_offset = math.ceil(180 / degrees)
+        self.cols = 2 * self.col_offset + 1
+
+    def row(self, latitude: float) -> int:
+        """Return the row of a latitude."""
+        return math.floor(latitude / self.degrees) + self.row_offset
+
+    def col(self, longitude: float) -> int:
+        """Return the column of a longitude."""
+        return math.floor(longitude / self.degrees) + self.col_offset
+
+    def key(self, row: int, col: int) -> int:
+        """Return the key of a cell; the cells of a row have consecutive keys."""
+        return row * self.cols + col
+
+
+def build_index(places: Iterable[tuple[str, float, float]]) -> bytes:
+    """
+    Return the index of places given as (name, latitude, longitude).
+
+    The index holds the cell key, latitude and longitude of every place in
+    arrays sorted by cell, followed by the name offsets and the names, so it
+    can be searched in place once memory-mapped.
+    """
+    grid = _Grid(PLACES_GRID_DEGREES)
+    rows = sorted(
+        (grid.key(grid.row(latitude), grid.col(longitude)), latitude, longitude, name)
+        for name, latitude, longitude in places
+    )
+    names = bytearray()
+    offsets = [0]
+    for *_, name in rows:
+        names += name.encode()
+        offsets.append(len(names))
+    count = len(rows)
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, _VERSION, count, grid.degrees),
+            struct.pack(f"<{count}Q", *(row[0] for row in rows)),
+            struct.pack(f"<{count}d", *(row[1] for row in rows)),
+            struct.pack(f"<{count}d", *(row[2] for row in rows)),
+            struct.pack(f"<{count + 1}I", *offsets),
+            bytes(names),
+        )
+    )
+
+
+def read_places_csv(path: Path) -> list[tuple[str, float, float]]:
+    """Read "name, latitude, longitude" rows, skipping a header and bad rows."""
+    places = []
+    with path.open(newline="", encoding="utf-8") as file:
+        for row in csv.reader(file):
+            try:
+                name, latitude, longitude = (part.strip() for part in row[:3])
+                lat, lon = float(latitude), float(longitude)
+            except ValueError:
+                LOGGER.debug("Skipping place row %s of %s", row, path)
+                continue
+            if name and -90 <= lat <= 90 and -180 <= lon <= 180:  # noqa: PLR2004
+                places.append((name, lat, lon))
+    return places
+
+
+class PlaceIndex:
+    """
+    Places of a memory-mapped index, searched without loading them.
+
+    The arrays are read through memoryviews of the mapping, so only the
+    pages a lookup touches are read from disk and nothing is copied onto the
+    heap. A lookup bisects the cells around the position in rings until no
+    closer place can be found. Results are cached by rounded position. The
+    mapping stays open until `close` is called.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map an index file."""
+        self.path = path
+        self.mtime = path.stat().st_mtime
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, degrees = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            msg = f"{path} is not a places index"
+            raise ValueError(msg)
+        self._grid = _Grid(degrees)
+        # Entries holding the index, which is closed once the last one releases it
+        self.refs = 0
+        self._view = view = memoryview(self._mmap)
+        start = _HEADER.size
+        self._keys = view[start : (start := start + 8 * count)].cast("Q")
+        self._latitudes = view[start : (start := start + 8 * count)].cast("d")
+        self._longitudes = view[start : (start := start + 8 * count)].cast("d")
+        self._offsets = view[start : (start := start + 4 * (count + 1))].cast("I")
+        self._names = view[start:]
+        self._nearest_cached = lru_cache(maxsize=PLACES_CACHE_SIZE)(self._nearest)
+
+    def __len__(self) -> int:
+        """Return the number of places."""
+        return len(self._keys)
+
+    def close(self) -> None:
+        """Unmap the index file; no lookup may be made after."""
+        self._nearest_cached.cache_clear()
+        for view in (
+            self._keys,
+            self._latitudes,
+            self._longitudes,
+            self._offsets,
+            self._names,
+            self._view,
+        ):
+            view.release()
+        self._mmap.close()
+
+    def nearest(self, latitude: float, longitude: float) -> Place | None:
+        """Return the nearest place within the maximum distance."""
+        return self._nearest_cached(
+            round(latitude, PLACES_CACHE_PRECISION),
+            round(longitude, PLACES_CACHE_PRECISION),
+        )
+
+    def _nearest(self, latitude: float, longitude: float) -> Place | None:
+        """Search the cells around a position ring by ring."""
+        grid = self._grid
+        row, col = grid.row(latitude), grid.col(longitude)
+        # Longitude degrees are shortest at the pole-side edge of the search
+        max_lat = min(abs(latitude) + PLACES_MAX_DISTANCE / _METERS_PER_DEGREE, 90)
+        cell_width = grid.degrees * _METERS_PER_DEGREE
+        min_cell_width = cell_width * max(
+            math.cos(math.radians(max_lat)), _MIN_COS_LATITUDE
+        )
+        rings = math.ceil(PLACES_MAX_DISTANCE / min_cell_width) + 1
+        best: tuple[float, int] | None = None
+        for ring in range(rings + 1):
+            # Every cell of the ring is at least this far from the position
+            if best is not None and best[0] <= (ring - 1) * min_cell_width:
+                break
+            for ring_row in range(row - ring, row + ring + 1):
+                if abs(ring_row - row) == ring:
+                    spans = ((col - ring, col + ring),)
+                else:
+                    spans = ((col - ring, col - ring), (col + ring, col + ring))
+                for first, last in spans:
+                    best = self._search(
+                        latitude,
+                        longitude,
+                        grid.key(ring_row, max(first, 0)),
+                        grid.key(ring_row, min(last, grid.cols - 1)),
+                        best,
+                    )
+        if best is None or best[0] > PLACES_MAX_DISTANCE:
+            return None
+        distance, index = best
+        return Place(
+            name=bytes(
+                self._names[self._offsets[index] : self._offsets[index + 1]]
+            ).decode(),
+            latitude=self._latitudes[index],
+            longitude=self._longitudes[index],
+            distance=distance,
+        )
+
+    def _search(
+        self,
+        latitude: float,
+        longitude: float,
+        first_key: int,
+        last_key: int,
+        best: tuple[float, int] | None,
+    ) -> tuple[float, int] | None:
+        """Return the closer of `best` and the places of a range of cells."""
+        if first_key > last_key:
+            return best
+        keys = self._keys
+        for index in range(
+            bisect_left(keys, first_key), bisect_left(keys, last_key + 1)
+        ):
+            distance = haversine_distance(
+                latitude, longitude, self._latitudes[index], self._longitudes[index]
+            )
+            if best is None or distance < best[0]:
+                best = (distance, index)
+        return best
+
+
+def _is_current_index(path: Path) -> bool:
+    """Return true if an index file was built in the current format."""
+    with path.open("rb") as file:
+        header = file.read(_HEADER.size)
+    return len(header) == _HEADER.size and _HEADER.unpack(header)[:2] == (
+        _MAGIC,
+        _VERSION,
+    )
+
+
+def load_place_index(path: Path, loaded: PlaceIndex | None) -> PlaceIndex:
+    """
+    Return the index of a places file, building it if needed.
+
+    A CSV file is indexed into a file next to it, rebuilt whenever the CSV
+    is newer or the index is of another format version. An index file is
+    mapped directly. `loaded` is returned as is when its file has not
+    changed since it was mapped. Indexes are replaced rather than
+    rewritten, so sensors still using an older mapping keep reading the
+    file it was made from.
+    """
+    index_path = path
+    if path.suffix != INDEX_SUFFIX:
+        index_path = path.with_suffix(INDEX_SUFFIX)
+        if (
+            not index_path.exists()
+            or index_path.stat().st_mtime < path.stat().st_mtime
+            or not _is_current_index(index_path)
+        ):
+            places = read_places_csv(path)
+            temporary = index_path.with_suffix(f"{INDEX_SUFFIX}.tmp")
+            temporary.write_bytes(build_index(places))
+            temporary.replace(index_path)
+            LOGGER.debug("Indexed %s places of %s", len(places), path)
+    if loaded is not None and loaded.mtime == index_path.stat().st_mtime:
+        return loaded
+    return PlaceIndex(index_path)
+
+
+async def async_get_place_index(hass: HomeAssistant, file: str) -> PlaceIndex:
+    """
+    Return the shared index of a places file, relative to the config dir.
+
+    Every index returned must be given back with `async_release_place_index`.
+    """
+    path = Path(hass.config.path(file))
+    indexes = hass.data.setdefault(DATA_PLACES, {})
+    index = await hass.async_add_executor_job(load_place_index, path, indexes.get(path))
+    indexes[path] = index
+    index.refs += 1
+    return index
+
+
+@callback
+def async_release_place_index(hass: HomeAssistant, index: PlaceIndex) -> None:
+    """Release an index, closing its mapping once no entry holds it."""
+    index.refs -= 1
+    if index.refs:
+        return
+    indexes = hass.data.get(DATA_PLACES, {})
+    for path in [path for path, loaded in indexes.items() if loaded is index]:
+        del indexes[path]
+    index.close()
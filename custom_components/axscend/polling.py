@@ -0,0 +1,109 @@
+"""Adaptive polling intervals for axscend."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    LOW_BATTERY_THRESHOLD,
+    MOVEMENT_RECENT_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from .data import AssetSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class PollingOptions:
+    """Polling bounds of one asset, taken from the entry options."""
+
+    min_interval: timedelta
+    max_interval: timedelta
+    fixed_interval: timedelta | None = None
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PollingOptions:
+        """Build the polling options from config entry options."""
+        min_interval = timedelta(
+            seconds=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        )
+        max_interval = max(
+            min_interval,
+            timedelta(seconds=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)),
+        )
+        scan_interval = options.get(CONF_SCAN_INTERVAL, 0)
+        fixed_interval = timedelta(seconds=scan_interval) if scan_interval else None
+        if fixed_interval is None and options.get(CONF_PUSH, False):
+            # Pushed events carry the updates; polling only reconciles
+            fixed_interval = max_interval
+        return cls(
+            min_interval=min_interval,
+            max_interval=max_interval,
+            fixed_interval=fixed_interval,
+        )
+
+
+def is_moving(
+    snapshot: AssetSnapshot,
+    previous: AssetSnapshot | None,
+    now: datetime | None = None,
+) -> bool:
+    """Return true if the asset moved recently or since the previous poll."""
+    now = now or dt_util.utcnow()
+    for timestamp in (snapshot.last_movement, snapshot.last_position):
+        if timestamp is not None and now - timestamp <= MOVEMENT_RECENT_WINDOW:
+            return True
+    if previous is None:
+        return False
+    return (snapshot.latitude, snapshot.longitude) != (
+        previous.latitude,
+        previous.longitude,
+    )
+
+
+def next_update_interval(
+    options: PollingOptions,
+    current: timedelta | None,
+    snapshot: AssetSnapshot,
+    previous: AssetSnapshot | None,
+    now: datetime | None = None,
+) -> timedelta:
+    """
+    Return the interval until the next poll of an asset.
+
+    Moving assets are polled at the minimum interval. Stationary assets back
+    off exponentially from their current interval up to the maximum. Trackers
+    with a low battery report less often themselves, so polling them faster
+    than the default interval gains nothing.
+    """
+    if options.fixed_interval is not None:
+        return options.fixed_interval
+    if is_moving(snapshot, previous, now):
+        interval = options.min_interval
+        if snapshot.battery is not None and snapshot.battery <= LOW_BATTERY_THRESHOLD:
+            interval = max(interval, DEFAULT_UPDATE_INTERVAL)
+    else:
+        interval = (current or options.min_interval) * 2
+    return min(max(interval, options.min_interval), options.max_interval)
+
+
+def retry_interval(current: timedelta | None, retry_after: float | None) -> timedelta:
+    """Return the interval until the next poll after the API asked to wait."""
+    current = current or DEFAULT_UPDATE_INTERVAL
+    if retry_after is None:
+        return current
+    return max(current, timedelta(seconds=retry_after))
@@ -0,0 +1,338 @@
+"""On-demand profiling of the refresh pipeline for axscend."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.components import persistent_notification
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER, PROFILE_SAMPLE_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime, timedelta
+    from types import FrameType, SimpleNamespace
+
+    from homeassistant.core import HomeAssistant
+
+DATA_PROFILER: HassKey[RefreshProfiler] = HassKey(f"{DOMAIN}_profiler")
+
+# Stages of a refresh in pipeline order; "other" is the time no stage claims
+STAGES = (
+    "queue",
+    "rate_limit",
+    "dns",
+    "connect",
+    "api",
+    "read",
+    "decode",
+    "dispatch",
+    "other",
+)
+
+_PACKAGE_DIR = Path(__file__).parent
+
+# Trace of the refresh the current task works for, set only while profiling
+_TRACE: ContextVar[RefreshTrace | None] = ContextVar(f"{DOMAIN}_trace", default=None)
+
+
+@dataclass(slots=True)
+class RefreshTrace:
+    """Seconds one refresh spent in each stage."""
+
+    name: str
+    started: datetime
+    stages: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    success: bool | None = None
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add time spent in a stage."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace for the report, in milliseconds."""
+        return {
+            "name": self.name,
+            "started": self.started.isoformat(),
+            "success": self.success,
+            "total_ms": self.total * 1000,
+            "stages_ms": {
+                stage: self.stages[stage] * 1000
+                for stage in STAGES
+                if stage in self.stages
+            },
+        }
+
+
+@contextmanager
+def profile_stage(stage: str) -> Iterator[None]:
+    """Time a stage of the refresh being traced; does nothing otherwise."""
+    if (trace := _TRACE.get()) is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(stage, time.perf_counter() - start)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Return request hooks that time DNS lookups and new connections.
+
+    Connecting, including the TLS handshake, happens within the request
+    timed as the API stage, so it is taken off that stage.
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    async def _on_connection_create_start(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        context.connect_start = time.perf_counter()
+        context.dns = 0.0
+
+    async def _on_dns_resolvehost_start(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def _on_dns_resolvehost_end(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        if (trace := _TRACE.get()) is None:
+            return
+        context.dns = time.perf_counter() - context.dns_start
+        trace.add("dns", context.dns)
+        trace.add("api", -context.dns)
+
+    async def _on_connection_create_end(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        if (trace := _TRACE.get()) is None:
+            return
+        connect = time.perf_counter() - context.connect_start - context.dns
+        trace.add("connect", connect)
+        trace.add("api", -connect)
+
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    return trace_config
+
+
+def _frame_name(frame: FrameType) -> str:
+    """Return a short name of the function a frame runs."""
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{frame.f_lineno})"
+
+
+def _is_refresh(frame: FrameType) -> bool:
+    """Return true if a frame runs the refresh of a coordinator of the package."""
+    code = frame.f_code
+    return (
+        code.co_name == "_async_refresh"
+        and Path(code.co_filename).parent == _PACKAGE_DIR
+    )
+
+
+class StackSampler:
+    """
+    Sample the stack of the event loop thread while it runs a traced refresh.
+
+    A thread reads the stack of the loop thread every sample interval and
+    only counts it when it runs within the refresh of a coordinator of the
+    integration, so the rest of Home Assistant does not show up. The loop's
+    own state is never read from the sampler thread. Stacks are counted in
+    the collapsed format flame graph tools read.
+    """
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL) -> None:
+        """Initialize from the event loop thread."""
+        self._loop_thread = threading.get_ident()
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN}_profile_sampler", daemon=True
+        )
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread; blocks briefly."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._loop_thread)  # noqa: SLF001
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            if not any(map(_is_refresh, frames)):
+                continue
+            self.stacks[";".join(map(_frame_name, reversed(frames)))] += 1
+            self.samples += 1
+
+
+class RefreshProfiler:
+    """Traces of the refreshes made while a profile is being taken."""
+
+    def __init__(self, cycles: int | None, sampler: StackSampler | None) -> None:
+        """Initialize before any refresh is traced."""
+        self.started = dt_util.utcnow()
+        self.traces: list[RefreshTrace] = []
+        self.sampler = sampler
+        self._cycles = cycles
+        self.done = asyncio.Event()
+
+    @contextmanager
+    def trace(self, name: str) -> Iterator[RefreshTrace]:
+        """Trace the stages of a refresh made within the block."""
+        trace = RefreshTrace(name, dt_util.utcnow())
+        token = _TRACE.set(trace)
+        start = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            _TRACE.reset(token)
+            trace.total = time.perf_counter() - start
+            trace.stages["other"] = max(trace.total - sum(trace.stages.values()), 0)
+            self.traces.append(trace)
+            if self._cycles is not None and len(self.traces) >= self._cycles:
+                self.done.set()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the mean, 95th percentile and maximum of each stage in ms."""
+        summary = {}
+        total = sum(trace.total for trace in self.traces)
+        for stage in (*STAGES, "total"):
+            values = sorted(
+                trace.total if stage == "total" else trace.stages.get(stage, 0.0)
+                for trace in self.traces
+            )
+            if not values or not values[-1]:
+                continue
+            summary[stage] = {
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p95_ms": values[min(int(len(values) * 0.95), len(values) - 1)] * 1000,
+                "max_ms": values[-1] * 1000,
+                "share": sum(values) / total if total else 0.0,
+            }
+        return summary
+
+
+@callback
+def async_get_active_profiler(hass: HomeAssistant) -> RefreshProfiler | None:
+    """Return the profiler while a profile is being taken."""
+    return hass.data.get(DATA_PROFILER)
+
+
+@callback
+def async_start_profile(
+    hass: HomeAssistant, cycles: int | None, *, sample: bool
+) -> RefreshProfiler:
+    """Start tracing every refresh of the integration."""
+    sampler = StackSampler() if sample else None
+    profiler = hass.data[DATA_PROFILER] = RefreshProfiler(cycles, sampler)
+    if sampler is not None:
+        sampler.start()
+    return profiler
+
+
+def _write_report(
+    path: Path, report: dict[str, Any], stacks: Counter[str] | None
+) -> None:
+    """Write the report, and the sampled stacks next to it."""
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if stacks is not None:
+        path.with_suffix(".stacks.txt").write_text(
+            "".join(f"{stack} {count}\n" for stack, count in stacks.most_common()),
+            encoding="utf-8",
+        )
+
+
+def _notification(
+    profiler: RefreshProfiler, summary: dict[str, dict[str, float]], path: Path
+) -> str:
+    """Return the summary of a profile as Markdown."""
+    lines = [f"Traced {len(profiler.traces)} refreshes.", ""]
+    if summary:
+        lines += [
+            "| Stage | Mean ms | p95 ms | Share |",
+            "|-------|--------:|-------:|------:|",
+            *(
+                f"| {stage} | {values['mean_ms']:.1f} | {values['p95_ms']:.1f} "
+                f"| {values['share']:.0%} |"
+                for stage, values in summary.items()
+            ),
+            "",
+        ]
+    if profiler.sampler is not None:
+        lines.append(f"Sampled {profiler.sampler.samples} stacks.")
+    lines.append(f"Details are in `{path.name}` in the configuration directory.")
+    return "\n".join(lines)
+
+
+async def async_finish_profile(
+    hass: HomeAssistant, profiler: RefreshProfiler, duration: timedelta
+) -> None:
+    """Stop a profile after its cycles or duration and report it."""
+    try:
+        async with asyncio.timeout(duration.total_seconds()):
+            await profiler.done.wait()
+    except TimeoutError:
+        pass
+    finally:
+        if hass.data.get(DATA_PROFILER) is profiler:
+            del hass.data[DATA_PROFILER]
+        if profiler.sampler is not None:
+            await hass.async_add_executor_job(profiler.sampler.stop)
+
+    finished = dt_util.utcnow()
+    summary = profiler.summary()
+    report = {
+        "started": profiler.started.isoformat(),
+        "finished": finished.isoformat(),
+        "summary": summary,
+        "refreshes": [trace.as_dict() for trace in profiler.traces],
+        "samples": profiler.sampler.samples if profiler.sampler else None,
+    }
+    path = Path(
+        hass.config.path(f"{DOMAIN}_profile_{finished.strftime('%Y%m%d_%H%M%S')}.json")
+    )
+    await hass.async_add_executor_job(
+        _write_report,
+        path,
+        report,
+        profiler.sampler.stacks if profiler.sampler else None,
+    )
+    LOGGER.info("Wrote the profile of %s refreshes to %s", len(profiler.traces), path)
+    persistent_notification.async_create(
+        hass,
+        _notification(profiler, summary, path),
+        title="Axscend refresh profile",
+        notification_id=f"{DOMAIN}_profile",
+    )
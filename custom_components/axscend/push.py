@@ -0,0 +1,120 @@
+"""Push ingestion of Axscend events through a Home Assistant webhook."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+from collections import deque
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import (
+    LOGGER,
+    WEBHOOK_MAX_BODY,
+    WEBHOOK_SEEN_EVENTS,
+    WEBHOOK_SIGNATURE_HEADER,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .data import AxscendConfigEntry
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Return the signature of a webhook body, a hex HMAC-SHA256."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class AxscendPushHandler:
+    """
+    Feed position and movement events posted to a webhook into a coordinator.
+
+    Events are signed with a secret shared with Axscend, and applied once:
+    redelivered event ids and fixes older than the current one are ignored.
+    """
+
+    def __init__(self, entry: AxscendConfigEntry, secret: str) -> None:
+        """Initialize the handler."""
+        self._entry = entry
+        self._secret = secret
+        self._seen: deque[str] = deque(maxlen=WEBHOOK_SEEN_EVENTS)
+
+    async def async_handle(
+        self, _hass: HomeAssistant, _webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Handle a posted event."""
+        if (request.content_length or 0) > WEBHOOK_MAX_BODY:
+            return web.Response(status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        body = await request.content.read(WEBHOOK_MAX_BODY + 1)
+        if len(body) > WEBHOOK_MAX_BODY:
+            return web.Response(status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        signature = request.headers.get(WEBHOOK_SIGNATURE_HEADER, "")
+        if not hmac.compare_digest(signature, sign_payload(self._secret, body)):
+            LOGGER.warning("Rejected Axscend event with an invalid signature")
+            return web.Response(status=HTTPStatus.UNAUTHORIZED)
+        try:
+            event = json_loads(body)
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if not isinstance(event, dict) or not isinstance(event.get("asset"), dict):
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        self.async_apply(event)
+        return web.Response(status=HTTPStatus.OK)
+
+    @callback
+    def async_apply(self, event: dict[str, Any]) -> None:
+        """Apply a verified event to the coordinator."""
+        runtime_data = self._entry.runtime_data
+        asset = event["asset"]
+        if str(asset.get("id", runtime_data.asset_id)) != runtime_data.asset_id:
+            LOGGER.debug("Ignoring event of asset %s", asset.get("id"))
+            return
+        if (event_id := event.get("event_id")) in self._seen:
+            return
+        coordinator = runtime_data.coordinator
+        if coordinator.data is None:
+            return
+        snapshot = coordinator.data.merge_api(event)
+        previous = coordinator.data.last_position
+        if (
+            previous is not None
+            and snapshot.last_position is not None
+            and snapshot.last_position < previous
+        ):
+            LOGGER.debug("Ignoring out of order event %s", event_id)
+            return
+        LOGGER.debug("Pushed event %s for asset %s", event_id, runtime_data.asset_id)
+        # Marked only once applied, so a redelivery of a dropped event applies
+        if event_id is not None:
+            self._seen.append(event_id)
+        coordinator.fresh_at = dt_util.utcnow()
+        coordinator.async_set_updated_data(snapshot)
+
+
+@callback
+def async_register_push(
+    hass: HomeAssistant, entry: AxscendConfigEntry, webhook_id: str, secret: str
+) -> CALLBACK_TYPE:
+    """Register the webhook of an entry and return a callback removing it."""
+    handler = AxscendPushHandler(entry, secret)
+    webhook.async_register(
+        hass,
+        entry.domain,
+        entry.title,
+        webhook_id,
+        handler.async_handle,
+        allowed_methods=["POST"],
+    )
+
+    @callback
+    def _async_unregister() -> None:
+        webhook.async_unregister(hass, webhook_id)
+
+    return _async_unregister
@@ -0,0 +1,83 @@
+"""Per-token rate limiting for the axscend API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from .const import LOGGER, RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every request made with one API token.
+
+    Requests take a token each; tokens refill at a steady rate up to a burst.
+    Callers queue in arrival order while the bucket is empty, so a large fleet
+    refresh cannot starve the polls of other entries for long.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # asyncio.Lock wakes its waiters first in, first out
+        self._lock = asyncio.Lock()
+        self._queued = 0
+        self.last_wait = 0.0
+        self.total_wait = 0.0
+        self.acquired = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return self._queued
+
+    @property
+    def tokens(self) -> float:
+        """Return the tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> float:
+        """Wait for a token; return the seconds spent waiting."""
+        start = time.monotonic()
+        self._queued += 1
+        try:
+            async with self._lock:
+                self._refill()
+                # Checked again after each sleep, a deferral may have come in
+                while self._tokens < 1:
+                    delay = (1 - self._tokens) / self.rate
+                    LOGGER.debug(
+                        "Rate limited, waiting %.2fs with %s requests queued",
+                        delay,
+                        self._queued - 1,
+                    )
+                    await asyncio.sleep(delay)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._queued -= 1
+        waited = time.monotonic() - start
+        self.last_wait = waited
+        self.total_wait += waited
+        self.acquired += 1
+        return waited
+
+    def defer(self, seconds: float) -> None:
+        """Hold every request back, for example after a 429 with Retry-After."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
@@ -0,0 +1,161 @@
+"""Integration-wide poll scheduler for axscend."""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, SCHEDULER_MAX_CONCURRENT
+from .profiler import profile_stage
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+DATA_SCHEDULER: HassKey[PollScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+
+def poll_phase(key: str) -> float:
+    """Return the fraction of its interval a key polls at, stable across restarts."""
+    return zlib.crc32(key.encode()) / 2**32
+
+
+class PhasedDataUpdateCoordinator[DataT](DataUpdateCoordinator[DataT]):
+    """
+    Coordinator refreshing at a fixed phase of its update interval.
+
+    Subclasses set the phase, usually with `poll_phase` of a stable key.
+    """
+
+    _phase: float = 0.0
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh at the slot of the coordinator's phase."""
+        if self.update_interval is None or (
+            self.config_entry is not None and self.config_entry.pref_disable_polling
+        ):
+            return
+        self._async_unsub_refresh()
+        now = self.hass.loop.time()
+        delay = async_get_poll_scheduler(self.hass).refresh_delay(
+            now, self.update_interval.total_seconds(), self._phase
+        )
+        self._unsub_refresh = self.hass.loop.call_at(
+            now + delay, self._async_start_refresh
+        ).cancel
+
+    @callback
+    def _async_start_refresh(self) -> None:
+        """Run a scheduled refresh as a background task, as the base class does."""
+        if self.config_entry:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._handle_refresh_interval(),
+                name=f"{self.name} - {self.config_entry.title} - refresh",
+                eager_start=True,
+            )
+        else:
+            self.hass.async_create_background_task(
+                self._handle_refresh_interval(),
+                name=f"{self.name} - refresh",
+                eager_start=True,
+            )
+
+
+class PollScheduler:
+    """
+    Spread the refreshes of every coordinator and cap how many run at once.
+
+    Each coordinator refreshes at a fixed phase of its interval, so assets
+    polled at the same interval are spread evenly over it instead of all
+    firing together. Fetches then wait for one of a few slots; manual
+    refreshes are handed a free slot before scheduled ones.
+    """
+
+    def __init__(self, limit: int = SCHEDULER_MAX_CONCURRENT) -> None:
+        """Initialize with every slot free."""
+        self.limit = limit
+        self.active = 0
+        self._waiters: dict[bool, deque[asyncio.Future[None]]] = {
+            True: deque(),
+            False: deque(),
+        }
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of fetches waiting for a slot."""
+        return sum(
+            not waiter.done()
+            for waiters in self._waiters.values()
+            for waiter in waiters
+        )
+
+    @staticmethod
+    def refresh_delay(now: float, interval: float, phase: float) -> float:
+        """
+        Return the seconds from now to the refresh slot nearest one interval on.
+
+        Slots are `phase` of the way into each interval, so the delay is
+        between half and one and a half intervals.
+        """
+        offset = phase * interval
+        slot = round((now + interval - offset) / interval) * interval + offset
+        return slot - now
+
+    @asynccontextmanager
+    async def slot(self, *, priority: bool = False) -> AsyncIterator[None]:
+        """Hold one of the slots, waiting for one to free up if needed."""
+        with profile_stage("queue"):
+            await self._acquire(priority=priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, *, priority: bool) -> None:
+        """Take a slot, queueing in the priority or scheduled lane when full."""
+        ahead = self._waiters[True] if priority else (*self._waiters.values(),)
+        if self.active < self.limit and not any(
+            not waiter.done() for lane in ahead for waiter in lane
+        ):
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Pass on a slot handed over just as the fetch was cancelled
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        finally:
+            if waiter in self._waiters[priority]:
+                self._waiters[priority].remove(waiter)
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, priority lane first, or free it."""
+        for lane in (self._waiters[True], self._waiters[False]):
+            while lane:
+                waiter = lane.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler shared by every coordinator."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler()
+    return scheduler
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -11,79 +12,328 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
+from homeassistant.const import (
+    DEGREE,
+    PERCENTAGE,
+    STATE_NOT_HOME,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfLength,
+    UnitOfSpeed,
+    UnitOfTime,
+)
 
+from .const import CONF_PLACES_FILE, LOGGER
 from .entity import AxscendEntity
+from .places import async_get_place_index, async_release_place_index
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+    from typing import Any
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
     from .coordinator import AxscendDataUpdateCoordinator
-    from .data import AxscendConfigEntry
+    from .data import AssetSnapshot, AxscendConfigEntry
+    from .metrics import ApiMetrics
+    from .motion import MotionState
+    from .places import Place, PlaceIndex
+
+
+@dataclass(frozen=True, kw_only=True)
+class AxscendSensorEntityDescription(SensorEntityDescription):
+    """Describes an Axscend sensor."""
+
+    value_fn: Callable[[AssetSnapshot], StateType | datetime]
+    # Snapshot fields the value is derived from
+    fields: frozenset[str]
+
 
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="asset_name",
         name="Asset Name",
         icon="mdi:tag",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        # Also the device name; disabled so it records no history by default
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.name,
+        fields=frozenset({"name"}),
     ),
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="latitude",
         name="Latitude",
         icon="mdi:latitude",
+        native_unit_of_measurement=DEGREE,
+        suggested_display_precision=6,
+        # The device tracker carries the position in a single state row
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.latitude,
+        fields=frozenset({"latitude"}),
     ),
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="longitude",
         name="Longitude",
         icon="mdi:longitude",
+        native_unit_of_measurement=DEGREE,
+        suggested_display_precision=6,
+        # The device tracker carries the position in a single state row
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.longitude,
+        fields=frozenset({"longitude"}),
     ),
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="last_movement",
         name="Last Movement",
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:clock",
+        value_fn=lambda snapshot: snapshot.last_movement,
+        fields=frozenset({"last_movement"}),
     ),
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="last_position",
         name="Last Position",
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:clock",
+        value_fn=lambda snapshot: snapshot.last_position,
+        fields=frozenset({"last_position"}),
     ),
-    SensorEntityDescription(
+    AxscendSensorEntityDescription(
         key="battery",
         name="Battery Level",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda snapshot: snapshot.battery,
+        fields=frozenset({"battery"}),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AxscendMotionSensorEntityDescription(SensorEntityDescription):
+    """Describes an Axscend sensor reading the running motion state."""
+
+    value_fn: Callable[[MotionState], StateType]
+
+
+MOTION_ENTITY_DESCRIPTIONS = (
+    AxscendMotionSensorEntityDescription(
+        key="speed",
+        name="Speed",
+        device_class=SensorDeviceClass.SPEED,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda motion: motion.speed,
+    ),
+    AxscendMotionSensorEntityDescription(
+        key="heading",
+        name="Heading",
+        icon="mdi:compass-outline",
+        native_unit_of_measurement=DEGREE,
+        suggested_display_precision=0,
+        value_fn=lambda motion: motion.heading,
+    ),
+    AxscendMotionSensorEntityDescription(
+        key="odometer",
+        name="Odometer",
+        icon="mdi:counter",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.METERS,
+        suggested_unit_of_measurement=UnitOfLength.KILOMETERS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=1,
+        value_fn=lambda motion: round(motion.odometer),
+    ),
+    AxscendMotionSensorEntityDescription(
+        key="distance_today",
+        name="Distance Today",
+        icon="mdi:map-marker-distance",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.METERS,
+        suggested_unit_of_measurement=UnitOfLength.KILOMETERS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=1,
+        value_fn=lambda motion: round(motion.day_distance),
+    ),
+    AxscendMotionSensorEntityDescription(
+        key="trips_today",
+        name="Trips Today",
+        icon="mdi:map-marker-path",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda motion: motion.day_trips,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AxscendMetricsSensorEntityDescription(SensorEntityDescription):
+    """Describes an Axscend diagnostic sensor reading runtime metrics."""
+
+    value_fn: Callable[[AxscendDataUpdateCoordinator], StateType | datetime]
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    # Opt-in: every poll writes their state
+    entity_registry_enabled_default: bool = False
+
+
+def _api_metrics(coordinator: AxscendDataUpdateCoordinator) -> ApiMetrics:
+    """Return the metrics of the client that polls the asset."""
+    runtime_data = coordinator.config_entry.runtime_data
+    if runtime_data.fleet is not None:
+        return runtime_data.fleet.client.metrics
+    return runtime_data.client.metrics
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert a duration for display."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+METRICS_ENTITY_DESCRIPTIONS = (
+    AxscendMetricsSensorEntityDescription(
+        key="poll_duration",
+        name="Poll Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.poll_metrics.last_duration
+        ),
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="poll_success_rate",
+        name="Poll Success Rate",
+        icon="mdi:check-network-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.poll_metrics.outcomes.rate,
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="last_update_success_time",
+        name="Last Successful Update",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock-check-outline",
+        value_fn=lambda coordinator: coordinator.fresh_at,
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="api_latency_p95",
+        name="API Latency p95",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _milliseconds(
+            _api_metrics(coordinator).latency.percentile(95)
+        ),
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="api_errors",
+        name="API Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: _api_metrics(coordinator).errors.total(),
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="api_timeouts",
+        name="API Timeouts",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: _api_metrics(coordinator).timeouts,
+    ),
+    AxscendMetricsSensorEntityDescription(
+        key="response_size",
+        name="Response Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _api_metrics(coordinator).last_response_bytes,
     ),
 )
 
+ZONE_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="zone",
+    name="Zone",
+    icon="mdi:map-marker-radius",
+)
+
+PLACE_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="nearest_place",
+    name="Nearest Place",
+    icon="mdi:map-search",
+)
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: AxscendConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    place_sensors: list[AxscendPlaceSensor] = []
+    if places_file := entry.options.get(CONF_PLACES_FILE):
+        try:
+            index = await async_get_place_index(hass, places_file)
+        except (OSError, ValueError) as exception:
+            LOGGER.error("Unable to load places file %s: %s", places_file, exception)
+        else:
+            entry.async_on_unload(partial(async_release_place_index, hass, index))
+            place_sensors.append(
+                AxscendPlaceSensor(
+                    coordinator=entry.runtime_data.coordinator,
+                    entity_description=PLACE_ENTITY_DESCRIPTION,
+                    index=index,
+                )
+            )
     async_add_entities(
-        AxscendAssetSensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
+        [
+            *place_sensors,
+            *(
+                AxscendAssetSensor(
+                    coordinator=entry.runtime_data.coordinator,
+                    entity_description=entity_description,
+                )
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            AxscendZoneSensor(
+                coordinator=entry.runtime_data.coordinator,
+                entity_description=ZONE_ENTITY_DESCRIPTION,
+            ),
+            *(
+                AxscendMotionSensor(
+                    coordinator=entry.runtime_data.coordinator,
+                    entity_description=entity_description,
+                )
+                for entity_description in MOTION_ENTITY_DESCRIPTIONS
+            ),
+            *(
+                AxscendMetricsSensor(
+                    coordinator=entry.runtime_data.coordinator,
+                    entity_description=entity_description,
+                )
+                for entity_description in METRICS_ENTITY_DESCRIPTIONS
+            ),
+        ]
     )
 
 
 class AxscendAssetSensor(AxscendEntity, SensorEntity):
     """Axscend Asset Sensor class."""
 
+    entity_description: AxscendSensorEntityDescription
+
     def __init__(
         self,
         coordinator: AxscendDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: AxscendSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.fields)
         self.entity_description = entity_description
         asset_id = coordinator.config_entry.runtime_data.asset_id
         # Ensure unique ID per entity
@@ -91,62 +341,144 @@ class AxscendAssetSensor(AxscendEntity, SensorEntity):
             f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
         )
 
-    def _get_battery_value(self, batt: str | int | None) -> int | float | None:
-        """Convert battery value to int or float."""
-        if batt is None:
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the native value of the sensor."""
+        if not self.coordinator.data:
             return None
-        try:
-            return int(batt)
-        except (TypeError, ValueError):
-            try:
-                return float(batt)
-            except (TypeError, ValueError):
-                return None
-
-    def _get_timestamp_iso8601(self, timestamp_str: str | None) -> datetime | None:
-        """Convert timestamp from 'YYYY-MM-DD HH:MM:SS' to datetime object."""
-        if not timestamp_str:
+        return self.entity_description.value_fn(self.coordinator.data)
+
+
+class AxscendZoneSensor(AxscendEntity, SensorEntity):
+    """Axscend sensor showing the zone the asset is in."""
+
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, frozenset({"presence", "latitude", "longitude"}))
+        self.entity_description = entity_description
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the closest zone the asset is in."""
+        if not self.coordinator.data or not self.coordinator.data.has_position:
             return None
-        try:
-            # Parse the timestamp in the format "2026-01-29 21:23:24"
-            # Return as timezone-aware datetime in UTC
-            return datetime.strptime(str(timestamp_str), "%Y-%m-%d %H:%M:%S").replace(
-                tzinfo=UTC
-            )
-        except (ValueError, TypeError):
+        return self.coordinator.presence.active_zone_name or STATE_NOT_HOME
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return every zone the asset is in."""
+        presence = self.coordinator.presence
+        return {
+            "zone_id": presence.active_zone,
+            "zones": sorted(presence.zones),
+        }
+
+
+class AxscendPlaceSensor(AxscendEntity, SensorEntity):
+    """Axscend sensor showing the place of a local gazetteer nearest the asset."""
+
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+        index: PlaceIndex,
+    ) -> None:
+        """Initialize the sensor class."""
+        # Only woken when the asset moves; lookups are cached by position too
+        super().__init__(coordinator, frozenset({"latitude", "longitude"}))
+        self.entity_description = entity_description
+        self._index = index
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
+        )
+
+    @property
+    def _place(self) -> Place | None:
+        """Return the place nearest the asset."""
+        if not self.coordinator.data or not self.coordinator.data.has_position:
             return None
+        return self._index.nearest(
+            self.coordinator.data.latitude, self.coordinator.data.longitude
+        )
 
-    def _get_value_for_key(
-        self, asset_data: dict, key: str
-    ) -> str | int | float | datetime | None:
-        """Extract the appropriate value from asset data based on key."""
-        extractors = {
-            "asset_name": lambda: asset_data.get("name") or None,
-            "latitude": lambda: (
-                str(asset_data.get("gps_latitude"))
-                if asset_data.get("gps_latitude") is not None
-                else None
-            ),
-            "longitude": lambda: (
-                str(asset_data.get("gps_longitude"))
-                if asset_data.get("gps_longitude") is not None
-                else None
-            ),
-            "last_movement": lambda: self._get_timestamp_iso8601(
-                asset_data.get("last_movement_timestamp")
-            ),
-            "last_position": lambda: self._get_timestamp_iso8601(
-                asset_data.get("last_position_timestamp")
-            ),
-            "battery": lambda: self._get_battery_value(asset_data.get("batt_percent")),
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the nearest place."""
+        return place.name if (place := self._place) else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return where the nearest place is and how far away."""
+        if (place := self._place) is None:
+            return {}
+        return {
+            "distance": round(place.distance),
+            "place_latitude": place.latitude,
+            "place_longitude": place.longitude,
         }
-        return extractors.get(key, lambda: None)()
+
+
+class AxscendMotionSensor(AxscendEntity, SensorEntity):
+    """Axscend sensor showing how the asset moves."""
+
+    entity_description: AxscendMotionSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: AxscendMotionSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, frozenset({"motion"}))
+        self.entity_description = entity_description
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
+        )
 
     @property
-    def native_value(self) -> str | int | float | datetime | None:
+    def native_value(self) -> StateType:
         """Return the native value of the sensor."""
-        if not self.coordinator.data:
-            return None
+        return self.entity_description.value_fn(self.coordinator.motion)
+
+
+class AxscendMetricsSensor(AxscendEntity, SensorEntity):
+    """Axscend diagnostic sensor showing how polling performs."""
 
-        asset_data = self.coordinator.data.get("asset", {})
-        return self._get_value_for_key(asset_data, self.entity_description.key)
+    entity_description: AxscendMetricsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AxscendDataUpdateCoordinator,
+        entity_description: AxscendMetricsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, frozenset({"metrics"}))
+        self.entity_description = entity_description
+        asset_id = coordinator.config_entry.runtime_data.asset_id
+        # Ensure unique ID per entity
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{asset_id}_{entity_description.key}"
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, metrics are most useful while the API is failing."""
+        return True
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
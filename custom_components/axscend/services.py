@@ -0,0 +1,137 @@
+"""Services for axscend."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.util import dt as dt_util
+
+from .api import AxscendApiClientError
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_SAMPLE,
+    ATTR_START,
+    BACKFILL_MAX_RANGE,
+    DOMAIN,
+    PROFILE_DEFAULT_DURATION,
+    PROFILE_MAX_CYCLES,
+    PROFILE_MAX_DURATION,
+    SERVICE_BACKFILL_HISTORY,
+    SERVICE_PROFILE,
+)
+from .profiler import (
+    async_finish_profile,
+    async_get_active_profiler,
+    async_start_profile,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .data import AxscendConfigEntry
+
+BACKFILL_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_CYCLES)
+        ),
+        vol.Optional(ATTR_DURATION): vol.All(
+            cv.time_period,
+            vol.Range(min=timedelta(seconds=1), max=PROFILE_MAX_DURATION),
+        ),
+        vol.Optional(ATTR_SAMPLE, default=False): cv.boolean,
+    }
+)
+
+
+def _loaded_entry(hass: HomeAssistant, entry_id: str) -> AxscendConfigEntry:
+    """Return a loaded entry of the integration or raise."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_found",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"title": entry.title},
+        )
+    return entry
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_backfill_history(call: ServiceCall) -> ServiceResponse:
+        entry = _loaded_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        start = dt_util.as_utc(call.data[ATTR_START])
+        end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+        if start >= end:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="invalid_range"
+            )
+        if end - start > BACKFILL_MAX_RANGE:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="range_too_long",
+                translation_placeholders={"days": str(BACKFILL_MAX_RANGE.days)},
+            )
+        # Pulls in the recorder, so only imported once a backfill is asked for
+        backfill = await async_import_module(hass, f"{__package__}.backfill")
+        try:
+            result = await backfill.async_backfill_history(hass, entry, start, end)
+        except AxscendApiClientError as exception:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="backfill_failed",
+                translation_placeholders={"error": str(exception)},
+            ) from exception
+        return result if call.return_response else None
+
+    async def _async_profile(call: ServiceCall) -> None:
+        if async_get_active_profiler(hass) is not None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="profile_running"
+            )
+        cycles = call.data.get(ATTR_CYCLES)
+        # Counting cycles runs for as long as a profile may unless a duration is set
+        duration = call.data.get(ATTR_DURATION) or (
+            PROFILE_MAX_DURATION if cycles is not None else PROFILE_DEFAULT_DURATION
+        )
+        profiler = async_start_profile(hass, cycles, sample=call.data[ATTR_SAMPLE])
+        hass.async_create_background_task(
+            async_finish_profile(hass, profiler, duration), f"{DOMAIN} profile"
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_HISTORY,
+        _async_backfill_history,
+        schema=BACKFILL_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,142 @@
+"""Shared HTTP client pool for axscend."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .breaker import CircuitBreakers
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SESSION_CLOSE_DELAY,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT_PER_HOST,
+)
+from .profiler import create_trace_config
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+DATA_SESSION_POOL: HassKey[AxscendSessionPool] = HassKey(f"{DOMAIN}_session_pool")
+
+
+def create_client_session() -> aiohttp.ClientSession:
+    """Create a keep-alive client session tuned for the Axscend API."""
+    # Use ThreadedResolver to avoid aiodns compatibility issues with Python 3.13
+    connector = aiohttp.TCPConnector(
+        resolver=aiohttp.resolver.ThreadedResolver(),
+        use_dns_cache=True,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        limit_per_host=SESSION_LIMIT_PER_HOST,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        auto_decompress=True,
+        headers={"Accept-Encoding": "gzip, deflate"},
+        # Only time anything while the refresh pipeline is being profiled
+        trace_configs=[create_trace_config()],
+    )
+
+
+class AxscendSessionPool:
+    """
+    Reference-counted client session shared by all entries and the config flow.
+
+    The session is closed a short while after the last reference is released,
+    so reloading an entry reuses the warm connections instead of reconnecting.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._refs = 0
+        self._cancel_close: CALLBACK_TYPE | None = None
+        # Outlive the session so a reload does not forget an outage or quota
+        self.breakers = CircuitBreakers()
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        self._single_flights: dict[str, SingleFlight] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_shutdown)
+
+    @property
+    def refs(self) -> int:
+        """Return the number of active references."""
+        return self._refs
+
+    @callback
+    def async_get_rate_limiter(self, api_token: str) -> TokenBucket:
+        """Return the rate limiter shared by every client of an API token."""
+        if (limiter := self._rate_limiters.get(api_token)) is None:
+            limiter = self._rate_limiters[api_token] = TokenBucket()
+        return limiter
+
+    @callback
+    def async_get_single_flight(self, api_token: str) -> SingleFlight:
+        """Return the single-flight group shared by every client of an API token."""
+        if (single_flight := self._single_flights.get(api_token)) is None:
+            single_flight = self._single_flights[api_token] = SingleFlight()
+        return single_flight
+
+    @callback
+    def async_acquire(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it if needed."""
+        if self._cancel_close is not None:
+            self._cancel_close()
+            self._cancel_close = None
+        if self._session is None or self._session.closed:
+            self._session = create_client_session()
+        self._refs += 1
+        return self._session
+
+    @callback
+    def async_release(self) -> None:
+        """Release a reference and schedule closing once the pool is idle."""
+        self._refs = max(self._refs - 1, 0)
+        if self._refs or self._session is None or self._cancel_close is not None:
+            return
+        self._cancel_close = async_call_later(
+            self._hass, SESSION_CLOSE_DELAY, self._async_close_idle
+        )
+
+    async def _async_close_idle(self, _now: datetime) -> None:
+        """Close the session if nobody acquired it in the meantime."""
+        self._cancel_close = None
+        if not self._refs:
+            await self.async_close()
+
+    async def _async_shutdown(self, _event: Event) -> None:
+        """Close the session when Home Assistant stops."""
+        if self._cancel_close is not None:
+            self._cancel_close()
+            self._cancel_close = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the underlying session."""
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except aiohttp.ClientError:
+            LOGGER.exception("Error closing shared client session")
+
+
+@callback
+def async_get_session_pool(hass: HomeAssistant) -> AxscendSessionPool:
+    """Return the session pool for this Home Assistant instance."""
+    if (pool := hass.data.get(DATA_SESSION_POOL)) is None:
+        pool = hass.data[DATA_SESSION_POOL] = AxscendSessionPool(hass)
+    return pool
@@ -0,0 +1,70 @@
+"""Coalescing of identical concurrent requests for the axscend API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from .const import API_CACHE_TTL, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Share one in-flight request between every caller asking for the same thing.
+
+    The first caller starts the request as a task; callers arriving while it
+    runs await the same task, so a burst of refreshes costs one round trip.
+    Each caller is shielded: cancelling one does not cancel the request for
+    the others. Successful results are also served for a short TTL after they
+    arrive.
+    """
+
+    def __init__(self, ttl: float = API_CACHE_TTL) -> None:
+        """Initialize with nothing in flight."""
+        self.ttl = ttl
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    async def run(self, key: str, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of `request`, shared with concurrent callers of key."""
+        if (cached := self._cache.get(key)) is not None:
+            expires, result = cached
+            if time.monotonic() < expires:
+                self.cache_hits += 1
+                return result
+            del self._cache[key]
+        if (task := self._in_flight.get(key)) is None:
+            task = asyncio.ensure_future(request())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._done, key))
+        else:
+            self.coalesced += 1
+            LOGGER.debug("Joining the request in flight for %s", key)
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Forget a finished request, caching its result if it succeeded."""
+        del self._in_flight[key]
+        # Also marks the exception retrieved when every caller was cancelled
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.ttl > 0:
+            now = time.monotonic()
+            self._prune(now)
+            self._cache[key] = (now + self.ttl, task.result())
+
+    def clear(self) -> None:
+        """Forget every cached result, so the next requests go upstream."""
+        self._cache.clear()
+
+    def _prune(self, now: float) -> None:
+        """Drop the cached results whose TTL is over."""
+        for key in [key for key, (expires, _) in self._cache.items() if expires <= now]:
+            del self._cache[key]
@@ -0,0 +1,103 @@
+"""Last known snapshots of every asset, persisted across restarts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER, SNAPSHOT_SAVE_DELAY
+from .data import AssetSnapshot
+from .motion import MotionState
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+DATA_SNAPSHOT_STORE: HassKey[SnapshotStore] = HassKey(f"{DOMAIN}_snapshot_store")
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshots"
+
+
+class SnapshotStore:
+    """
+    Last good snapshot of every entry, in one file for all assets.
+
+    Setup seeds the entities from here so Home Assistant does not wait for the
+    API while it starts. The motion state is kept with the snapshot, so
+    odometers and trips carry on across restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored snapshots."""
+        self._entries = await self._store.async_load() or {}
+
+    @callback
+    def async_get(self, entry_id: str) -> tuple[AssetSnapshot, datetime] | None:
+        """Return the stored snapshot of an entry and when it was fetched."""
+        if (stored := self._entries.get(entry_id)) is None:
+            return None
+        try:
+            snapshot = AssetSnapshot.from_dict(stored["snapshot"])
+            fetched_at = dt_util.parse_datetime(stored["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("Ignoring unreadable stored snapshot of %s", entry_id)
+            return None
+        if fetched_at is None:
+            return None
+        return snapshot, fetched_at
+
+    @callback
+    def async_get_motion(self, entry_id: str) -> MotionState:
+        """Return the stored motion state of an entry, or a new one."""
+        if (stored := self._entries.get(entry_id, {}).get("motion")) is not None:
+            try:
+                return MotionState.from_dict(stored)
+            except (TypeError, ValueError):
+                LOGGER.debug("Ignoring unreadable motion state of %s", entry_id)
+        return MotionState()
+
+    @callback
+    def async_set(
+        self,
+        entry_id: str,
+        snapshot: AssetSnapshot | None,
+        motion: MotionState | None = None,
+    ) -> None:
+        """Remember a snapshot fresh from the API and the motion it led to."""
+        if snapshot is None or snapshot.stale:
+            return
+        self._entries[entry_id] = {
+            "snapshot": snapshot.as_dict(),
+            "fetched_at": dt_util.utcnow().isoformat(),
+        }
+        if motion is not None:
+            self._entries[entry_id]["motion"] = motion.as_dict()
+        self._store.async_delay_save(lambda: self._entries, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Forget the snapshot of a removed entry."""
+        if self._entries.pop(entry_id, None) is not None:
+            self._store.async_delay_save(lambda: self._entries, SNAPSHOT_SAVE_DELAY)
+
+
+@singleton(DATA_SNAPSHOT_STORE, async_=True)
+async def async_get_snapshot_store(hass: HomeAssistant) -> SnapshotStore:
+    """Return the snapshot store, loading it on first use."""
+    store = SnapshotStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,27 @@
+"""Fixtures for axscend tests."""
+
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fake_api import FakeAxscendApi
+
+pytest_plugins = ["pytest_homeassistant_custom_component"]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+    return enable_custom_integrations
+
+
+@pytest.fixture
+async def fake_api(socket_enabled: None) -> AsyncIterator[FakeAxscendApi]:
+    """Serve a fake Axscend API the client talks to."""
+    del socket_enabled
+    fake = FakeAxscendApi()
+    await fake.start()
+    with patch("custom_components.axscend.api.API_BASE_URL", fake.base_url):
+        yield fake
+    await fake.stop()
@@ -0,0 +1,41 @@
+"""Tests for the axscend API client."""
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.api import AxscendApiClient, AxscendApiClientError
+from custom_components.axscend.const import BACKFILL_PAGE_SIZE
+from custom_components.axscend.session import create_client_session
+
+
+@pytest.mark.usefixtures("fake_api")
+async def test_history_pages_not_cached() -> None:
+    """History pages are neither kept for revalidation nor shared."""
+    session = create_client_session()
+    client = AxscendApiClient("token", session)
+    end = dt_util.utcnow().replace(microsecond=0)
+    start = end - timedelta(minutes=3 * BACKFILL_PAGE_SIZE - 1)
+
+    pages = [page async for page in client.async_iter_history("1", start, end)]
+
+    assert len(pages) == 3
+    assert not client._response_cache  # noqa: SLF001
+    assert not client.single_flight._cache  # noqa: SLF001
+    await session.close()
+
+
+async def test_not_modified_without_cache(fake_api: FakeAxscendApi) -> None:
+    """A 304 with no cached response to serve is a clear client error."""
+    session = create_client_session()
+    client = AxscendApiClient("token", session)
+
+    with pytest.raises(AxscendApiClientError, match="no response is cached"):
+        await client._async_request(  # noqa: SLF001
+            "get",
+            f"{fake_api.base_url}/assets/1",
+            headers={"If-None-Match": f'"1-{fake_api.revision}"'},
+        )
+    await session.close()
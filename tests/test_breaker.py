@@ -0,0 +1,77 @@
+"""Tests for the circuit breaker of the axscend API client."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.api import (
+    AxscendApiClient,
+    AxscendApiClientCircuitOpenError,
+    AxscendApiClientCommunicationError,
+    AxscendApiClientNotFoundError,
+)
+from custom_components.axscend.breaker import CircuitBreaker, CircuitBreakers
+from custom_components.axscend.session import create_client_session
+
+HOST = "127.0.0.1"
+
+
+async def _open_breaker(
+    client: AxscendApiClient, breaker: CircuitBreaker, fake_api: FakeAxscendApi
+) -> None:
+    """Fail requests until the breaker opens, then let its timeout pass."""
+    fake_api.error_status = 503
+    with patch("custom_components.axscend.api.asyncio.sleep"):
+        while not breaker.is_open:
+            with pytest.raises(AxscendApiClientCommunicationError):
+                await client.async_get_asset("1")
+    breaker._open_for = 0  # noqa: SLF001
+    fake_api.error_status = None
+
+
+async def test_refused_probe_closes(fake_api: FakeAxscendApi) -> None:
+    """A probe the host answers with an error closes the breaker."""
+    session = create_client_session()
+    breakers = CircuitBreakers()
+    client = AxscendApiClient("token", session, breakers)
+    breaker = breakers.get(HOST)
+    await _open_breaker(client, breaker, fake_api)
+
+    fake_api.error_status = 404
+    with pytest.raises(AxscendApiClientNotFoundError):
+        await client.async_get_asset("1")
+    assert not breaker.is_open
+
+    fake_api.error_status = None
+    assert (await client.async_get_asset("1"))["asset"]["id"] == "1"
+    await session.close()
+
+
+async def test_cancelled_probe(fake_api: FakeAxscendApi) -> None:
+    """A probe cancelled before an answer lets the next request probe."""
+    session = create_client_session()
+    breakers = CircuitBreakers()
+    client = AxscendApiClient("token", session, breakers)
+    breaker = breakers.get(HOST)
+    await _open_breaker(client, breaker, fake_api)
+
+    fake_api.latency = 1
+    # Past the single-flight group, which shields requests from cancellation
+    probe = asyncio.create_task(
+        client._async_request_with_retries(  # noqa: SLF001
+            "get", f"{fake_api.base_url}/assets/1"
+        )
+    )
+    await asyncio.sleep(0.1)
+    with pytest.raises(AxscendApiClientCircuitOpenError):
+        await client.async_get_asset("2")
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    fake_api.latency = 0
+    assert (await client.async_get_asset("2"))["asset"]["id"] == "2"
+    assert not breaker.is_open
+    await session.close()
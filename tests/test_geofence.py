@@ -0,0 +1,53 @@
+"""Tests for the geofence of axscend."""
+
+from unittest.mock import patch
+
+from homeassistant.core import Event, HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks import fake_api as fake_api_module
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.const import CONF_ASSET_ID, DOMAIN
+from custom_components.axscend.geofence import EVENT_ZONE_ENTER, EVENT_ZONE_EXIT
+
+
+async def test_no_events_on_setup(
+    hass: HomeAssistant, fake_api: FakeAxscendApi
+) -> None:
+    """Setting up or reloading does not announce the zones the asset is in."""
+    # The fake asset reports the position of the home zone
+    await hass.config.async_update(latitude=51.5007, longitude=-0.1246, radius=100)
+    events: list[tuple[str, str]] = []
+
+    def _record(event: Event) -> None:
+        events.append((event.event_type, event.data["zone"]))
+
+    hass.bus.async_listen(EVENT_ZONE_ENTER, _record)
+    hass.bus.async_listen(EVENT_ZONE_EXIT, _record)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"api_token": "token", CONF_ASSET_ID: "1"}, unique_id="1"
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert events == []
+    assert entry.runtime_data.coordinator.presence.active_zone == "zone.home"
+
+    make_asset = fake_api_module.make_asset
+
+    def _away(asset_id: str) -> dict:
+        asset = make_asset(asset_id)
+        asset["asset"]["gps_latitude"] = "51.6"
+        return asset
+
+    fake_api.revision += 1
+    entry.runtime_data.client.single_flight.clear()
+    with patch.object(fake_api_module, "make_asset", _away):
+        await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert events == [(EVENT_ZONE_EXIT, "zone.home")]
+    assert await hass.config_entries.async_unload(entry.entry_id)
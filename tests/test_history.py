@@ -0,0 +1,70 @@
+"""Tests for the track history of axscend."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.axscend.data import AssetSnapshot
+from custom_components.axscend.history import TrackBuffer, TrackHistory, TrackPoint
+
+
+def _point(timestamp: float, latitude: float) -> TrackPoint:
+    """Return a point on a meridian."""
+    return TrackPoint(dt_util.utc_from_timestamp(timestamp), latitude, 0.0, None)
+
+
+def test_merge_splices_points() -> None:
+    """Merged points land in time order, skipping moments already tracked."""
+    buffer = TrackBuffer(timedelta(days=7))
+    now = dt_util.utcnow().timestamp()
+    assert buffer.merge([_point(now + t, t) for t in (0, 20, 40)]) == 3
+
+    added = buffer.merge(
+        [_point(now + 30, 30), _point(now - 10, -10), _point(now + 20, 99)]
+    )
+
+    assert added == 2
+    assert list(buffer.timestamps) == [now + t for t in (-10, 0, 20, 30, 40)]
+    assert list(buffer.latitudes) == [-10, 0, 20, 30, 40]
+    assert buffer.merge([_point(now + 50, 50), _point(now + 60, 60)]) == 2
+    assert buffer.last_timestamp == now + 60
+
+
+async def test_add_points(hass: HomeAssistant) -> None:
+    """Points outside the retention are left out, and a full track compacted."""
+    history = TrackHistory(hass, "entry", timedelta(days=1))
+    history.buffer.capacity = 100
+    now = dt_util.utcnow().timestamp()
+
+    added = await history.async_add_points(
+        [_point(now - 2 * 86400, 0.0)]
+        + [_point(now - 3600 + index, index * 0.01) for index in range(300)]
+    )
+
+    assert added == 300
+    assert len(history.buffer) <= 100
+    assert history.buffer.first_timestamp >= now - 86400
+    assert history.buffer.last_timestamp == now - 3600 + 299
+
+
+async def test_full_track_compacted_off_loop(hass: HomeAssistant) -> None:
+    """A fix filling the track leaves simplifying it to a background task."""
+    history = TrackHistory(hass, "entry", timedelta(days=1))
+    history.buffer.capacity = 100
+    now = dt_util.utcnow()
+
+    for index in range(101):
+        history.async_add_snapshot(
+            AssetSnapshot(
+                asset_id="asset",
+                latitude=index * 0.01,
+                longitude=(index % 2) * 0.01,
+                last_position=now + timedelta(seconds=index),
+            )
+        )
+
+    assert len(history.buffer) == 101
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(history.buffer) <= 100
+    assert history.buffer.last_timestamp == (now + timedelta(seconds=100)).timestamp()
@@ -0,0 +1,35 @@
+"""Tests for the motion state of axscend assets."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.axscend.data import AssetSnapshot
+from custom_components.axscend.motion import MotionState
+
+
+def _snapshot(latitude: float, fixed_at: datetime) -> AssetSnapshot:
+    """Return a snapshot of a fix on the prime meridian."""
+    return AssetSnapshot(
+        asset_id="1", latitude=latitude, longitude=0.0, last_position=fixed_at
+    )
+
+
+def test_speed_after_jitter() -> None:
+    """Speed spans the time since the counted position, not the latest fix."""
+    motion = MotionState()
+    start = dt_util.utcnow()
+    motion.update(_snapshot(51.0, start), start)
+    for minute in range(1, 11):
+        fixed_at = start + timedelta(minutes=minute)
+        motion.update(_snapshot(51.0 + minute % 2 * 0.0001, fixed_at), fixed_at)
+    assert motion.odometer == 0
+
+    # About 1112 m north, 11 minutes after the counted position
+    fixed_at = start + timedelta(minutes=11)
+    assert motion.update(_snapshot(51.01, fixed_at), fixed_at)
+
+    assert 1100 < motion.odometer < 1120
+    assert 5.5 < motion.speed < 6.5
+    assert motion.counted_at == fixed_at
+    assert MotionState.from_dict(motion.as_dict()) == motion
@@ -0,0 +1,57 @@
+"""Tests for the nearest place lookup of axscend."""
+
+import struct
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.const import CONF_ASSET_ID, CONF_PLACES_FILE, DOMAIN
+from custom_components.axscend.places import DATA_PLACES, load_place_index
+
+
+async def test_index_closed_on_unload(
+    hass: HomeAssistant, fake_api: FakeAxscendApi
+) -> None:
+    """The mapping of a places index is closed when the entry unloads."""
+    del fake_api
+    await hass.async_add_executor_job(
+        Path(hass.config.path("places.csv")).write_text,
+        "Westminster,51.4995,-0.1248\n",
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"api_token": "token", CONF_ASSET_ID: "1"},
+        options={CONF_PLACES_FILE: "places.csv"},
+        unique_id="1",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    (index,) = hass.data[DATA_PLACES].values()
+    assert index.nearest(51.5, -0.125).name == "Westminster"
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert index._mmap.closed  # noqa: SLF001
+    (reloaded,) = hass.data[DATA_PLACES].values()
+    assert reloaded is not index
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert reloaded._mmap.closed  # noqa: SLF001
+    assert not hass.data[DATA_PLACES]
+
+
+def test_index_of_older_version_rebuilt(tmp_path: Path) -> None:
+    """An index of an older format is rebuilt from its CSV, columns aligned."""
+    csv_path = tmp_path / "places.csv"
+    csv_path.write_text("Westminster,51.4995,-0.1248\n")
+    csv_path.with_suffix(".idx").write_bytes(struct.pack("<4sIId", b"AXPL", 1, 0, 0.1))
+
+    index = load_place_index(csv_path, None)
+
+    assert index.nearest(51.5, -0.125).name == "Westminster"
+    index.close()
+    header = csv_path.with_suffix(".idx").read_bytes()[:8]
+    assert struct.unpack("<4sI", header) == (b"AXPL", 2)
@@ -0,0 +1,48 @@
+"""Tests for the refresh profiler of axscend."""
+
+import time
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.const import CONF_ASSET_ID, DOMAIN
+from custom_components.axscend.data import AssetSnapshot
+from custom_components.axscend.profiler import StackSampler
+
+
+def _busy(seconds: float) -> None:
+    """Keep the thread busy, as slow code on the event loop would."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def test_sampler_counts_refreshes(
+    hass: HomeAssistant, fake_api: FakeAxscendApi
+) -> None:
+    """Only stacks of the loop thread within a refresh are counted."""
+    del fake_api
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"api_token": "token", CONF_ASSET_ID: "1"}, unique_id="1"
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    from_api = AssetSnapshot.from_api
+
+    def _slow_from_api(*args: object) -> AssetSnapshot:
+        _busy(0.05)
+        return from_api(*args)
+
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    _busy(0.05)
+    with patch.object(AssetSnapshot, "from_api", _slow_from_api):
+        await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_add_executor_job(sampler.stop)
+
+    assert any("_slow_from_api" in stack for stack in sampler.stacks)
+    assert all("._async_refresh" in stack for stack in sampler.stacks)
+    assert await hass.config_entries.async_unload(entry.entry_id)
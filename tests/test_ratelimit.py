@@ -0,0 +1,15 @@
+"""Tests for the rate limiter of the axscend API client."""
+
+import asyncio
+
+from custom_components.axscend.ratelimit import TokenBucket
+
+
+async def test_defer_holds_waiting_requests() -> None:
+    """A request already waiting for a token also waits out a deferral."""
+    bucket = TokenBucket(rate=10, burst=1)
+    await bucket.acquire()
+    waiting = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.05)
+    bucket.defer(0.3)
+    assert await waiting >= 0.3
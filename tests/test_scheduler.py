@@ -0,0 +1,64 @@
+"""Tests for the poll scheduler of axscend."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from benchmarks.fake_api import FakeAxscendApi
+from custom_components.axscend.const import CONF_ASSET_ID, DOMAIN
+from custom_components.axscend.scheduler import poll_phase
+
+
+async def test_refresh_at_phase(hass: HomeAssistant, fake_api: FakeAxscendApi) -> None:
+    """The next refresh of a coordinator is scheduled at its asset's phase."""
+    del fake_api
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"api_token": "token", CONF_ASSET_ID: "1"}, unique_id="1"
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    interval = coordinator.update_interval.total_seconds()
+    now = hass.loop.time()
+
+    when = coordinator._unsub_refresh.__self__.when()  # noqa: SLF001
+
+    assert interval / 2 <= when - now <= interval * 1.5
+    offset = (when - poll_phase("1") * interval) % interval
+    assert min(offset, interval - offset) < 1e-3
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_refresh_in_background_task(
+    hass: HomeAssistant, fake_api: FakeAxscendApi
+) -> None:
+    """A scheduled refresh runs as a background task of the entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"api_token": "token", CONF_ASSET_ID: "1"}, unique_id="1"
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    entry.runtime_data.client.single_flight.clear()
+    requests = fake_api.requests
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + coordinator.update_interval * 1.5 + timedelta(seconds=1),
+    )
+
+    assert f"{coordinator.name} - {entry.title} - refresh" in {
+        task.get_name()
+        for task in entry._background_tasks  # noqa: SLF001
+    }
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert fake_api.requests > requests
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
+    assert await hass.config_entries.async_unload(entry.entry_id)